@@ -0,0 +1,139 @@
+"""Reference solver for Two-Sum Warmup.
+
+Two engines find the pair ``i < j`` with ``a_i + a_j = T``:
+
+* ``hash``: one pass with a value -> index dictionary; each value looks up its
+  complement among the values already seen. ``O(N)`` expected.
+* ``sorted``: sort the values once, then find every complement at the same
+  time with a vectorized binary search. ``O(N log N)`` but free of per-element
+  Python work, so it is the faster engine on large inputs. Without NumPy it
+  falls back to a classic two-pointer scan over the sorted indices.
+
+``--method auto`` (the default) picks ``sorted`` for inputs large enough to
+load NumPy and ``hash`` otherwise. ``--bin FILE`` reads a binary sidecar
+written by the evaluator (little-endian int64 ``N``, ``T``, then the ``N``
+values) through a memory map instead of parsing stdin.
+"""
+
+from __future__ import annotations
+
+import argparse
+import mmap
+import struct
+import sys
+from array import array
+from typing import Dict, List, Optional, Sequence, Tuple
+
+HEADER = struct.Struct("<qq")
+NO_PAIR = (-1, -1)
+NUMPY_MIN_BYTES = 1 << 16
+
+# NumPy is optional and costs more to import than a small instance takes to
+# solve, so it is loaded only for large inputs or when an engine needs it.
+np = None
+_numpy_missing = False
+
+
+def _load_numpy():
+    """Import NumPy into ``np`` on first use; None when it is not installed."""
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def find_pair_hash(values: Sequence[int], target: int) -> Tuple[int, int]:
+    """First pair ``(i, j)``, ``i < j``, summing to ``target``, by complement lookup."""
+    seen: Dict[int, int] = {}
+    for j, value in enumerate(values):
+        i = seen.get(target - value)
+        if i is not None:
+            return i, j
+        seen.setdefault(value, j)
+    return NO_PAIR
+
+
+def _two_pointer(values: Sequence[int], target: int) -> Tuple[int, int]:
+    order = sorted(range(len(values)), key=values.__getitem__)
+    lo, hi = 0, len(order) - 1
+    while lo < hi:
+        total = values[order[lo]] + values[order[hi]]
+        if total == target:
+            return min(order[lo], order[hi]), max(order[lo], order[hi])
+        if total < target:
+            lo += 1
+        else:
+            hi -= 1
+    return NO_PAIR
+
+
+def find_pair_sorted(values: Sequence[int], target: int) -> Tuple[int, int]:
+    """A pair ``(i, j)``, ``i < j``, summing to ``target``, found on the sorted values."""
+    if _load_numpy() is None:
+        return _two_pointer(values, target)
+    array_values = np.asarray(values, dtype=np.int64)
+    order = np.argsort(array_values, kind="stable")
+    ordered = array_values[order]
+    complements = target - ordered
+    left = np.searchsorted(ordered, complements, side="left")
+    right = np.searchsorted(ordered, complements, side="right")
+    # A value that is its own complement needs a second copy of itself.
+    matches = right - left - (complements == ordered)
+    hits = np.flatnonzero(matches > 0)
+    if not len(hits):
+        return NO_PAIR
+    k = int(hits[0])
+    partner = int(left[k]) if int(left[k]) != k else int(left[k]) + 1
+    i, j = int(order[k]), int(order[partner])
+    return min(i, j), max(i, j)
+
+
+ENGINES = {"hash": find_pair_hash, "sorted": find_pair_sorted}
+
+
+def read_stdin() -> Tuple[Sequence[int], int]:
+    data = sys.stdin.buffer.read()
+    if len(data) >= NUMPY_MIN_BYTES and _load_numpy() is not None:
+        tokens = np.fromstring(data, dtype=np.int64, sep=" ")
+        n = int(tokens[0])
+        return tokens[1 : n + 1], int(tokens[n + 1])
+    numbers: List[int] = list(map(int, data.split()))
+    n = numbers[0]
+    return numbers[1 : n + 1], numbers[n + 1]
+
+
+def read_sidecar(path: str) -> Tuple[Sequence[int], int]:
+    with open(path, "rb") as handle:
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    n, target = HEADER.unpack_from(mapped)
+    if _load_numpy() is not None:
+        # A view on the mapping: pages are read on demand and nothing is copied.
+        return np.frombuffer(mapped, dtype="<i8", count=n, offset=HEADER.size), target
+    values = array("q")
+    values.frombytes(mapped[HEADER.size : HEADER.size + n * 8])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values, target
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Solve Two-Sum Warmup")
+    parser.add_argument("--method", choices=("auto", *ENGINES), default="auto")
+    parser.add_argument("--bin", help="Read a binary sidecar instead of stdin")
+    args = parser.parse_args(argv)
+
+    values, target = read_sidecar(args.bin) if args.bin else read_stdin()
+    method = args.method if args.method != "auto" else ("sorted" if np is not None else "hash")
+    if method == "hash" and np is not None and isinstance(values, np.ndarray):
+        values = values.tolist()
+    i, j = ENGINES[method](values, target)
+    sys.stdout.write(f"{i} {j}\n")
+
+
+if __name__ == "__main__":
+    main()
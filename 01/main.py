@@ -1,32 +1,149 @@
+"""Sneaky Islanders solver built on one counting pass per statement vector.
+
+Islander ``i`` claims ``N_i`` truth-tellers. A count ``T`` is consistent exactly
+when ``T`` islanders claim ``T``, so a histogram of the claims yields every
+consistent ``T`` in ``O(n + range)``, and the truthful islanders are those
+claiming the chosen ``T``. The smallest consistent ``T`` is reported.
+
+Every non-empty stdin line is one statement vector; its length is the number of
+islanders. Lines are answered in order. With NumPy installed, large blocks of
+lines are grouped by length and solved with a single ``bincount`` per group. A packed
+``(vectors, islanders)`` integer array can be given with ``--npy FILE``.
+"""
+
 from __future__ import annotations
 
+import argparse
+import itertools
 import sys
-from typing import List
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+BLOCK_LINES = 65536
+NUMPY_MIN_LINES = 1024
+
+# NumPy is optional and costs more to import than a few vectors take to solve,
+# so it is loaded only once a block is large enough to repay it.
+np = None
+_numpy_missing = False
+
+
+def _load_numpy():
+    """Import NumPy into ``np`` on first use; None when it is not installed."""
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
 
 
-def solve(statements: List[int]) -> List[int]:
-    candidates: List[List[int]] = []
-    for t in range(11):
-        truthful = [i for i, val in enumerate(statements) if val == t]
-        if len(truthful) == t:
-            candidates.append(truthful)
-    if not candidates:
+def consistent_counts(statements: Sequence[int]) -> List[int]:
+    """Every truth count ``T`` that matches the number of islanders claiming it."""
+    n = len(statements)
+    histogram = [0] * (n + 1)
+    for claim in statements:
+        if 0 <= claim <= n:
+            histogram[claim] += 1
+    return [t for t, count in enumerate(histogram) if count == t]
+
+
+def solve(statements: Sequence[int]) -> List[int]:
+    """Indices of the truthful islanders for the smallest consistent count, or [] if none."""
+    counts = consistent_counts(statements)
+    if not counts:
         return []
-    candidates.sort(key=lambda arr: (len(arr), arr))
-    return candidates[0]
-
-
-def main() -> None:
-    tokens = sys.stdin.read().strip().split()
-    if len(tokens) != 10:
-        raise SystemExit("Expected 10 integers")
-    statements = [int(tok) for tok in tokens]
-    truthful = solve(statements)
-    print(len(truthful))
-    if truthful:
-        print(" ".join(str(i) for i in truthful))
+    return [index for index, claim in enumerate(statements) if claim == counts[0]]
+
+
+def solve_batch(statements: "np.ndarray") -> Tuple["np.ndarray", "np.ndarray"]:
+    """Solve an ``(m, n)`` array of statement vectors at once.
+
+    Returns the chosen count per vector (-1 when none is consistent) and an
+    ``(m, n)`` boolean mask of the truthful islanders. Requires NumPy.
+    """
+    _load_numpy()
+    m, n = statements.shape
+    width = n + 1
+    in_range = (statements >= 0) & (statements <= n)
+    # Offset each row's claims into its own bins so one bincount builds every histogram.
+    bins = statements + (np.arange(m, dtype=np.int64) * width)[:, None]
+    histogram = np.bincount(bins[in_range], minlength=m * width).reshape(m, width)
+    consistent = histogram == np.arange(width)
+    chosen = np.where(consistent.any(axis=1), consistent.argmax(axis=1), -1)
+    # Without a consistent count nobody is truthful, even islanders claiming -1.
+    return chosen, (statements == chosen[:, None]) & (chosen >= 0)[:, None]
+
+
+def _format(count: int, indices: Iterable[int]) -> str:
+    return f"{count}\n{' '.join(map(str, indices))}\n"
+
+
+def _format_batch(chosen: "np.ndarray", mask: "np.ndarray") -> List[str]:
+    """``_format`` for every row of a ``solve_batch`` result."""
+    # One nonzero over the whole mask, cut per row, instead of a lookup per row.
+    columns = np.nonzero(mask)[1].tolist()
+    ends = np.cumsum(mask.sum(axis=1)).tolist()
+    answers = []
+    start = 0
+    for count, end in zip(chosen.tolist(), ends):
+        answers.append(_format(max(count, 0), columns[start:end]))
+        start = end
+    return answers
+
+
+def _answer_block(lines: List[bytes]) -> Iterator[str]:
+    vectors = [line.split() for line in lines]
+    if len(lines) < NUMPY_MIN_LINES or _load_numpy() is None:
+        for tokens in vectors:
+            truthful = solve([int(token) for token in tokens])
+            yield _format(len(truthful), truthful)
+        return
+    answers: List[str] = [""] * len(vectors)
+    groups: Dict[int, List[int]] = {}
+    for position, tokens in enumerate(vectors):
+        groups.setdefault(len(tokens), []).append(position)
+    for n, positions in groups.items():
+        joined = b" ".join(lines[position] for position in positions)
+        packed = np.fromstring(joined, dtype=np.int64, sep=" ").reshape(len(positions), n)
+        for position, answer in zip(positions, _format_batch(*solve_batch(packed))):
+            answers[position] = answer
+    yield from answers
+
+
+def answer_lines(stream: Iterable[bytes]) -> Iterator[str]:
+    """Answers for each non-empty line of ``stream``, in order, one block at a time."""
+    lines = (line for line in stream if line.strip())
+    while True:
+        block = list(itertools.islice(lines, BLOCK_LINES))
+        if not block:
+            return
+        yield from _answer_block(block)
+
+
+def answer_array(statements: "np.ndarray") -> Iterator[str]:
+    """Answers for each row of an ``(m, n)`` array, solved in blocks of ``BLOCK_LINES``."""
+    statements = statements.astype(np.int64, copy=False)
+    for start in range(0, len(statements), BLOCK_LINES):
+        yield from _format_batch(*solve_batch(statements[start : start + BLOCK_LINES]))
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Solve Sneaky Islanders statement vectors")
+    parser.add_argument("--npy", help="Read an (m, n) integer array saved with numpy.save instead of stdin")
+    args = parser.parse_args(argv)
+
+    if args.npy:
+        if _load_numpy() is None:
+            raise SystemExit("--npy requires NumPy")
+        answers = answer_array(np.load(args.npy))
     else:
-        print()
+        answers = answer_lines(sys.stdin.buffer)
+    write = sys.stdout.write
+    for answer in answers:
+        write(answer)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,68 @@
+"""Benchmark the quadrant engine against ``multiply_naive`` from evaluate.py.
+
+Times both on random ``2^d x 2^d`` matrices with entries in ``[-10^4, 10^4]``
+for every ``d`` up to ``--max-d``. The naive triple loop is skipped above
+``--naive-max-d`` (it needs minutes at d = 10); there the engine's result is
+checked with evaluate's ``check_product`` instead of compared to the naive one.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List, Optional, TypeVar
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from evaluate import check_product, generate_matrix, multiply_naive  # noqa: E402
+from quadrant import DEFAULT_CUTOFF, multiply  # noqa: E402
+
+T = TypeVar("T")
+
+
+def _timed(fn: Callable[[], T], repeat: int) -> tuple[T, float]:
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return result, best  # type: ignore[return-value]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare the 02 quadrant engine with multiply_naive")
+    parser.add_argument("--max-d", type=int, default=10)
+    parser.add_argument("--naive-max-d", type=int, default=8, help="Largest d to run multiply_naive on")
+    parser.add_argument("--cutoffs", type=int, nargs="+", default=[DEFAULT_CUTOFF], help="Leaf sizes to try")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes for the top-level quadrants")
+    parser.add_argument("--repeat", type=int, default=1, help="Runs per timing; the best is reported")
+    args = parser.parse_args(argv)
+
+    labels = [f"cutoff={cutoff}" for cutoff in args.cutoffs]
+    print(f"{'d':>3} {'n':>5} {'naive':>10} " + " ".join(f"{label:>12}" for label in labels) + "  ok")
+    failures = 0
+    for d in range(args.max_d + 1):
+        n = 2**d
+        a = generate_matrix(n, 2 * d, bound=10_000)
+        b = generate_matrix(n, 2 * d + 1, bound=10_000)
+        expected = None
+        naive_time = "-"
+        if d <= args.naive_max_d:
+            expected, elapsed = _timed(lambda: multiply_naive(a, b), args.repeat)
+            naive_time = f"{elapsed:.4f}s"
+        cells = []
+        ok = True
+        for cutoff in args.cutoffs:
+            product, elapsed = _timed(lambda: multiply(a, b, cutoff=cutoff, jobs=args.jobs), args.repeat)
+            ok &= product == expected if expected is not None else check_product(a, b, product)
+            cells.append(f"{elapsed:.4f}s")
+        failures += not ok
+        print(f"{d:>3} {n:>5} {naive_time:>10} " + " ".join(f"{cell:>12}" for cell in cells) + f"  {'yes' if ok else 'NO'}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
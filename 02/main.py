@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+import sys
+from typing import List
+
+from quadrant import multiply
+
+
+def read_matrix(n: int, it) -> List[List[int]]:
+    return [[int(next(it)) for _ in range(n)] for _ in range(n)]
+
+
+def main() -> None:
+    tokens = sys.stdin.buffer.read().split()
+    if not tokens:
+        raise SystemExit("Empty input")
+    it = iter(tokens)
+    n = 2 ** int(next(it))
+    a = read_matrix(n, it)
+    b = read_matrix(n, it)
+    product = multiply(a, b)
+    sys.stdout.write("\n".join(" ".join(map(str, row)) for row in product) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,203 @@
+"""Recursive quadrant multiplication on views of flat, row-major buffers.
+
+The recursion follows the identities in PROBLEM.md, but no quadrant is ever
+copied: a block is just ``(buffer, row, col)`` into the ``n x n`` matrix the
+buffer stores, and each product is accumulated straight into its block of C::
+
+    C11 += A11·B11;  C11 += A12·B21;  C12 += A11·B12;  ...
+
+Below ``cutoff`` the recursion hands the block to a kernel: a NumPy matmul on
+views of the buffer when NumPy is installed, otherwise an i-k-j loop over the
+flat buffer. With ``jobs > 1`` and large enough matrices, the C quadrants of
+the top ``parallel_depth`` levels are computed by a process pool that maps the
+three buffers from shared memory, so no matrix is pickled.
+
+The buffers hold int64, so every sum in C must fit: ``multiply`` checks
+``n * max|a| * max|b| <= 2**63 - 1`` first and, when that bound fails, runs
+the same recursion in-process over plain lists of Python integers instead.
+"""
+
+from __future__ import annotations
+
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import shared_memory
+from typing import List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the pure-Python kernel is used instead
+    np = None  # type: ignore[assignment]
+
+ITEM_SIZE = 8
+INT64_MAX = 2**63 - 1
+DEFAULT_CUTOFF = 64 if np is not None else 16
+PARALLEL_MIN_SIZE = 256
+
+Matrix = List[List[int]]
+
+
+@dataclass
+class Grid:
+    """An ``n x n`` matrix stored row-major in a flat buffer.
+
+    The buffer is int64 bytes, or a list of Python integers for products that
+    may overflow int64; a list gets neither the NumPy view nor the int64 cast.
+    """
+
+    buffer: object
+    n: int
+
+    def __post_init__(self) -> None:
+        if isinstance(self.buffer, list):
+            self.view = None
+            self.flat = self.buffer
+            return
+        # The 2-D NumPy view shares memory with ``buffer``; slicing it never copies.
+        self.view = np.ndarray((self.n, self.n), dtype=np.int64, buffer=self.buffer) if np is not None else None
+        self.flat = memoryview(self.buffer).cast("B").cast("q")
+
+    def release(self) -> None:
+        """Drop the views so the underlying buffer can be closed."""
+        self.view = None
+        if isinstance(self.flat, memoryview):
+            self.flat.release()
+
+
+Block = Tuple[Grid, int, int]
+
+
+def _kernel(a: Block, b: Block, c: Block, size: int) -> None:
+    """``C_block += A_block · B_block`` for one leaf."""
+    (ga, ar, ac), (gb, br, bc), (gc, cr, cc) = a, b, c
+    if gc.view is not None:
+        gc.view[cr:cr + size, cc:cc + size] += ga.view[ar:ar + size, ac:ac + size] @ gb.view[br:br + size, bc:bc + size]
+        return
+    fa, fb, fc = ga.flat, gb.flat, gc.flat
+    for i in range(size):
+        a_row = (ar + i) * ga.n + ac
+        c_row = (cr + i) * gc.n + cc
+        for k in range(size):
+            aik = fa[a_row + k]
+            if aik:
+                b_row = (br + k) * gb.n + bc
+                for j in range(size):
+                    fc[c_row + j] += aik * fb[b_row + j]
+
+
+def multiply_add(a: Block, b: Block, c: Block, size: int, cutoff: int = DEFAULT_CUTOFF) -> None:
+    """``C_block += A_block · B_block`` by quadrant recursion down to ``cutoff``."""
+    if size <= max(1, cutoff):
+        _kernel(a, b, c, size)
+        return
+    half = size // 2
+    (ga, ar, ac), (gb, br, bc), (gc, cr, cc) = a, b, c
+    for i in (0, half):
+        for j in (0, half):
+            for k in (0, half):
+                multiply_add((ga, ar + i, ac + k), (gb, br + k, bc + j), (gc, cr + i, cc + j), half, cutoff)
+
+
+def _quadrant_task(names: Tuple[str, str, str], n: int, row: int, col: int, size: int, cutoff: int) -> None:
+    """Worker side: attach to the shared buffers and compute one block row x column of C."""
+    memories = [shared_memory.SharedMemory(name=name) for name in names]
+    ga, gb, gc = (Grid(memory.buf, n) for memory in memories)
+    try:
+        for k in range(0, n, size):
+            multiply_add((ga, row, k), (gb, k, col), (gc, row, col), size, cutoff)
+    finally:
+        for grid in (ga, gb, gc):
+            grid.release()
+        for memory in memories:
+            memory.close()
+
+
+def _fill(grid: Grid, rows: Sequence[Sequence[int]]) -> None:
+    n = grid.n
+    if grid.view is not None:
+        grid.view[:, :] = np.asarray(rows, dtype=np.int64)
+        return
+    for index, row in enumerate(rows):
+        grid.flat[index * n:(index + 1) * n] = row if isinstance(grid.flat, list) else array("q", row)
+
+
+def _rows(grid: Grid) -> Matrix:
+    if grid.view is not None:
+        return grid.view.tolist()
+    n = grid.n
+    if isinstance(grid.flat, list):
+        return [grid.flat[index * n:(index + 1) * n] for index in range(n)]
+    return [grid.flat[index * n:(index + 1) * n].tolist() for index in range(n)]
+
+
+def fits_int64(a: Sequence[Sequence[int]], b: Sequence[Sequence[int]]) -> bool:
+    """True when no entry or partial sum of ``a · b`` can leave the int64 range."""
+    top_a = max((abs(value) for row in a for value in row), default=0)
+    top_b = max((abs(value) for row in b for value in row), default=0)
+    return len(a) * top_a * top_b <= INT64_MAX and max(top_a, top_b) <= INT64_MAX
+
+
+def multiply(
+    a: Sequence[Sequence[int]],
+    b: Sequence[Sequence[int]],
+    cutoff: int = DEFAULT_CUTOFF,
+    jobs: int = 1,
+    parallel_depth: int = 1,
+    parallel_min_size: int = PARALLEL_MIN_SIZE,
+) -> Matrix:
+    """Multiply two ``2^d x 2^d`` matrices by quadrant recursion.
+
+    Args:
+        a: Left operand, ``n`` rows of ``n`` integers, ``n`` a power of two.
+        b: Right operand of the same shape.
+        cutoff: Block size at which recursion stops and the kernel takes over.
+        jobs: Worker processes for the top levels; 1 keeps everything in-process.
+        parallel_depth: Levels split across the pool (``4 ** depth`` C blocks).
+        parallel_min_size: Smaller matrices never use the pool.
+
+    Returns:
+        The product as a list of rows. Products that could overflow int64 are
+        computed exactly with Python integers, in-process and without NumPy.
+    """
+    n = len(a)
+    if n == 0 or n & (n - 1) or len(b) != n:
+        raise ValueError("a and b must be square with a power-of-two size")
+    if not fits_int64(a, b):
+        ga, gb, gc = (Grid([0] * (n * n), n) for _ in range(3))
+        _fill(ga, a)
+        _fill(gb, b)
+        multiply_add((ga, 0, 0), (gb, 0, 0), (gc, 0, 0), n, cutoff)
+        return _rows(gc)
+    parallel = jobs > 1 and n >= parallel_min_size and parallel_depth > 0
+    if not parallel:
+        ga, gb, gc = (Grid(bytearray(n * n * ITEM_SIZE), n) for _ in range(3))
+        _fill(ga, a)
+        _fill(gb, b)
+        multiply_add((ga, 0, 0), (gb, 0, 0), (gc, 0, 0), n, cutoff)
+        return _rows(gc)
+
+    # Fresh shared memory is zero-filled, which is the starting value of C.
+    memories = [shared_memory.SharedMemory(create=True, size=n * n * ITEM_SIZE) for _ in range(3)]
+    grids: Optional[List[Grid]] = None
+    try:
+        grids = [Grid(memory.buf, n) for memory in memories]
+        _fill(grids[0], a)
+        _fill(grids[1], b)
+        size = max(1, n >> parallel_depth)
+        names = tuple(memory.name for memory in memories)
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            futures = [
+                pool.submit(_quadrant_task, names, n, row, col, size, cutoff)  # type: ignore[arg-type]
+                for row in range(0, n, size)
+                for col in range(0, n, size)
+            ]
+            for future in futures:
+                future.result()
+        return _rows(grids[2])
+    finally:
+        for grid in grids or []:
+            grid.release()
+        for memory in memories:
+            memory.close()
+            memory.unlink()
@@ -0,0 +1,83 @@
+"""Reference solver for Divisible Subarray.
+
+Prints ``YES`` followed by a witness ``l r`` (1-based, inclusive) such that
+``a_l + … + a_r`` is divisible by ``N``. Among the ``N + 1`` prefix sums
+``P_0 … P_N`` two must share a residue mod ``N``; the first repeat ``P_r`` and
+the earlier ``P_{l-1}`` with the same residue give the witness.
+
+For large inputs with NumPy installed, stdin is parsed in one call and the
+prefix residues, first-seen table and first repeat are computed with array
+operations; otherwise the same steps run as plain loops over a list table.
+"""
+
+from __future__ import annotations
+
+import sys
+from typing import List, Tuple
+
+NUMPY_MIN_BYTES = 1 << 16
+
+# NumPy is optional and costs more to import than a small array takes to solve,
+# so it is loaded only for large inputs.
+np = None
+_numpy_missing = False
+
+
+def _load_numpy():
+    """Import NumPy into ``np`` on first use; None when it is not installed."""
+    global np, _numpy_missing
+    if np is None and not _numpy_missing:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            _numpy_missing = True
+        else:
+            np = numpy
+    return np
+
+
+def find_witness(values: List[int], n: int) -> Tuple[int, int]:
+    """First ``(l, r)``, 1-based and inclusive, whose sum is divisible by ``n``."""
+    first = [-1] * n
+    first[0] = 0
+    prefix = 0
+    for index, value in enumerate(values, start=1):
+        prefix = (prefix + value) % n
+        if first[prefix] >= 0:
+            return first[prefix] + 1, index
+        first[prefix] = index
+    raise ValueError("no divisible subarray")  # unreachable by the pigeonhole principle
+
+
+def find_witness_vectorized(values: "np.ndarray", n: int) -> Tuple[int, int]:
+    """``find_witness`` with array operations; ``values`` is an int64 array of length ``n``."""
+    prefix = np.empty(n + 1, dtype=np.int64)
+    prefix[0] = 0
+    # Reducing first keeps the running sum below n * n, well inside int64.
+    np.cumsum(values % n, out=prefix[1:])
+    prefix %= n
+    positions = np.arange(n + 1, dtype=np.int64)
+    # ``return_index`` gives the first position of every residue; residues are distinct, so no write collides.
+    residues, first_positions = np.unique(prefix, return_index=True)
+    first = np.empty(n, dtype=np.int64)
+    first[residues] = first_positions
+    repeats = first[prefix] < positions
+    r = int(np.argmax(repeats))
+    return int(first[prefix[r]]) + 1, r
+
+
+def main() -> None:
+    data = sys.stdin.buffer.read()
+    if len(data) >= NUMPY_MIN_BYTES and _load_numpy() is not None:
+        tokens = np.fromstring(data, dtype=np.int64, sep=" ")
+        n = int(tokens[0])
+        l, r = find_witness_vectorized(tokens[1 : n + 1], n)
+    else:
+        numbers = list(map(int, data.split()))
+        n = numbers[0]
+        l, r = find_witness(numbers[1 : n + 1], n)
+    sys.stdout.write(f"YES\n{l} {r}\n")
+
+
+if __name__ == "__main__":
+    main()
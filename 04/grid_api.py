@@ -1,6 +1,30 @@
 from __future__ import annotations
 
-from typing import Iterable, List, Optional
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; the vectorized engine falls back to the loop
+    np = None  # type: ignore[assignment]
+
+INT64_LIMIT = 2**63 - 1
+
+
+def _load_feeds(
+    left_feed: Iterable[Iterable[Optional[int]]],
+    top_feed: Iterable[Iterable[Optional[int]]],
+) -> Tuple[List[List[Optional[int]]], List[List[Optional[int]]], int]:
+    left = [list(row) for row in left_feed]
+    top = [list(col) for col in top_feed]
+    if not left or not top or len(left) != len(top):
+        raise ValueError("left_feed and top_feed must have the same non-zero length")
+
+    n = len(left)
+    if any(len(row) != n for row in left):
+        raise ValueError("Each row in left_feed must have length N")
+    if any(len(col) != n for col in top):
+        raise ValueError("Each column in top_feed must have length N")
+    return left, top, n
 
 
 def run_dancing_grid(
@@ -57,3 +81,226 @@ def run_dancing_grid(
         b_pipe = next_b_pipe
 
     return accumulators
+
+
+def run_dancing_grid_rings(
+    left_feed: Iterable[Iterable[Optional[int]]],
+    top_feed: Iterable[Iterable[Optional[int]]],
+) -> List[List[int]]:
+    """Faster pure-Python equivalent of ``run_dancing_grid``.
+
+    Takes the same feeds and returns the same accumulators, but keeps each
+    row's and column's pipe in a ring buffer instead of rebuilding both pipe
+    matrices every tick (see ``_run_rings``).
+    """
+
+    left, top, n = _load_feeds(left_feed, top_feed)
+    left_ticks = ([row[tick] for row in left] for tick in range(n))
+    top_ticks = ([col[tick] for col in top] for tick in range(n))
+    return _run_rings(n, left_ticks, top_ticks)
+
+
+def run_dancing_grid_stream(
+    n: int,
+    left_ticks: Iterable[Sequence[Optional[int]]],
+    top_ticks: Iterable[Sequence[Optional[int]]],
+) -> List[List[int]]:
+    """Simulate the Dancing Grid for exactly N ticks from per-tick feeds.
+
+    Same grid as ``run_dancing_grid_rings``, but the feeds are consumed one tick
+    at a time instead of being materialized up front.
+
+    Args:
+        n: Grid size; the grid runs for exactly ``n`` ticks.
+        left_ticks: Yields one sequence of N values per tick; entry ``r`` is
+            injected on the left edge of row r. Use None to skip injection.
+        top_ticks: Yields one sequence of N values per tick; entry ``c`` is
+            injected on the top edge of column c. Use None to skip injection.
+
+    Returns:
+        The N x N matrix of accumulators after N ticks.
+    """
+
+    if n <= 0:
+        raise ValueError("n must be positive")
+    return _run_rings(n, left_ticks, top_ticks)
+
+
+def _next_tick(ticks: Iterator[Sequence[Optional[int]]], n: int, name: str) -> Sequence[Optional[int]]:
+    try:
+        values = next(ticks)
+    except StopIteration:
+        raise ValueError(f"{name} must provide N ticks") from None
+    if len(values) != n:
+        raise ValueError(f"Each tick of {name} must have length N")
+    return values
+
+
+def _run_rings(
+    n: int,
+    left_ticks: Iterable[Sequence[Optional[int]]],
+    top_ticks: Iterable[Sequence[Optional[int]]],
+) -> List[List[int]]:
+    """Core simulation shared by ``run_dancing_grid_rings`` and the streaming entry point.
+
+    A value entering row r at tick t sits in column c at tick t + c, so the row's
+    pipe is fully described by its last N injections. Each row (and column)
+    keeps them in a preallocated ring buffer of length N that is written in
+    place, and cell (r, c) reads slot (t - c) of its row ring and slot (t - r) of
+    its column ring. Cells that no value can have reached yet are skipped.
+    """
+
+    accumulators: List[List[int]] = [[0 for _ in range(n)] for _ in range(n)]
+    a_rings: List[List[Optional[int]]] = [[None for _ in range(n)] for _ in range(n)]
+    b_rings: List[List[Optional[int]]] = [[None for _ in range(n)] for _ in range(n)]
+    left_iter = iter(left_ticks)
+    top_iter = iter(top_ticks)
+
+    for tick in range(n):
+        slot = tick % n
+        for r, value in enumerate(_next_tick(left_iter, n, "left_ticks")):
+            a_rings[r][slot] = value
+        for c, value in enumerate(_next_tick(top_iter, n, "top_ticks")):
+            b_rings[c][slot] = value
+        reach = min(tick + 1, n)
+        for r in range(reach):
+            a_ring = a_rings[r]
+            row = accumulators[r]
+            b_slot = (tick - r) % n
+            for c in range(reach):
+                a_val = a_ring[(tick - c) % n]
+                if a_val is None:
+                    continue
+                b_val = b_rings[c][b_slot]
+                if b_val is not None:
+                    row[c] += int(a_val) * int(b_val)
+
+    return accumulators
+
+
+def _feed_planes(feeds: List[List[List[Optional[int]]]]) -> "np.ndarray":
+    """Stack feeds into a (K, N, N) object array, using 0 as the sentinel for ``None``.
+
+    A missing value contributes nothing to any product it meets, which is exactly
+    what multiplying by zero does, so no separate mask has to be carried.
+    """
+    planes = np.array(feeds, dtype=object)
+    planes[np.equal(planes, None)] = 0
+    return planes
+
+
+def _pick_dtype(left_planes: "np.ndarray", top_planes: "np.ndarray", n: int) -> object:
+    """Use int64 when no accumulator can overflow it, otherwise Python ints."""
+    max_a = int(np.abs(left_planes).max(initial=0))
+    max_b = int(np.abs(top_planes).max(initial=0))
+    return np.int64 if max(max_a, max_b, n * max_a * max_b) <= INT64_LIMIT else object
+
+
+def _run_planes(
+    lefts: List[List[List[Optional[int]]]],
+    tops: List[List[List[Optional[int]]]],
+    n: int,
+) -> List[List[List[int]]]:
+    """Simulate K grids at once on stacked (K, N, N) pipe planes."""
+    return _simulate_planes(_feed_planes(lefts), _feed_planes(tops), n).tolist()
+
+
+def _simulate_planes(left_planes: "np.ndarray", top_planes: "np.ndarray", n: int) -> "np.ndarray":
+    dtype = _pick_dtype(left_planes, top_planes, n)
+    if dtype is object:
+        to_int = np.frompyfunc(int, 1, 1)
+        left_planes = to_int(left_planes)
+        top_planes = to_int(top_planes)
+    else:
+        left_planes = left_planes.astype(dtype, copy=False)
+        top_planes = top_planes.astype(dtype, copy=False)
+    shape = (len(left_planes), n, n)
+
+    accumulators = np.zeros(shape, dtype=dtype)
+    a_pipe = np.zeros(shape, dtype=dtype)
+    b_pipe = np.zeros(shape, dtype=dtype)
+    product = np.empty(shape, dtype=dtype)
+
+    for tick in range(n):
+        a_pipe[:, :, 1:] = a_pipe[:, :, :-1]
+        a_pipe[:, :, 0] = left_planes[:, :, tick]
+        b_pipe[:, 1:, :] = b_pipe[:, :-1, :]
+        b_pipe[:, 0, :] = top_planes[:, :, tick]
+        np.multiply(a_pipe, b_pipe, out=product)
+        accumulators += product
+
+    return accumulators
+
+
+def run_dancing_grid_vectorized(
+    left_feed: Iterable[Iterable[Optional[int]]],
+    top_feed: Iterable[Iterable[Optional[int]]],
+) -> List[List[int]]:
+    """Array-based equivalent of ``run_dancing_grid``.
+
+    Each tick shifts the whole A plane one column right and the B plane one row
+    down in place, injects the new feed column/row at the edge, and adds the
+    elementwise product to the accumulators. The planes use int64 when the
+    largest possible accumulator fits and object dtype (exact Python ints)
+    otherwise, so results match the reference loop bit for bit. Falls back to
+    ``run_dancing_grid_rings`` when NumPy is not installed.
+    """
+
+    left, top, n = _load_feeds(left_feed, top_feed)
+    if np is None:
+        return run_dancing_grid_rings(left, top)
+    return _run_planes([left], [top], n)[0]
+
+
+def run_dancing_grid_batch(
+    feeds: Iterable[Tuple[Iterable[Iterable[Optional[int]]], Iterable[Iterable[Optional[int]]]]],
+) -> List[List[List[int]]]:
+    """Simulate K independent grids of the same size in one pass.
+
+    Args:
+        feeds: K ``(left_feed, top_feed)`` pairs, each shaped as for
+            ``run_dancing_grid``. Every pair must use the same N.
+
+    Returns:
+        The K accumulator matrices, in the order of ``feeds``. Each one equals
+        ``run_dancing_grid(left_feed, top_feed)`` for its pair.
+    """
+
+    lefts: List[List[List[Optional[int]]]] = []
+    tops: List[List[List[Optional[int]]]] = []
+    n = 0
+    for left_feed, top_feed in feeds:
+        left, top, size = _load_feeds(left_feed, top_feed)
+        if lefts and size != n:
+            raise ValueError("All feeds in a batch must have the same N")
+        n = size
+        lefts.append(left)
+        tops.append(top)
+    if not lefts:
+        return []
+    if np is None:
+        return [run_dancing_grid_rings(left, top) for left, top in zip(lefts, tops)]
+    return _run_planes(lefts, tops, n)
+
+
+def run_dancing_grid_planes(left_planes: "np.ndarray", top_planes: "np.ndarray") -> "np.ndarray":
+    """Simulate K grids from feeds that are already stacked into arrays.
+
+    Args:
+        left_planes: A ``(K, N, N)`` integer array; ``left_planes[g, r, t]`` is
+            injected into row r of grid g at tick t. Idle slots hold 0, which
+            adds nothing to any accumulator, just like None.
+        top_planes: A ``(K, N, N)`` integer array; ``top_planes[g, c, t]`` is
+            injected into column c of grid g at tick t.
+
+    Returns:
+        A ``(K, N, N)`` array of accumulators; grid g equals ``run_dancing_grid``
+        on the feeds ``left_planes[g].tolist()`` and ``top_planes[g].tolist()``.
+        Requires NumPy; skipping the list conversion is the point of this entry.
+    """
+
+    if np is None:
+        raise RuntimeError("run_dancing_grid_planes requires NumPy")
+    if left_planes.ndim != 3 or left_planes.shape != top_planes.shape or left_planes.shape[1] != left_planes.shape[2]:
+        raise ValueError("left_planes and top_planes must both have shape (K, N, N)")
+    return _simulate_planes(left_planes, top_planes, left_planes.shape[1])
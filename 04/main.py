@@ -1,39 +1,68 @@
 from __future__ import annotations
 
+import os
 import sys
-from typing import List, Optional
+from typing import Dict, List, Tuple
 
-from grid_api import run_dancing_grid
+from tiling import multiply_batch
 
 
 def read_matrix(n: int, it) -> List[List[int]]:
     return [[int(next(it)) for _ in range(n)] for _ in range(n)]
 
 
-def build_feeds(a: List[List[int]], b: List[List[int]]) -> tuple[List[List[Optional[int]]], List[List[Optional[int]]]]:
-    """Construct feeds for the Dancing Grid.
+def read_pairs(text: str) -> List[Tuple[List[List[int]], List[List[int]]]]:
+    """Parse one or more ``N, A, B`` blocks, back to back, from ``text``."""
+    tokens = text.strip().split()
+    if not tokens:
+        raise SystemExit("Empty input")
+    it = iter(tokens)
+    pairs = []
+    for token in it:
+        n = int(token)
+        a = read_matrix(n, it)
+        b = read_matrix(n, it)
+        pairs.append((a, b))
+    return pairs
+
+
+def solve(text: str) -> str:
+    """Answer every A/B pair in ``text``, running same-sized pairs as one batch.
 
-    TODO: Replace this placeholder with logic that schedules values so the grid
-    accumulators equal A x B after N ticks.
+    Feed plans are cached per N, so a persistent session (``VEST_PERSISTENT``)
+    reuses them across requests.
     """
-    n = len(a)
-    left = [[None for _ in range(n)] for _ in range(n)]
-    top = [[None for _ in range(n)] for _ in range(n)]
-    return left, top
+    pairs = read_pairs(text)
+    by_size: Dict[int, List[int]] = {}
+    for idx, (a, _) in enumerate(pairs):
+        by_size.setdefault(len(a), []).append(idx)
+    results: List[List[List[int]]] = [[] for _ in pairs]
+    for n, indices in by_size.items():
+        for idx, result in zip(indices, multiply_batch([pairs[idx] for idx in indices], n)):
+            results[idx] = result
+    return "".join(" ".join(str(x) for x in row) + "\n" for result in results for row in result)
+
+
+def serve() -> None:
+    """Answer length-prefixed inputs until stdin closes (see ``VEST_PERSISTENT``)."""
+    stdin = sys.stdin.buffer
+    stdout = sys.stdout.buffer
+    while True:
+        header = stdin.readline()
+        if not header:
+            break
+        payload = stdin.read(int(header))
+        answer = solve(payload.decode()).encode()
+        stdout.write(b"%d\n" % len(answer))
+        stdout.write(answer)
+        stdout.flush()
 
 
 def main() -> None:
-    tokens = sys.stdin.read().strip().split()
-    if not tokens:
-        raise SystemExit("Empty input")
-    it = iter(tokens)
-    n = int(next(it))
-    a = read_matrix(n, it)
-    b = read_matrix(n, it)
-    left_feed, top_feed = build_feeds(a, b)
-    result = run_dancing_grid(left_feed, top_feed)
-    for row in result:
-        print(" ".join(str(x) for x in row))
+    if os.environ.get("VEST_PERSISTENT"):
+        serve()
+        return
+    sys.stdout.write(solve(sys.stdin.read()))
 
 
 if __name__ == "__main__":
@@ -1,4 +1,5 @@
 #!/usr/bin/env bash
+# vest: persistent
 set -euo pipefail
 
 SCRIPT_DIR="$(cd "$(dirname "$0")" && pwd)"
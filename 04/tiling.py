@@ -0,0 +1,344 @@
+"""Tiled matrix multiplication on a fixed-size Dancing Grid.
+
+A grid of size G runs for exactly G ticks. If row r receives ``A[r][k]`` at tick
+``k + r`` and column c receives ``B[k][c]`` at tick ``k + c``, both values meet in
+cell (r, c) at tick ``k + r + c``. A pass can therefore multiply a
+``rows x depth`` tile by a ``depth x cols`` tile as long as the last meeting,
+``(rows - 1) + (cols - 1) + (depth - 1)``, still happens before tick G. Larger
+products are split into such tiles, one grid pass per tile triple, and the
+partial accumulators are summed.
+
+That schedule depends only on the shapes, the grid and the tile, never on the
+values, so ``feed_plan`` turns it into flat index arrays once and keeps recent
+plans in an LRU cache. A plan builds the feeds of every pass with one gather
+per operand and sums the pass accumulators back into the product with one
+scatter; ``multiply_batch`` runs several same-shaped products through a single
+stacked grid simulation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import random
+import sys
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Sequence, Tuple
+
+from grid_api import INT64_LIMIT, run_dancing_grid_batch, run_dancing_grid_planes
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; plans then hold lists and feed the list engines
+    np = None  # type: ignore[assignment]
+
+Feed = List[List[Optional[int]]]
+Matrix = List[List[int]]
+
+PLAN_CACHE_SIZE = 32
+
+
+@dataclass(frozen=True)
+class TileShape:
+    rows: int
+    cols: int
+    depth: int
+
+    def fits(self, grid: int) -> bool:
+        return (
+            min(self.rows, self.cols, self.depth) >= 1
+            and self.rows <= grid
+            and self.cols <= grid
+            and self.rows + self.cols + self.depth <= grid + 2
+        )
+
+
+@dataclass
+class TiledResult:
+    product: Matrix
+    grid: int
+    tile: TileShape
+    passes: int
+    ticks: int
+    useful_macs: int
+    elapsed: float
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of cell-ticks that performed a useful multiply-accumulate."""
+        capacity = self.passes * self.grid * self.grid * self.grid
+        return self.useful_macs / capacity if capacity else 0.0
+
+
+def default_tile(grid: int) -> TileShape:
+    """The most balanced tile that fits a ``grid``-sized Dancing Grid."""
+    budget = grid + 2
+    base = budget // 3
+    extra = budget - 3 * base
+    return TileShape(rows=base + (extra > 1), cols=base + (extra > 0), depth=base)
+
+
+def candidate_tiles(grid: int) -> List[TileShape]:
+    """Every tile shape that uses the full tick budget of ``grid``."""
+    shapes = []
+    for rows in range(1, grid + 1):
+        for cols in range(1, grid + 1):
+            depth = grid + 2 - rows - cols
+            if depth >= 1:
+                shapes.append(TileShape(rows, cols, depth))
+    return shapes
+
+
+@dataclass(frozen=True, eq=False)
+class FeedPlan:
+    """Where each entry of A and B enters the grid, for every pass of one tiled product.
+
+    Slots index the flattened ``(passes, grid, grid)`` feed planes and sources
+    the flattened operands; entry ``i`` of ``left_slots`` receives entry
+    ``left_sources[i]`` of A. ``out_slots``/``out_targets`` map the useful
+    accumulators of each pass onto the flattened ``M x P`` product. The index
+    sequences are int64 arrays with NumPy and lists without it.
+    """
+
+    shape: Tuple[int, int, int]
+    grid: int
+    tile: TileShape
+    origins: Tuple[Tuple[int, int, int], ...]
+    left_slots: Sequence[int]
+    left_sources: Sequence[int]
+    top_slots: Sequence[int]
+    top_sources: Sequence[int]
+    out_slots: Sequence[int]
+    out_targets: Sequence[int]
+
+    @property
+    def passes(self) -> int:
+        return len(self.origins)
+
+    def planes(self, a: Sequence[Sequence[int]], b: Sequence[Sequence[int]]) -> Tuple["np.ndarray", "np.ndarray"]:
+        """The ``(passes, grid, grid)`` left and top feed planes, idle slots 0. Requires NumPy."""
+        size = self.passes * self.grid * self.grid
+        planes = []
+        for matrix, slots, sources in ((a, self.left_slots, self.left_sources), (b, self.top_slots, self.top_sources)):
+            values = _as_array(matrix).ravel()
+            plane = np.zeros(size, dtype=values.dtype)
+            plane[slots] = values[sources]
+            planes.append(plane.reshape(self.passes, self.grid, self.grid))
+        return planes[0], planes[1]
+
+    def feeds(self, a: Sequence[Sequence[int]], b: Sequence[Sequence[int]]) -> List[Tuple[Feed, Feed]]:
+        """The ``(left_feed, top_feed)`` lists of every pass, idle slots None."""
+        size = self.passes * self.grid * self.grid
+        flat_feeds = []
+        for matrix, slots, sources in ((a, self.left_slots, self.left_sources), (b, self.top_slots, self.top_sources)):
+            if np is not None:
+                plane = np.full(size, None, dtype=object)
+                plane[slots] = np.array(matrix, dtype=object).ravel()[sources]
+                flat: List[Optional[int]] = plane.tolist()
+            else:
+                values = [value for row in matrix for value in row]
+                flat = [None] * size
+                for slot, source in zip(slots, sources):
+                    flat[slot] = values[source]
+            flat_feeds.append(flat)
+        left, top = flat_feeds
+        return [
+            (_pass_rows(left, index, self.grid), _pass_rows(top, index, self.grid))
+            for index in range(self.passes)
+        ]
+
+    def collect(self, accumulators: Sequence[Sequence[Sequence[int]]], exact: bool = False) -> Matrix:
+        """Sum the useful accumulators of every pass into the ``M x P`` product.
+
+        Each pass fits int64 on its own, but the sum over depth tiles may not;
+        ``exact`` sums in Python ints (see ``fits_int64``).
+        """
+        m, _, p = self.shape
+        if np is not None:
+            stacked = accumulators if isinstance(accumulators, np.ndarray) else np.array(accumulators)
+            if exact:
+                stacked = stacked.astype(object)
+            product = np.zeros(m * p, dtype=stacked.dtype)
+            np.add.at(product, self.out_targets, stacked.reshape(-1)[self.out_slots])
+            return product.reshape(m, p).tolist()
+        flat = [value for grid in accumulators for row in grid for value in row]
+        result = [0] * (m * p)
+        for slot, target in zip(self.out_slots, self.out_targets):
+            result[target] += flat[slot]
+        return [result[row * p : (row + 1) * p] for row in range(m)]
+
+
+def fits_int64(a: Sequence[Sequence[int]], b: Sequence[Sequence[int]]) -> bool:
+    """Whether ``K * max|a| * max|b|`` bounds every partial sum of ``a x b`` inside int64."""
+    max_a = max((abs(int(value)) for row in a for value in row), default=0)
+    max_b = max((abs(int(value)) for row in b for value in row), default=0)
+    return len(b) * max_a * max_b <= INT64_LIMIT
+
+
+def _pass_rows(flat: List[Optional[int]], index: int, grid: int) -> Feed:
+    start = index * grid * grid
+    return [flat[start + row * grid : start + (row + 1) * grid] for row in range(grid)]
+
+
+def _as_array(matrix: Sequence[Sequence[int]]) -> "np.ndarray":
+    """``matrix`` as int64, or as exact Python ints when an entry does not fit."""
+    try:
+        return np.array(matrix, dtype=np.int64)
+    except OverflowError:
+        return np.array(matrix, dtype=object)
+
+
+def feed_plan(m: int, k_dim: int, p: int, grid: int, tile: Optional[TileShape] = None) -> FeedPlan:
+    """The feed plan of an ``M x K`` by ``K x P`` product on a ``grid``-sized grid.
+
+    Each pass multiplies one tile triple, clipped at the matrix edges: row r of
+    the tile gets ``A[row0 + r][k0 + k]`` at tick ``k + r`` and column c gets
+    ``B[k0 + k][col0 + c]`` at tick ``k + c``. The last ``PLAN_CACHE_SIZE``
+    plans are cached, so repeated products of one shape pay for the schedule
+    only once.
+    """
+    tile = tile or default_tile(grid)
+    if not tile.fits(grid):
+        raise ValueError(f"Tile {tile} does not fit a grid of size {grid}")
+    return _build_plan(m, k_dim, p, grid, tile)
+
+
+@functools.lru_cache(maxsize=PLAN_CACHE_SIZE)
+def _build_plan(m: int, k_dim: int, p: int, grid: int, tile: TileShape) -> FeedPlan:
+    origins = tuple(
+        (row0, col0, k0)
+        for row0 in range(0, m, tile.rows)
+        for col0 in range(0, p, tile.cols)
+        for k0 in range(0, k_dim, tile.depth)
+    )
+    left_slots: List[int] = []
+    left_sources: List[int] = []
+    top_slots: List[int] = []
+    top_sources: List[int] = []
+    out_slots: List[int] = []
+    out_targets: List[int] = []
+    for index, (row0, col0, k0) in enumerate(origins):
+        base = index * grid * grid
+        rows = min(tile.rows, m - row0)
+        cols = min(tile.cols, p - col0)
+        depth = min(tile.depth, k_dim - k0)
+        for r in range(rows):
+            left_slots.extend(base + r * grid + k + r for k in range(depth))
+            left_sources.extend((row0 + r) * k_dim + k0 + k for k in range(depth))
+        for c in range(cols):
+            top_slots.extend(base + c * grid + k + c for k in range(depth))
+            top_sources.extend((k0 + k) * p + col0 + c for k in range(depth))
+        for r in range(rows):
+            out_slots.extend(base + r * grid + c for c in range(cols))
+            out_targets.extend((row0 + r) * p + col0 + c for c in range(cols))
+    indices = [left_slots, left_sources, top_slots, top_sources, out_slots, out_targets]
+    if np is not None:
+        indices = [np.array(values, dtype=np.int64) for values in indices]
+    return FeedPlan((m, k_dim, p), grid, tile, origins, *indices)
+
+
+def multiply_batch(
+    pairs: Sequence[Tuple[Sequence[Sequence[int]], Sequence[Sequence[int]]]],
+    grid: int,
+    tile: Optional[TileShape] = None,
+) -> List[Matrix]:
+    """Multiply same-shaped pairs on a ``grid``-sized grid, all passes in one simulation."""
+    if not pairs:
+        return []
+    a0, b0 = pairs[0]
+    plan = feed_plan(len(a0), len(b0), len(b0[0]), grid, tile)
+    if np is None:
+        feeds = [pass_feeds for a, b in pairs for pass_feeds in plan.feeds(a, b)]
+        accumulators = run_dancing_grid_batch(feeds)
+    else:
+        planes = [plan.planes(a, b) for a, b in pairs]
+        accumulators = run_dancing_grid_planes(
+            _stack([left for left, _ in planes]),
+            _stack([top for _, top in planes]),
+        )
+    return [
+        plan.collect(accumulators[index * plan.passes : (index + 1) * plan.passes], exact=not fits_int64(a, b))
+        for index, (a, b) in enumerate(pairs)
+    ]
+
+
+def _stack(planes: List["np.ndarray"]) -> "np.ndarray":
+    if any(plane.dtype == object for plane in planes):
+        return np.concatenate([plane.astype(object) for plane in planes])
+    return np.concatenate(planes)
+
+
+def tiled_multiply(
+    a: Sequence[Sequence[int]],
+    b: Sequence[Sequence[int]],
+    grid: int,
+    tile: Optional[TileShape] = None,
+    batch_size: int = 64,
+    engine: Callable[[List[Tuple[Feed, Feed]]], List[Matrix]] = run_dancing_grid_batch,
+) -> TiledResult:
+    """Multiply an M x K matrix by a K x P matrix on a ``grid``-sized Dancing Grid.
+
+    Args:
+        a: The left operand, M rows of K integers.
+        b: The right operand, K rows of P integers.
+        grid: Size G of the physical grid; every pass runs for G ticks.
+        tile: Tile shape to use. Defaults to ``default_tile(grid)``.
+        batch_size: Number of passes handed to ``engine`` at once.
+        engine: Simulates a list of feed pairs and returns their accumulators.
+
+    Returns:
+        The product together with pass/tick counts and utilization figures.
+    """
+    if not a or not b or len(a[0]) != len(b):
+        raise ValueError("a must be M x K and b must be K x P with matching K")
+    m, k_dim, p = len(a), len(b), len(b[0])
+    plan = feed_plan(m, k_dim, p, grid, tile)
+    tile = plan.tile
+    passes = plan.feeds(a, b)
+
+    start = time.perf_counter()
+    grids: List[Matrix] = []
+    for first in range(0, len(passes), batch_size):
+        grids.extend(engine(passes[first:first + batch_size]))
+    product = plan.collect(grids, exact=not fits_int64(a, b))
+    elapsed = time.perf_counter() - start
+
+    return TiledResult(
+        product=product,
+        grid=grid,
+        tile=tile,
+        passes=len(passes),
+        ticks=len(passes) * grid,
+        useful_macs=m * k_dim * p,
+        elapsed=elapsed,
+    )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare tile shapes for tiled Dancing Grid multiplication")
+    parser.add_argument("--grid", type=int, required=True, help="Physical grid size G")
+    parser.add_argument("--shape", type=int, nargs=3, metavar=("M", "K", "P"), required=True)
+    parser.add_argument("--all-tiles", action="store_true", help="Try every tile shape, not just the default")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    m, k_dim, p = args.shape
+    a = [[rng.randint(-9, 9) for _ in range(k_dim)] for _ in range(m)]
+    b = [[rng.randint(-9, 9) for _ in range(p)] for _ in range(k_dim)]
+    tiles = candidate_tiles(args.grid) if args.all_tiles else [default_tile(args.grid)]
+
+    print(f"{'tile':>14} {'passes':>8} {'ticks':>10} {'util':>7} {'time':>8}")
+    for tile in tiles:
+        result = tiled_multiply(a, b, args.grid, tile)
+        label = f"{tile.rows}x{tile.cols}x{tile.depth}"
+        print(
+            f"{label:>14} {result.passes:>8} {result.ticks:>10} "
+            f"{result.utilization:>7.2%} {result.elapsed:>7.3f}s"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+"""Rank the sentences a garble could hide with a character n-gram language model.
+
+``ungarble.decode_offsets`` leaves about nine printable candidates per position
+for puzzle1, far too many to enumerate. This module treats those candidates as
+a lattice and searches it for the most plausible sentences:
+
+1. A forward pass collects the model states each position can be reached in.
+   A state is the longest suffix of the last ``order - 1`` characters that
+   the model has seen as a context; longer contexts back off to it, so it
+   scores every continuation exactly as the full context would, and most of
+   the ``candidates ** (order - 1)`` raw contexts collapse into a few states.
+2. A backward Viterbi pass over those states computes the best score any
+   completion can reach.
+3. A* search from the start then uses that score as an exact heuristic, so
+   complete sentences come off the heap in order of model score and the top-K
+   are produced lazily, one at a time.
+
+The model is trained on running text, so it learns how often words occur and
+follow each other, not just how they are spelled: the lines of lowercase prose
+in the standard library's own sources (docstrings and comments, which ship with
+every interpreter). Without them it falls back to a word list,
+``/usr/share/dict/words`` or a small built-in vocabulary. Training takes most of
+a second, so the trained model is pickled under ``__pycache__`` and reused until
+the Python installation or the word list changes. Any modulus and alphabet
+work, and so does any other candidate lattice, such as the ambiguous positions
+of puzzle2.
+"""
+
+from __future__ import annotations
+
+import argparse
+import functools
+import hashlib
+import heapq
+import itertools
+import json
+import math
+import os
+import pickle
+import re
+import sys
+import sysconfig
+import time
+from collections import Counter
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from ungarble import (
+    OFFSET_MODULUS,
+    PRINTABLE,
+    decode_offsets,
+    decode_streams,
+    load_garble,
+)
+
+WORD_LISTS = (Path("/usr/share/dict/words"), Path("/usr/dict/words"))
+BOUNDARY = " "
+DEFAULT_ORDER = 4
+MODEL_FORMAT = 1
+MODEL_CACHE_DIR = Path(__file__).resolve().parent / "__pycache__"
+# Source lines with fewer lowercase words are mostly code, not prose.
+MIN_SENTENCE_WORDS = 3
+# A lowercase run that is not part of a longer identifier, number or CamelCase name.
+SOURCE_WORD = re.compile(r"(?<![A-Za-z0-9_])[a-z]+(?![A-Za-z0-9_])")
+
+# Last resort when neither a word list nor the standard library sources exist.
+# Common English words, so the model learns ordinary spelling and word
+# boundaries; the content words of the shipped answers are deliberately absent.
+FALLBACK_WORDS = """
+a about above act add after again against age ago air all almost already also although always am among an and
+animal another answer any anything appear are area arm around art as ask at away back bad ball be bear beat
+beautiful became because become bed been before began begin behind being believe below best better between big bird
+black blue boat body book both box boy bring brother brought build built but by call came can car care carry case
+cat cause center certain change check child children city class clear close cold color come common company complete
+could country course cover cross cry cut dark day dead deep did different direction do does dog done door down draw
+dream drive dry during each early earth east easy eat edge end enough even evening ever every example eye face fact
+fall family far farm fast father feel feet few field fight figure fill final find fine fire first fish five fly
+follow food foot for force form found four free friend from front full game gave get girl give glass go gold good
+got great green ground group grow had half hand happen happy hard has have he head hear heard heart heavy held help
+her here high hill him his hold home hope horse hot hour house how however hundred i idea if important in inside
+instead into is island it its just kind king knew know land language large last late later laugh lay lead learn
+leave led left less let letter life light like line list listen little live long look lost love low made main make
+man many map mark may me mean men might mile mind minute miss money moon more morning most mother mountain move
+much music must my name near need never new next night no north not note nothing notice now number of off often old
+on once one only open or order other our out over own page paper part pass past people perhaps person picture piece
+place plan plant play point poor possible power present problem pull put question quick quiet rain ran reach read
+ready real reason record red remember rest river road rock room round rule run said same saw say school sea second
+see seem sell send sentence set several shape she ship short should show side simple since sing sit six size sky
+sleep slow small snow so some something song soon sound south space speak special spell stand star start stay step
+still stone stood stop story street strong study such summer sun sure surface table take talk teach tell ten than
+that the their them then there these they thing think this those though thought three through to today together
+told too took top toward town tree true try turn two under until up upon us use usual very voice walk wall want war
+warm was watch water way we week well went were west what wheel when where which while white who whole why wide
+will wind window winter with without woman wonder wood word work world would write year yes yet you young your
+""".split()
+
+
+@dataclass
+class SearchStats:
+    """Work done by one search: lattice states scored and A* nodes handled."""
+
+    states: int = 0
+    expanded: int = 0
+    pushed: int = 0
+    emitted: int = 0
+
+
+class CharNGramModel:
+    """Character n-gram model with Witten-Bell interpolation down to add-one unigrams.
+
+    Every character of ``alphabet`` gets a non-zero probability, so the model can
+    score any candidate, seen in training or not.
+    """
+
+    def __init__(self, order: int = 3, alphabet: str = PRINTABLE) -> None:
+        if order < 1:
+            raise ValueError("order must be at least 1")
+        self.order = order
+        self.alphabet = alphabet
+        # counts[h][context][ch] for contexts of length h = 0 .. order - 1.
+        self.counts: List[Dict[str, Dict[str, int]]] = [{} for _ in range(order)]
+        # totals[h][context] = (number of tokens, number of distinct characters) after it.
+        self.totals: List[Dict[str, Tuple[int, int]]] = [{} for _ in range(order)]
+        self.vocabulary = len(alphabet)
+        self._memo: Dict[Tuple[str, str], float] = {}
+        self._states: Dict[str, str] = {}
+
+    @classmethod
+    def train(cls, texts: Iterable[str], order: int = 3, alphabet: str = PRINTABLE) -> "CharNGramModel":
+        model = cls(order, alphabet)
+        pad = BOUNDARY * (order - 1)
+        # Count whole n-grams first; every lower-order count is a sum over the n-grams ending the same way.
+        grams: Counter[str] = Counter()
+        for text in texts:
+            padded = pad + text + BOUNDARY
+            grams.update([padded[end - order + 1:end + 1] for end in range(order - 1, len(padded))])
+        for gram, count in grams.items():
+            ch = gram[-1]
+            for h in range(order):
+                following = model.counts[h].setdefault(gram[order - 1 - h:order - 1], {})
+                following[ch] = following.get(ch, 0) + count
+        model.totals = [
+            {context: (sum(following.values()), len(following)) for context, following in level.items()}
+            for level in model.counts
+        ]
+        model.vocabulary = len(set(alphabet) | set(model.counts[0].get("", {})))
+        return model
+
+    def _prob(self, context: str, ch: str) -> float:
+        h = len(context)
+        if h == 0:
+            following = self.counts[0].get("", {})
+            total, _ = self.totals[0].get("", (0, 0))
+            return (following.get(ch, 0) + 1) / (total + self.vocabulary)
+        lower = self._prob(context[1:], ch)
+        following = self.counts[h].get(context)
+        if not following:
+            return lower
+        total, types = self.totals[h][context]
+        return (following.get(ch, 0) + types * lower) / (total + types)
+
+    def state(self, context: str) -> str:
+        """The longest suffix of ``context`` seen as a training context.
+
+        An unseen context backs off to its suffix for every character, and any
+        seen extension of it would make the context itself seen, so the state
+        scores all continuations exactly as ``context`` does.
+        """
+        state = self._states.get(context)
+        if state is None:
+            state = context[max(0, len(context) - self.order + 1):] if self.order > 1 else ""
+            while state and state not in self.counts[len(state)]:
+                state = state[1:]
+            self._states[context] = state
+        return state
+
+    def logprob(self, context: str, ch: str) -> float:
+        """``log P(ch | context)``; only the last ``order - 1`` characters of ``context`` matter."""
+        context = context[max(0, len(context) - self.order + 1):] if self.order > 1 else ""
+        key = (context, ch)
+        value = self._memo.get(key)
+        if value is None:
+            value = self._memo[key] = math.log(self._prob(context, ch))
+        return value
+
+    def score(self, text: str) -> float:
+        """Log-probability of ``text`` as a whole sentence, boundaries included."""
+        padded = BOUNDARY * (self.order - 1) + text + BOUNDARY
+        return sum(
+            self.logprob(padded[end - self.order + 1:end], padded[end])
+            for end in range(self.order - 1, len(padded))
+        )
+
+
+def stdlib_words() -> List[str]:
+    """Distinct lowercase words in the sources of the top-level standard library modules."""
+    words = set()
+    for path in sorted(Path(sysconfig.get_paths()["stdlib"]).glob("*.py")):
+        try:
+            words.update(SOURCE_WORD.findall(path.read_text(errors="ignore")))
+        except OSError:
+            continue
+    return sorted(words)
+
+
+def stdlib_sentences() -> List[str]:
+    """Lines of at least ``MIN_SENTENCE_WORDS`` lowercase words from the top-level standard library modules.
+
+    Each line keeps only its lowercase words, single-spaced, and repeats as
+    often as the source does, so common words weigh more than rare ones.
+    """
+    sentences = []
+    for path in sorted(Path(sysconfig.get_paths()["stdlib"]).glob("*.py")):
+        try:
+            source = path.read_text(errors="ignore")
+        except OSError:
+            continue
+        for line in source.splitlines():
+            words = SOURCE_WORD.findall(line)
+            if len(words) >= MIN_SENTENCE_WORDS:
+                sentences.append(" ".join(words))
+    return sentences
+
+
+def load_words(path: Optional[Path] = None) -> List[str]:
+    """Words from ``path``, else a system word list, else ``stdlib_words``, else ``FALLBACK_WORDS``."""
+    for candidate in [path] if path is not None else WORD_LISTS:
+        if candidate.exists():
+            return [word for word in candidate.read_text(errors="ignore").split() if word.isascii()]
+    if path is not None:
+        raise FileNotFoundError(path)
+    return stdlib_words() or list(FALLBACK_WORDS)
+
+
+@functools.lru_cache(maxsize=None)
+def default_model(order: int = DEFAULT_ORDER, words: Optional[Path] = None) -> CharNGramModel:
+    """The model trained on ``words``, else on ``stdlib_sentences``, else on ``load_words``.
+
+    Trained models are pickled in ``MODEL_CACHE_DIR``, keyed by the order and
+    the training source, and loaded from there on later calls.
+    """
+    if words is not None:
+        stat = words.stat()
+        source: object = [str(words.resolve()), stat.st_size, stat.st_mtime_ns]
+    else:
+        source = [sys.version, sysconfig.get_paths()["stdlib"]]
+    key = hashlib.sha256(json.dumps([MODEL_FORMAT, order, source]).encode()).hexdigest()[:16]
+    path = MODEL_CACHE_DIR / f"ranker-model-{key}.pickle"
+    model = CharNGramModel(order)
+    # Only plain containers are pickled, so the file loads whatever name this module was imported under.
+    try:
+        with path.open("rb") as handle:
+            model.counts, model.totals, model.vocabulary = pickle.load(handle)
+        return model
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError):
+        pass
+    texts = load_words(words) if words is not None else stdlib_sentences() or load_words()
+    model = CharNGramModel.train(texts, order=order)
+    try:
+        MODEL_CACHE_DIR.mkdir(exist_ok=True)
+        partial = path.with_suffix(f".{os.getpid()}.tmp")
+        with partial.open("wb") as handle:
+            pickle.dump((model.counts, model.totals, model.vocabulary), handle, protocol=pickle.HIGHEST_PROTOCOL)
+        partial.replace(path)
+    except OSError:
+        pass  # a read-only checkout still works, it just trains every time
+    return model
+
+
+class LatticeDecoder:
+    """Lazy best-first enumeration of the sentences allowed by per-position candidates.
+
+    Args:
+        candidates: For every position, a string of the characters it may hold.
+        model: Scores sentences; its order sets the search context length.
+        max_frontier: Upper bound on open A* nodes. When exceeded, the worst half
+            is dropped, which bounds memory at the cost of possibly missing some
+            far-down results.
+    """
+
+    def __init__(self, candidates: Sequence[str], model: CharNGramModel, max_frontier: int = 200_000) -> None:
+        self.candidates = list(candidates)
+        self.model = model
+        self.max_frontier = max_frontier
+        self.history = model.order - 1
+        self.stats = SearchStats()
+        self._completion = self._backward()
+
+    def _forward(self) -> List[List[str]]:
+        """``reachable[i]``: the model states the lattice can be in before position ``i``."""
+        model = self.model
+        reachable = [[model.state(BOUNDARY * self.history)]]
+        for chars in self.candidates:
+            reachable.append(list({model.state(state + ch): None for state in reachable[-1] for ch in chars}))
+        return reachable
+
+    def _backward(self) -> List[Dict[str, float]]:
+        """``completion[i][state]``: best log-probability of positions ``i..`` given ``state``."""
+        model = self.model
+        reachable = self._forward()
+        length = len(self.candidates)
+        completion: List[Dict[str, float]] = [{} for _ in range(length + 1)]
+        completion[length] = {state: model.logprob(state, BOUNDARY) for state in reachable[length]}
+        for position in range(length - 1, -1, -1):
+            following = completion[position + 1]
+            scores: Dict[str, float] = {}
+            for state in reachable[position]:
+                scores[state] = max(
+                    model.logprob(state, ch) + following[model.state(state + ch)] for ch in self.candidates[position]
+                )
+            completion[position] = scores
+            self.stats.states += len(scores)
+        return completion
+
+    def best_score(self) -> float:
+        return self._completion[0][self.model.state(BOUNDARY * self.history)]
+
+    def ranked(self) -> Iterator[Tuple[str, float]]:
+        """Yield ``(sentence, log-probability)`` pairs, most plausible first."""
+        length = len(self.candidates)
+        model = self.model
+        start = model.state(BOUNDARY * self.history)
+        if self._completion[0][start] == -math.inf:
+            return
+        # Nodes are (position, model state, score so far, parent index, character).
+        nodes: List[Tuple[int, str, float, int, str]] = [(0, start, 0.0, -1, "")]
+        frontier: List[Tuple[float, int]] = [(-self._completion[0][start], 0)]
+        while frontier:
+            _, node_id = heapq.heappop(frontier)
+            position, ctx, score, _, _ = nodes[node_id]
+            self.stats.expanded += 1
+            if position == length:
+                chars = []
+                cursor = node_id
+                while cursor > 0:
+                    chars.append(nodes[cursor][4])
+                    cursor = nodes[cursor][3]
+                self.stats.emitted += 1
+                yield "".join(reversed(chars)), score + model.logprob(ctx, BOUNDARY)
+                continue
+            following = self._completion[position + 1]
+            for ch in self.candidates[position]:
+                child_ctx = model.state(ctx + ch)
+                child_score = score + model.logprob(ctx, ch)
+                nodes.append((position + 1, child_ctx, child_score, node_id, ch))
+                heapq.heappush(frontier, (-(child_score + following[child_ctx]), len(nodes) - 1))
+                self.stats.pushed += 1
+            if len(frontier) > self.max_frontier:
+                frontier = heapq.nsmallest(self.max_frontier // 2, frontier)
+                heapq.heapify(frontier)
+
+
+def top_sentences(
+    candidates: Sequence[str],
+    model: CharNGramModel,
+    k: int = 5,
+) -> Tuple[List[Tuple[str, float]], SearchStats]:
+    """The ``k`` most plausible sentences and the search statistics."""
+    decoder = LatticeDecoder(candidates, model)
+    return list(itertools.islice(decoder.ranked(), k)), decoder.stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Rank plausible decodings of an ambiguous 05 puzzle")
+    parser.add_argument("--puzzle", type=int, choices=(1, 2), default=1)
+    parser.add_argument("-k", type=int, default=5, help="Number of sentences to print")
+    parser.add_argument("--order", type=int, default=DEFAULT_ORDER, help="Character n-gram order")
+    parser.add_argument("--modulus", type=int, default=OFFSET_MODULUS, help="Modulus of the puzzle1 offsets")
+    parser.add_argument("--words", type=Path, help="Word list to train on (default: standard library prose)")
+    args = parser.parse_args(argv)
+
+    here = Path(__file__).resolve().parent
+    start = time.perf_counter()
+    model = default_model(args.order, args.words)
+    trained = time.perf_counter()
+    garble = load_garble(here / f"puzzle{args.puzzle}.py")
+    if args.puzzle == 1:
+        candidates = decode_offsets(garble, args.modulus)  # type: ignore[arg-type]
+    else:
+        candidates = decode_streams(garble)  # type: ignore[arg-type]
+    results, stats = top_sentences(candidates, model, args.k)
+    searched = time.perf_counter()
+
+    for text, score in results:
+        print(f"{score:9.2f}  {text!r}")
+    print(
+        f"train {1000 * (trained - start):.1f} ms · search {1000 * (searched - trained):.1f} ms · "
+        f"{stats.states} lattice states · {stats.expanded} expanded · {stats.pushed} pushed"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
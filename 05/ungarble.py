@@ -0,0 +1,272 @@
+"""Table-driven decoders for the three garbling families in this folder.
+
+Every transform garbles each character independently of its neighbours, up to a
+shift by its index, so decoding reduces to looking characters up by residue:
+
+* ``puzzle1`` keeps ``(ord(ch) + idx) % 11``. Subtracting ``idx`` leaves
+  ``ord(ch) % 11``, which several printable characters share.
+* ``puzzle2`` keeps ``(ord(ch) * 12) % m + idx`` for ``m`` in 8, 7 and 36.
+  After subtracting ``idx`` the three residues reveal ``ord(ch)`` modulo 2, 7
+  and 3, which the Chinese remainder theorem combines into ``ord(ch) % 42``.
+  The residue triple itself serves as the lookup key, so no explicit CRT step
+  is needed and other multipliers and moduli work the same way.
+* ``puzzle3`` is a fixed permutation of positions for every length and is
+  undone with its inverse.
+
+The ``*_batch`` functions decode many garbled inputs at once. With numpy
+installed, inputs of equal length are stacked and decoded with array gathers.
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib.util
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional; batches fall back to per-sentence lookups
+    np = None  # type: ignore[assignment]
+
+PRINTABLE = "".join(chr(code) for code in range(32, 127))
+LOWERCASE = " abcdefghijklmnopqrstuvwxyz"
+OFFSET_MODULUS = 11
+STREAM_MULTIPLIER = 12
+STREAM_MODULI = (8, 7, 36)
+STREAM_NAMES = ("a", "b", "c")
+
+Candidates = List[str]
+
+
+@dataclass(frozen=True)
+class LookupTable:
+    """Characters of an alphabet grouped by the key their garbled form reduces to.
+
+    ``candidates[key]`` holds every character with that key ("" if none). Keys
+    are dense integers in ``range(size)``.
+    """
+
+    candidates: Tuple[str, ...]
+
+    @property
+    def size(self) -> int:
+        return len(self.candidates)
+
+    def ids(self) -> Tuple[Tuple[str, ...], List[int]]:
+        """Distinct candidate sets and, per key, the index of its set."""
+        distinct = tuple(sorted(set(self.candidates)))
+        index = {group: position for position, group in enumerate(distinct)}
+        return distinct, [index[group] for group in self.candidates]
+
+
+def _group(size: int, keyed: Iterable[Tuple[int, str]]) -> LookupTable:
+    slots: List[List[str]] = [[] for _ in range(size)]
+    for key, ch in keyed:
+        slots[key].append(ch)
+    return LookupTable(tuple("".join(chars) for chars in slots))
+
+
+@lru_cache(maxsize=None)
+def offset_table(modulus: int = OFFSET_MODULUS, alphabet: str = PRINTABLE) -> LookupTable:
+    """Key ``ord(ch) % modulus``, the puzzle1 residue at index 0."""
+    return _group(modulus, ((ord(ch) % modulus, ch) for ch in alphabet))
+
+
+def _stream_key(residues: Sequence[int], moduli: Sequence[int]) -> int:
+    """Mixed-radix index of a residue tuple, or -1 if some residue is out of range."""
+    key = 0
+    for residue, modulus in zip(residues, moduli):
+        if not 0 <= residue < modulus:
+            return -1
+        key = key * modulus + residue
+    return key
+
+
+@lru_cache(maxsize=None)
+def stream_table(
+    multiplier: int = STREAM_MULTIPLIER,
+    moduli: Tuple[int, ...] = STREAM_MODULI,
+    alphabet: str = PRINTABLE,
+) -> LookupTable:
+    """Key the residue tuple ``(ord(ch) * multiplier) % m`` over ``moduli``, the puzzle2 streams at index 0."""
+    size = 1
+    for modulus in moduli:
+        size *= modulus
+    keyed = (
+        (_stream_key([(ord(ch) * multiplier) % modulus for modulus in moduli], moduli), ch)
+        for ch in alphabet
+    )
+    return _group(size, keyed)
+
+
+@lru_cache(maxsize=None)
+def interleave_order(length: int) -> Tuple[int, ...]:
+    """``order[i]`` is the original position of the i-th garbled character (puzzle3)."""
+    return tuple(range(0, length, 2)) + tuple(range(1, length, 2))[::-1]
+
+
+def decode_offsets(
+    garble: Sequence[int],
+    modulus: int = OFFSET_MODULUS,
+    alphabet: str = PRINTABLE,
+) -> Candidates:
+    """Candidate characters per position for a puzzle1-style garble."""
+    table = offset_table(modulus, alphabet).candidates
+    return [table[(value - idx) % modulus] for idx, value in enumerate(garble)]
+
+
+def decode_streams(
+    streams: Dict[str, Sequence[int]],
+    multiplier: int = STREAM_MULTIPLIER,
+    moduli: Tuple[int, ...] = STREAM_MODULI,
+    alphabet: str = PRINTABLE,
+) -> Candidates:
+    """Candidate characters per position for a puzzle2-style garble.
+
+    ``streams`` maps the names in ``STREAM_NAMES`` to equally long lists, one
+    per modulus. Positions whose residues no character produces get "".
+    """
+    table = stream_table(multiplier, moduli, alphabet).candidates
+    columns = [streams[name] for name in STREAM_NAMES[: len(moduli)]]
+    decoded = []
+    for idx, values in enumerate(zip(*columns)):
+        key = _stream_key([value - idx for value in values], moduli)
+        decoded.append(table[key] if key >= 0 else "")
+    return decoded
+
+
+def decode_interleave(garbled: str) -> str:
+    """Undo a puzzle3-style split-and-reverse interleave."""
+    text = [""] * len(garbled)
+    for ch, position in zip(garbled, interleave_order(len(garbled))):
+        text[position] = ch
+    return "".join(text)
+
+
+def resolve(candidates: Candidates) -> Optional[str]:
+    """The decoded string if every position has exactly one candidate, else None."""
+    if all(len(chars) == 1 for chars in candidates):
+        return "".join(candidates)
+    return None
+
+
+def _by_length(items: Sequence[Sequence[object]]) -> Dict[int, List[int]]:
+    groups: Dict[int, List[int]] = {}
+    for index, item in enumerate(items):
+        groups.setdefault(len(item), []).append(index)
+    return groups
+
+
+def _gather(table: LookupTable, keys: "np.ndarray") -> List[Candidates]:
+    """Look up a 2-D array of keys (-1 = no candidates) and return the candidate rows."""
+    distinct, ids = table.ids()
+    distinct = distinct + ("",)
+    lookup = np.array(ids + [len(distinct) - 1], dtype=np.int64)
+    gathered = lookup[keys]
+    return [[distinct[value] for value in row] for row in gathered.tolist()]
+
+
+def decode_offsets_batch(
+    garbles: Sequence[Sequence[int]],
+    modulus: int = OFFSET_MODULUS,
+    alphabet: str = PRINTABLE,
+) -> List[Candidates]:
+    """``decode_offsets`` for many garbles, vectorized per length when numpy is available."""
+    if np is None:
+        return [decode_offsets(garble, modulus, alphabet) for garble in garbles]
+    table = offset_table(modulus, alphabet)
+    decoded: List[Candidates] = [[] for _ in garbles]
+    for length, members in _by_length(garbles).items():
+        values = np.array([garbles[index] for index in members], dtype=np.int64).reshape(len(members), length)
+        keys = (values - np.arange(length, dtype=np.int64)) % modulus
+        for index, row in zip(members, _gather(table, keys)):
+            decoded[index] = row
+    return decoded
+
+
+def decode_streams_batch(
+    batch: Sequence[Dict[str, Sequence[int]]],
+    multiplier: int = STREAM_MULTIPLIER,
+    moduli: Tuple[int, ...] = STREAM_MODULI,
+    alphabet: str = PRINTABLE,
+) -> List[Candidates]:
+    """``decode_streams`` for many garbles, vectorized per length when numpy is available."""
+    if np is None:
+        return [decode_streams(streams, multiplier, moduli, alphabet) for streams in batch]
+    table = stream_table(multiplier, moduli, alphabet)
+    names = STREAM_NAMES[: len(moduli)]
+    decoded: List[Candidates] = [[] for _ in batch]
+    for length, members in _by_length([batch[index][names[0]] for index in range(len(batch))]).items():
+        offsets = np.arange(length, dtype=np.int64)
+        keys = np.zeros((len(members), length), dtype=np.int64)
+        valid = np.ones((len(members), length), dtype=bool)
+        for name, modulus in zip(names, moduli):
+            residues = np.array([batch[index][name] for index in members], dtype=np.int64).reshape(len(members), length)
+            residues -= offsets
+            valid &= (residues >= 0) & (residues < modulus)
+            keys = keys * modulus + residues
+        keys[~valid] = -1
+        for index, row in zip(members, _gather(table, keys)):
+            decoded[index] = row
+    return decoded
+
+
+def decode_interleave_batch(garbled: Sequence[str]) -> List[str]:
+    """``decode_interleave`` for many strings, one inverse permutation per length."""
+    if np is None:
+        return [decode_interleave(text) for text in garbled]
+    decoded: List[str] = ["" for _ in garbled]
+    for length, members in _by_length(garbled).items():
+        inverse = np.empty(length, dtype=np.int64)
+        inverse[list(interleave_order(length))] = np.arange(length)
+        codes = np.frombuffer("".join(garbled[index] for index in members).encode("utf-32-le"), dtype=np.uint32)
+        restored = codes.reshape(len(members), length)[:, inverse]
+        for index, row in zip(members, restored):
+            decoded[index] = row.tobytes().decode("utf-32-le")
+    return decoded
+
+
+def load_garble(path: Path) -> object:
+    """The ``GARBLE`` constant of a puzzle file."""
+    spec = importlib.util.spec_from_file_location(path.stem, path)
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.GARBLE
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Decode the GARBLE data of the 05 puzzles")
+    parser.add_argument(
+        "--alphabet",
+        choices=("printable", "lowercase"),
+        default="lowercase",
+        help="Characters the hidden sentences may use",
+    )
+    args = parser.parse_args(argv)
+
+    alphabet = LOWERCASE if args.alphabet == "lowercase" else PRINTABLE
+    here = Path(__file__).resolve().parent
+    puzzles = [
+        ("puzzle1", decode_offsets(load_garble(here / "puzzle1.py"), alphabet=alphabet)),  # type: ignore[arg-type]
+        ("puzzle2", decode_streams(load_garble(here / "puzzle2.py"), alphabet=alphabet)),  # type: ignore[arg-type]
+        ("puzzle3", list(decode_interleave(load_garble(here / "puzzle3.py")))),  # type: ignore[arg-type]
+    ]
+    for name, candidates in puzzles:
+        decoded = resolve(candidates)
+        if decoded is not None:
+            print(f"{name}: {decoded!r}")
+        else:
+            ambiguous = sum(len(chars) != 1 for chars in candidates)
+            print(f"{name}: {ambiguous} of {len(candidates)} positions are ambiguous")
+            for idx, chars in enumerate(candidates):
+                print(f"  {idx:3d}: {chars!r}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,290 @@
+"""Generate fresh 05 puzzle sets from a corpus of sentences.
+
+Every candidate sentence is garbled with the ``garble`` function of each
+puzzle and decoded again under the hint the puzzles state (lowercase letters
+and spaces only), which gives a lattice of candidate characters per position.
+An instance is accepted when the sentence is the only decoding in that lattice
+made entirely of known words, single-spaced. The count is exact: a dynamic
+program over positions and word prefixes adds up every such decoding, so no
+language model or score margin is involved.
+
+Known words are the ranker's word list (system list or standard library words)
+plus ``FALLBACK_WORDS`` and the sentence's own words; a larger vocabulary only
+makes the check stricter. ``puzzle3`` is a permutation, so its lattice has one
+character per position, but it is counted the same way and additionally
+rejected when the garble leaves the sentence unchanged.
+
+Accepted sentences are dealt into sets of three (one per puzzle, no sentence
+used twice) and written as ready-to-ship folders::
+
+    <out>/variant-0001/puzzle1.py   puzzle2.py   puzzle3.py
+    <out>/variant-0001/answers.json  {"answers": [...], "decodings": [1, 1, 1]}
+
+``VEST_05_ANSWERS=<out>/variant-0001/answers.json python3 evaluate.py --problem 05``
+judges a solution against that set instead of the shipped puzzles.
+"""
+
+from __future__ import annotations
+
+import argparse
+import collections
+import itertools
+import json
+import random
+import re
+import sys
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import AbstractSet, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import puzzle1
+import puzzle2
+import puzzle3
+from ranker import FALLBACK_WORDS, load_words
+from ungarble import LOWERCASE, decode_interleave_batch, decode_offsets_batch, decode_streams_batch
+
+HERE = Path(__file__).resolve().parent
+PUZZLES = ("puzzle1", "puzzle2", "puzzle3")
+MIN_LENGTH = 12
+MAX_LENGTH = 60
+CHUNK_SIZE = 256
+# Counting stops here; two decodings are enough to reject an instance.
+COUNT_LIMIT = 2
+SINGLE_LETTER_WORDS = ("a", "i")
+GARBLE_LINE = re.compile(r"^GARBLE = .*?(?=\n\n#)", re.MULTILINE | re.DOTALL)
+
+_vocabulary: Optional["Vocabulary"] = None
+
+
+@dataclass
+class Verdict:
+    """Whether ``sentence`` makes a unique instance of each puzzle, with the decoding counts."""
+
+    sentence: str
+    accepted: List[bool] = field(default_factory=lambda: [False, False, False])
+    decodings: List[int] = field(default_factory=lambda: [0, 0, 0])
+
+
+class Vocabulary:
+    """Known words and all of their prefixes, optionally extending another vocabulary."""
+
+    def __init__(self, words: Iterable[str], parent: Optional["Vocabulary"] = None) -> None:
+        self.words: AbstractSet[str] = frozenset(words)
+        self.prefixes: AbstractSet[str] = frozenset(word[:end] for word in self.words for end in range(1, len(word)))
+        self.parent = parent
+
+    @classmethod
+    def default(cls) -> "Vocabulary":
+        """The ranker's word list plus ``FALLBACK_WORDS``, lowercased, letters only.
+
+        Word lists and source code are full of single letters; only "a" and
+        "i" are English words, and any other would make nearly every lattice
+        ambiguous.
+        """
+        words = {word.lower() for word in itertools.chain(load_words(), FALLBACK_WORDS)}
+        return cls(
+            word
+            for word in words
+            if (len(word) > 1 or word in SINGLE_LETTER_WORDS) and all(ch in LOWERCASE[1:] for ch in word)
+        )
+
+    def is_word(self, text: str) -> bool:
+        return text in self.words or (self.parent is not None and self.parent.is_word(text))
+
+    def is_prefix(self, text: str) -> bool:
+        return (
+            text in self.prefixes
+            or text in self.words
+            or (self.parent is not None and self.parent.is_prefix(text))
+        )
+
+
+def count_decodings(candidates: Sequence[str], vocabulary: Vocabulary, limit: int = COUNT_LIMIT) -> int:
+    """Number of single-spaced sentences of known words the lattice allows, capped at ``limit``.
+
+    The state after each position is the partial word being spelled; states
+    that no known word continues are dropped, so the work stays proportional
+    to the live prefixes rather than to the size of the lattice.
+    """
+    states: Dict[str, int] = {"": 1}
+    for chars in candidates:
+        following: Dict[str, int] = {}
+        for prefix, ways in states.items():
+            for ch in chars:
+                if ch == " ":
+                    if not prefix or not vocabulary.is_word(prefix):
+                        continue
+                    key = ""
+                else:
+                    key = prefix + ch
+                    if not vocabulary.is_prefix(key):
+                        continue
+                following[key] = min(limit, following.get(key, 0) + ways)
+        if not following:
+            return 0
+        states = following
+    total = sum(ways for prefix, ways in states.items() if prefix and vocabulary.is_word(prefix))
+    return min(limit, total)
+
+
+def normalize(line: str) -> Optional[str]:
+    """``line`` in the puzzles' alphabet with single spaces, or None if it does not fit."""
+    sentence = " ".join(line.lower().split())
+    if not MIN_LENGTH <= len(sentence) <= MAX_LENGTH or any(ch not in LOWERCASE for ch in sentence):
+        return None
+    return sentence
+
+
+def synthetic_sentences(count: int, seed: int = 0) -> Iterator[str]:
+    """Random three- to seven-word sentences from the ranker's built-in vocabulary."""
+    rng = random.Random(seed)
+    for _ in range(count):
+        yield " ".join(rng.choice(FALLBACK_WORDS) for _ in range(rng.randint(3, 7)))
+
+
+def check_chunk(sentences: List[str]) -> List[Verdict]:
+    """Garble ``sentences`` with every puzzle and count the known-word decodings of each."""
+    global _vocabulary
+    if _vocabulary is None:
+        _vocabulary = Vocabulary.default()
+    garbled3 = [puzzle3.garble(text) for text in sentences]
+    offsets = decode_offsets_batch([puzzle1.garble(text) for text in sentences], alphabet=LOWERCASE)
+    streams = decode_streams_batch([puzzle2.garble(text) for text in sentences], alphabet=LOWERCASE)
+    interleaved = decode_interleave_batch(garbled3)
+    verdicts = []
+    for text, garbled, offset_candidates, stream_candidates, restored in zip(
+        sentences, garbled3, offsets, streams, interleaved
+    ):
+        verdict = Verdict(text)
+        vocabulary = Vocabulary(text.split(), _vocabulary)
+        for index, candidates in enumerate((offset_candidates, stream_candidates, list(restored))):
+            verdict.decodings[index] = count_decodings(candidates, vocabulary)
+            verdict.accepted[index] = verdict.decodings[index] == 1
+        # A garble that leaves the sentence readable as is would give the answer away.
+        verdict.accepted[2] = verdict.accepted[2] and restored == text and garbled != text
+        verdicts.append(verdict)
+    return verdicts
+
+
+def _chunks(items: Iterable[str], size: int) -> Iterator[List[str]]:
+    iterator = iter(items)
+    while True:
+        chunk = list(itertools.islice(iterator, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def check_sentences(sentences: Iterable[str], jobs: int = 1) -> Iterator[Verdict]:
+    """``check_chunk`` over a stream of sentences, spread across ``jobs`` processes.
+
+    Verdicts come back in input order. At most ``2 * jobs`` chunks are in flight,
+    so a huge corpus is never loaded at once and stopping early wastes little work.
+    """
+    chunks = _chunks(sentences, CHUNK_SIZE)
+    if jobs <= 1:
+        for chunk in chunks:
+            yield from check_chunk(chunk)
+        return
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        pending: "collections.deque[Future[List[Verdict]]]" = collections.deque()
+        try:
+            for chunk in chunks:
+                pending.append(pool.submit(check_chunk, chunk))
+                if len(pending) >= 2 * jobs:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def deal_variants(verdicts: Iterable[Verdict], count: int) -> List[List[Verdict]]:
+    """Fill up to ``count`` sets of three, one accepted sentence per puzzle, none reused."""
+    slots: List[List[Verdict]] = [[], [], []]
+    for verdict in verdicts:
+        # Each sentence fills the emptiest puzzle it qualifies for.
+        open_slots = [index for index in range(3) if verdict.accepted[index] and len(slots[index]) < count]
+        if open_slots:
+            slots[min(open_slots, key=lambda index: len(slots[index]))].append(verdict)
+        if all(len(slot) >= count for slot in slots):
+            break
+    return [list(group) for group in zip(*slots)]
+
+
+def render_puzzle(name: str, sentence: str) -> str:
+    """The source of puzzle ``name`` with ``GARBLE`` recomputed for ``sentence``."""
+    source = (HERE / f"{name}.py").read_text()
+    if name == "puzzle1":
+        garble = f"GARBLE = {puzzle1.garble(sentence)}"
+    elif name == "puzzle2":
+        streams = puzzle2.garble(sentence)
+        body = "".join(f'    "{key}": {values},\n' for key, values in streams.items())
+        garble = "GARBLE = {\n" + body + "}"
+    else:
+        garble = f"GARBLE = {json.dumps(puzzle3.garble(sentence))}"
+    rendered, replaced = GARBLE_LINE.subn(garble, source, count=1)
+    if not replaced:
+        raise ValueError(f"No GARBLE assignment found in {name}.py")
+    return rendered
+
+
+def write_variant(out_dir: Path, number: int, group: Sequence[Verdict]) -> Path:
+    folder = out_dir / f"variant-{number:04d}"
+    folder.mkdir(parents=True, exist_ok=True)
+    answers = [verdict.sentence for verdict in group]
+    decodings = [verdict.decodings[index] for index, verdict in enumerate(group)]
+    for name, sentence in zip(PUZZLES, answers):
+        (folder / f"{name}.py").write_text(render_puzzle(name, sentence))
+    metadata = {"answers": answers, "decodings": decodings}
+    (folder / "answers.json").write_text(json.dumps(metadata, indent=2) + "\n")
+    return folder
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Generate fresh 05 puzzle sets with unique answers")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--corpus", type=Path, help="Text file with one candidate sentence per line")
+    source.add_argument("--synthetic", type=int, metavar="N", help="Try N random sentences from the built-in vocabulary")
+    parser.add_argument("--out", type=Path, required=True, help="Directory to write variant folders into")
+    parser.add_argument("--count", type=int, default=10, help="Number of puzzle sets to emit")
+    parser.add_argument("--jobs", type=int, default=1, help="Worker processes")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.corpus is not None:
+        lines: Iterable[str] = args.corpus.read_text(errors="ignore").splitlines()
+    else:
+        lines = synthetic_sentences(args.synthetic, args.seed)
+    seen = set()
+    sentences = (
+        sentence
+        for sentence in map(normalize, lines)
+        if sentence is not None and not (sentence in seen or seen.add(sentence))
+    )
+
+    checked = 0
+    accepted = [0, 0, 0]
+
+    def counted(verdicts: Iterable[Verdict]) -> Iterator[Verdict]:
+        nonlocal checked
+        for verdict in verdicts:
+            checked += 1
+            for index in range(3):
+                accepted[index] += verdict.accepted[index]
+            yield verdict
+
+    groups = deal_variants(counted(check_sentences(sentences, args.jobs)), args.count)
+    for number, group in enumerate(groups, start=1):
+        write_variant(args.out, number, group)
+    print(
+        f"checked {checked} sentences · unique for puzzle1/2/3: {accepted[0]}/{accepted[1]}/{accepted[2]} · "
+        f"wrote {len(groups)} of {args.count} variants to {args.out}"
+    )
+    return 0 if len(groups) == args.count else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,22 +1,80 @@
 from __future__ import annotations
 
+import _thread
 import argparse
+import codecs
+import itertools
 import json
+import math
 import os
-import random
-import subprocess
+import signal
 import sys
 import time
-import ssl
-from dataclasses import dataclass, field
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import asdict, dataclass, field, replace
 from pathlib import Path
-from typing import Callable, Dict, Iterable, List, Optional, Tuple, cast
-from urllib import request, error
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
+
+# asyncio, concurrent.futures, hashlib, http.client, ssl, pstats and statistics
+# cost more to import than a cached run takes, and subprocess, threading, queue,
+# selectors, resource, mmap, struct, random and re are only needed to run or
+# generate tests, so the functions that need them import them.
+if TYPE_CHECKING:
+    import asyncio
+    import http.client
+    import mmap
+    import queue
+    import subprocess
+    import threading
+    from concurrent.futures import ThreadPoolExecutor
 
 PROFILE_PATH = Path(".profile")
 RESULTS_DIR = Path("results")
-RESULTS_DIR.mkdir(exist_ok=True)
 LATEST_RESULTS_PATH = RESULTS_DIR / "latest.json"
+CACHE_DIR = RESULTS_DIR / "cache"
+HISTORY_PATH = RESULTS_DIR / "history.json"
+PROFILES_DIR = RESULTS_DIR / "profiles"
+PROFILE_MODES = ("sample", "cprofile")
+PROFILE_SAMPLE_INTERVAL = 0.001
+PROFILE_TOP_FUNCTIONS = 5
+CACHE_MAX_BYTES = 4 * 1024 * 1024
+CACHE_FORMAT = 3
+VERIFY_MODES = ("auto", "exact", "probabilistic")
+FREIVALDS_ERROR_BOUND = 1e-9
+NUMPY_PRODUCT_MIN_SIZE = 16
+FREIVALDS_MIN_SIZE = 64
+INT64_LIMIT = 2**63 - 1
+BENCHMARK_BASELINE_PATH = RESULTS_DIR / "benchmark_baseline.json"
+BENCHMARK_LATEST_PATH = RESULTS_DIR / "benchmark_latest.json"
+BENCHMARK_MIN_SLOWDOWN = 0.05
+BENCHMARK_MIN_DELTA = 0.001
+TIMEOUT_SAFETY_FACTOR = 3.0
+OUTBOX_DIR = RESULTS_DIR / "outbox"
+DEFAULT_SCOREBOARD_URL = "https://vest-puzzles-scoreboard.vercel.app/api/submit"
+SUBMIT_TIMEOUT = 5.0
+SUBMIT_ATTEMPTS = 3
+SUBMIT_BACKOFF = 0.5
+SUBMIT_RETRY_CAP = 3600.0
+SUBMIT_JOIN_TIMEOUT = 3.0
+TIERS = ("standard", "stress")
+STREAM_CHUNK_BYTES = 64 * 1024
+LEADER_POLL_INTERVAL = 0.1
+DEADLINE_MESSAGE = "Skipped: global deadline exceeded"
+STDERR_TAIL_CHUNKS = 16
+MEMORY_ERROR_MARKERS = ("MemoryError", "std::bad_alloc", "Cannot allocate memory", "out of memory")
+PERSISTENT_MARKER = r"^#\s*vest:\s*persistent\s*$"
+PERSISTENT_ENV = "VEST_PERSISTENT"
+VARIANT_ANSWERS_ENV = "VEST_05_ANSWERS"
+INSTANCES_DIR = RESULTS_DIR / "instances"
+SIDECAR_FORMAT = 1
+SIDECAR_CHUNK_VALUES = 1 << 16
+TWO_SUM_HEADER = "<qq"
+TWO_SUM_HEADER_SIZE = 16
+TWO_SUM_STRESS_CONFIGS: List[Tuple[int, int]] = [(200, 7070), (100_000, 7071), (1_000_000, 7072), (10_000_000, 7073)]
+TWO_SUM_STRESS_BOUND = 10**9
+MASK64 = (1 << 64) - 1
+GOLDEN64 = 0x9E3779B97F4A7C15
 
 
 @dataclass
@@ -24,6 +82,14 @@ class TestCase:
     name: str
     input_data: str
     metadata: Dict[str, object] = field(default_factory=dict)
+    stream: Optional[Callable[[], Iterable[str]]] = None
+    sidecar: Optional[Path] = None
+
+    def iter_input(self) -> Iterable[str]:
+        """Yield the input in chunks; streamed cases are generated on demand."""
+        if self.stream is not None:
+            return self.stream()
+        return [self.input_data]
 
 
 @dataclass
@@ -34,6 +100,60 @@ class ProblemResult:
     passed: int
     total: int
     elapsed: float
+    tests: List[Dict[str, object]] = field(default_factory=list)
+
+
+@dataclass
+class ResourceUsage:
+    wall: float
+    user_cpu: Optional[float] = None
+    sys_cpu: Optional[float] = None
+    max_rss_kb: Optional[int] = None
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+@dataclass
+class TestOutcome:
+    name: str
+    ok: bool
+    message: str
+    elapsed: float
+    usage: Optional[ResourceUsage] = None
+    verdict: str = "AC"
+
+
+@dataclass(frozen=True)
+class ResourceLimits:
+    """Caps applied with ``ulimit`` to ``run.sh`` and every process it starts.
+
+    Each process gets its own copy of the limits. ``cpu_seconds`` defaults to the
+    problem timeout; ``output_bytes`` bounds stdout as well as files written.
+    Any field set to 0 leaves that resource unlimited.
+    """
+
+    address_space_mb: int = 4096
+    cpu_seconds: Optional[float] = None
+    open_files: int = 256
+    output_bytes: int = 64 * 1024 * 1024
+
+
+class LimitExceeded(RuntimeError):
+    """A solver hit one of its resource limits; ``verdict`` names which one."""
+
+    verdict = "RE"
+
+
+class MemoryLimitExceeded(LimitExceeded):
+    verdict = "MLE"
+
+
+class OutputLimitExceeded(LimitExceeded):
+    verdict = "OLE"
+
+
+class CpuLimitExceeded(LimitExceeded):
+    verdict = "TLE"
 
 
 @dataclass
@@ -45,6 +165,86 @@ class ProblemSpec:
     verifier: Callable[[TestCase, str, float], tuple[bool, str]]
     timeout: float
     weight: float
+    verifier_version: int = 1
+    stress_generator: Optional[Callable[[], Iterable[TestCase]]] = None
+    stream_verifier: Optional[Callable[[TestCase], "StreamVerifier"]] = None
+    max_parallel: Optional[int] = None
+    limits: ResourceLimits = field(default_factory=ResourceLimits)
+    stress_timeout: Optional[float] = None
+    cache_params: Optional[Callable[[], object]] = None
+    stress_cache_params: Optional[Callable[[], object]] = None
+
+    def for_tier(self, tier: str) -> Optional["ProblemSpec"]:
+        """This spec with the generator (and timeout) for ``tier``, or None if it has no such tests."""
+        if tier == "standard":
+            return self
+        if self.stress_generator is None:
+            return None
+        return replace(
+            self,
+            generator=self.stress_generator,
+            timeout=self.stress_timeout or self.timeout,
+            cache_params=self.stress_cache_params,
+        )
+
+
+ProblemFactory = Callable[[str, str], ProblemSpec]
+
+
+class ProblemRegistry:
+    """Problem IDs and names, registered up front; each ``ProblemSpec`` is built on first lookup.
+
+    Argument parsing and ``--list`` only need the IDs and names, so they build no
+    spec at all, and a single-problem run builds just the one it judges.
+    """
+
+    def __init__(self) -> None:
+        self._factories: Dict[str, Tuple[str, ProblemFactory]] = {}
+        self._specs: Dict[str, ProblemSpec] = {}
+
+    def register(self, pid: str, name: str) -> Callable[[ProblemFactory], ProblemFactory]:
+        """Decorator registering ``factory(pid, name)`` as the builder of problem ``pid``."""
+
+        def decorator(factory: ProblemFactory) -> ProblemFactory:
+            self._factories[pid] = (name, factory)
+            return factory
+
+        return decorator
+
+    def keys(self) -> List[str]:
+        return sorted(self._factories)
+
+    def name(self, pid: str) -> str:
+        return self._factories[pid][0]
+
+    def __contains__(self, pid: object) -> bool:
+        return pid in self._factories
+
+    def __getitem__(self, pid: str) -> ProblemSpec:
+        if pid not in self._specs:
+            name, factory = self._factories[pid]
+            self._specs[pid] = factory(pid, name)
+        return self._specs[pid]
+
+
+class StreamVerifier(ABC):
+    """Checks a solver's stdout chunk by chunk while it is still running.
+
+    ``feed`` returns False once the output is known to be wrong, which lets the
+    runner stop the solver early; ``finish`` delivers the verdict.
+    """
+
+    @abstractmethod
+    def feed(self, chunk: str) -> bool:
+        """Consume the next chunk of stdout; False once the output is known to be wrong."""
+
+    @abstractmethod
+    def finish(self, elapsed: float) -> tuple[bool, str]:
+        """The verdict once stdout is closed."""
+
+    def verify(self, stdout: str, elapsed: float) -> tuple[bool, str]:
+        self.feed(stdout)
+        return self.finish(elapsed)
 
 
 def ensure_team_profile() -> str:
@@ -57,60 +257,762 @@ def ensure_team_profile() -> str:
     return team_name
 
 
-def run_script(folder: Path, timeout: float, input_data: str, extra_env: Optional[Dict[str, str]] = None) -> tuple[str, float]:
+def _feed_stdin(
+    proc: subprocess.Popen,
+    chunks: Iterable[str],
+    written: List[int],
+    errors: List[BaseException],
+) -> None:
+    stdin = proc.stdin
+    assert stdin is not None
+    try:
+        for chunk in chunks:
+            data = chunk.encode()
+            stdin.write(data)
+            written[0] += len(data)
+    except (BrokenPipeError, ValueError):
+        pass
+    except Exception as exc:  # pylint: disable=broad-except
+        errors.append(exc)
+    finally:
+        try:
+            stdin.close()
+        except (BrokenPipeError, OSError):
+            pass
+
+
+def _reap(proc: subprocess.Popen, deadline: Optional[float] = None) -> Optional[object]:
+    """Wait for ``proc`` with ``os.wait4`` and return its rusage.
+
+    Returns None if ``deadline`` (a ``time.monotonic`` value) passes first. The
+    rusage covers the child and every descendant it waited for.
+    """
+    delay = 0.0005
+    while True:
+        pid, status, usage = os.wait4(proc.pid, 0 if deadline is None else os.WNOHANG)
+        if pid:
+            proc.returncode = os.waitstatus_to_exitcode(status)
+            return usage
+        if deadline is not None and time.monotonic() >= deadline:
+            return None
+        time.sleep(delay)
+        delay = min(delay * 2, 0.01)
+
+
+def _run_command(limits: Optional[ResourceLimits], cpu_seconds: Optional[float]) -> List[str]:
+    """The ``bash`` command line that runs ``./run.sh`` under ``limits`` as hard limits.
+
+    The limits are set with ``ulimit`` in the shell, which then execs
+    ``run.sh``, rather than in a ``preexec_fn``: solvers are started from worker
+    threads, and running Python between fork and exec can deadlock the child
+    on a lock another thread held at fork time. Values are clamped to the
+    evaluator's own hard limits, which the shell could not raise.
+    """
+    if limits is None:
+        return ["bash", "-lc", "./run.sh"]
+    import resource  # pylint: disable=import-outside-toplevel
+
+    # (ulimit flag, limit, units per ulimit value); bash counts -v and -f in KiB.
+    wanted = [
+        ("-v", resource.RLIMIT_AS, limits.address_space_mb * 1024 * 1024, 1024),
+        ("-t", resource.RLIMIT_CPU, math.ceil(cpu_seconds) if cpu_seconds else 0, 1),
+        ("-n", resource.RLIMIT_NOFILE, limits.open_files, 1),
+        ("-f", resource.RLIMIT_FSIZE, limits.output_bytes, 1024),
+    ]
+    steps: List[str] = []
+    for flag, which, value, unit in wanted:
+        if value <= 0:
+            continue
+        _, hard = resource.getrlimit(which)
+        if hard != resource.RLIM_INFINITY:
+            value = min(value, hard)
+        value = max(1, value // unit)
+        if which == resource.RLIMIT_CPU:
+            # The soft CPU limit delivers SIGXCPU; the hard one a second later is a SIGKILL.
+            # The soft limit goes first, since a hard limit below the current soft one is refused.
+            steps.append(f"ulimit -S {flag} {value} && ulimit -H {flag} {value + 1}")
+        else:
+            steps.append(f"ulimit {flag} {value}")
+    return ["bash", "-lc", " && ".join([*steps, "exec ./run.sh"])]
+
+
+def _drain_stderr(proc: subprocess.Popen, sink: List[bytes]) -> None:
+    """Read stderr until EOF, keeping only the last ``STDERR_TAIL_CHUNKS`` chunks."""
+    reader = proc.stderr
+    assert reader is not None
+    for chunk in iter(lambda: reader.read1(STREAM_CHUNK_BYTES), b""):
+        sink.append(chunk)
+        if len(sink) > STDERR_TAIL_CHUNKS:
+            del sink[0]
+
+
+def _exit_error(
+    label: str,
+    folder: Path,
+    returncode: int,
+    stderr: str,
+    limits: Optional[ResourceLimits],
+    cpu_seconds: Optional[float],
+    usage: Optional[ResourceUsage] = None,
+) -> RuntimeError:
+    """Turn a failed exit into the matching verdict, falling back to a plain RuntimeError."""
+    stderr = stderr.strip()
+    signals = {-returncode, returncode - 128}
+    if limits is not None:
+        cpu_used = (usage.user_cpu or 0.0) + (usage.sys_cpu or 0.0) if usage is not None else 0.0
+        if cpu_seconds and (
+            signal.SIGXCPU in signals or (signal.SIGKILL in signals and cpu_used >= cpu_seconds)
+        ):
+            return CpuLimitExceeded(f"{label} exceeded the {math.ceil(cpu_seconds)}s CPU limit in {folder}.")
+        if limits.output_bytes and signal.SIGXFSZ in signals:
+            return OutputLimitExceeded(
+                f"{label} wrote a file larger than {limits.output_bytes} bytes in {folder}."
+            )
+        if limits.address_space_mb and any(marker in stderr for marker in MEMORY_ERROR_MARKERS):
+            return MemoryLimitExceeded(
+                f"{label} exceeded the {limits.address_space_mb} MiB memory limit in {folder}.\nSTDERR:\n{stderr}"
+            )
+    return RuntimeError(f"{label} exited with {returncode} in {folder}.\nSTDERR:\n{stderr}")
+
+
+def _kill_group(proc: subprocess.Popen) -> None:
+    """SIGKILL the process group led by ``proc`` (it was started in its own session)."""
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def _kill(proc: subprocess.Popen) -> None:
+    _kill_group(proc)
+    if proc.returncode is None:
+        _reap(proc)
+
+
+class ProcessRegistry:
+    """Tracks live solver processes so they can all be killed at a global deadline.
+
+    Once ``kill_all`` has run, newly registered processes are killed right away.
+    """
+
+    def __init__(self) -> None:
+        # The lock type behind threading.Lock, without importing threading for runs that start no solver.
+        self._lock = _thread.allocate_lock()
+        self._procs: Dict[int, subprocess.Popen] = {}
+        self.closed = False
+
+    def register(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs[proc.pid] = proc
+            closed = self.closed
+        if closed:
+            _kill_group(proc)
+
+    def unregister(self, proc: subprocess.Popen) -> None:
+        with self._lock:
+            self._procs.pop(proc.pid, None)
+
+    def kill_all(self) -> None:
+        with self._lock:
+            self.closed = True
+            procs = list(self._procs.values())
+        for proc in procs:
+            _kill_group(proc)
+
+    def reset(self) -> None:
+        with self._lock:
+            self.closed = False
+
+
+LIVE_PROCESSES = ProcessRegistry()
+
+
+def _usage_from_rusage(rusage: object, wall: float, bytes_in: int, bytes_out: int) -> ResourceUsage:
+    max_rss = int(getattr(rusage, "ru_maxrss"))
+    if sys.platform == "darwin":
+        max_rss //= 1024
+    return ResourceUsage(
+        wall=wall,
+        user_cpu=float(getattr(rusage, "ru_utime")),
+        sys_cpu=float(getattr(rusage, "ru_stime")),
+        max_rss_kb=max_rss,
+        bytes_in=bytes_in,
+        bytes_out=bytes_out,
+    )
+
+
+def run_script(
+    folder: Path,
+    timeout: float,
+    input_data: Union[str, Iterable[str]],
+    extra_env: Optional[Dict[str, str]] = None,
+    sink: Optional[StreamVerifier] = None,
+    limits: Optional[ResourceLimits] = None,
+) -> tuple[str, float, ResourceUsage]:
+    """Run ``folder/run.sh`` on ``input_data`` and return its stdout, wall time and usage.
+
+    ``input_data`` may be a string or an iterable of string chunks; chunks are
+    written to the child from a background thread as they are produced. When a
+    ``sink`` is given, stdout is handed to it incrementally instead of being
+    collected, the returned stdout is empty, and the child is stopped as soon as
+    the sink rejects the output. Wall time is measured on a monotonic clock and
+    CPU time and peak RSS come from ``os.wait4``.
+
+    With ``limits``, the child runs under those rlimits and a limit that is hit
+    raises the matching ``LimitExceeded`` subclass instead of a plain
+    RuntimeError. Stdout beyond ``limits.output_bytes`` is never buffered.
+    """
+    import subprocess  # pylint: disable=import-outside-toplevel
+
     env = os.environ.copy()
     if extra_env:
         env.update(extra_env)
-    start = time.time()
-    proc = subprocess.run(
-        ["bash", "-lc", "./run.sh"],
+    chunks = [input_data] if isinstance(input_data, str) else input_data
+    cmd = _run_command(limits, (limits.cpu_seconds or timeout) if limits else None)
+    start = time.monotonic()
+    proc = subprocess.Popen(
+        cmd,
         cwd=str(folder),
-        input=input_data.encode(),
+        stdin=subprocess.PIPE,
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        timeout=timeout,
-        check=False,
         env=env,
+        start_new_session=True,
+    )
+    LIVE_PROCESSES.register(proc)
+    try:
+        return _drive_script(proc, cmd, folder, timeout, start, chunks, sink, limits)
+    finally:
+        _kill_group(proc)
+        LIVE_PROCESSES.unregister(proc)
+
+
+def _drive_script(
+    proc: subprocess.Popen,
+    cmd: List[str],
+    folder: Path,
+    timeout: float,
+    start: float,
+    chunks: Iterable[str],
+    sink: Optional[StreamVerifier],
+    limits: Optional[ResourceLimits],
+) -> tuple[str, float, ResourceUsage]:
+    import selectors  # pylint: disable=import-outside-toplevel
+    import subprocess  # pylint: disable=import-outside-toplevel
+    import threading  # pylint: disable=import-outside-toplevel
+
+    deadline = start + timeout
+    output_cap = limits.output_bytes if limits else 0
+    written = [0]
+    writer_errors: List[BaseException] = []
+    writer = threading.Thread(
+        target=_feed_stdin, args=(proc, chunks, written, writer_errors), daemon=True
     )
-    elapsed = time.time() - start
-    stdout = proc.stdout.decode(errors="ignore")
+    writer.start()
+    stderr_chunks: List[bytes] = []
+    stderr_reader = threading.Thread(target=_drain_stderr, args=(proc, stderr_chunks), daemon=True)
+    stderr_reader.start()
+
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="ignore")
+    collected: List[str] = []
+    bytes_out = 0
+    rejected = False
+    rusage: Optional[object] = None
+    assert proc.stdout is not None
+    stdout_fd = proc.stdout.fileno()
+    with selectors.DefaultSelector() as selector:
+        selector.register(stdout_fd, selectors.EVENT_READ)
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                _kill(proc)
+                raise subprocess.TimeoutExpired(cmd, timeout)
+            if not selector.select(min(remaining, LEADER_POLL_INTERVAL)):
+                if rusage is None:
+                    rusage = _reap(proc, deadline=0.0)
+                if rusage is not None:
+                    # run.sh has exited but a leftover descendant still holds stdout open.
+                    _kill_group(proc)
+                continue
+            data = os.read(stdout_fd, STREAM_CHUNK_BYTES)
+            bytes_out += len(data)
+            if output_cap and bytes_out > output_cap:
+                _kill(proc)
+                raise OutputLimitExceeded(f"run.sh wrote more than {output_cap} bytes of output in {folder}.")
+            text = decoder.decode(data, final=not data)
+            if sink is None:
+                collected.append(text)
+            elif text and not sink.feed(text):
+                rejected = True
+                proc.kill()
+                break
+            if not data:
+                break
+    if rusage is None:
+        rusage = _reap(proc, None if rejected else deadline)
+    if rusage is None:
+        _kill(proc)
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    elapsed = time.monotonic() - start
+    usage = _usage_from_rusage(rusage, elapsed, written[0], bytes_out)
+    if rejected:
+        return "", elapsed, usage
+    _kill_group(proc)
+    writer.join()
+    stderr_reader.join()
+    usage.bytes_in = written[0]
+    if writer_errors:
+        raise writer_errors[0]
     if proc.returncode != 0:
-        stderr = proc.stderr.decode(errors="ignore")
-        raise RuntimeError(
-            f"run.sh exited with {proc.returncode} in {folder}.\nSTDERR:\n{stderr.strip()}"
+        stderr = b"".join(stderr_chunks).decode(errors="ignore")
+        cpu_seconds = (limits.cpu_seconds or timeout) if limits else None
+        raise _exit_error("run.sh", folder, proc.returncode, stderr, limits, cpu_seconds, usage)
+    return "".join(collected), elapsed, usage
+
+
+def supports_persistent(folder: Path) -> bool:
+    """Return True if ``folder/run.sh`` opts into the persistent solver protocol."""
+    try:
+        script = (folder / "run.sh").read_text()
+    except OSError:
+        return False
+    import re  # pylint: disable=import-outside-toplevel
+
+    return bool(re.search(PERSISTENT_MARKER, script, re.MULTILINE))
+
+
+class PersistentSolver:
+    """A long-lived ``run.sh`` session that answers many test inputs.
+
+    A ``run.sh`` opts in with a ``# vest: persistent`` line. It is then started
+    once with ``VEST_PERSISTENT=1`` and must serve framed requests until stdin
+    closes: each input arrives as its byte length in ASCII decimal, a newline and
+    the payload, and each answer is written back in the same framing. A case that
+    times out or breaks the framing kills the session; the next case starts a
+    fresh one.
+
+    ``limits`` apply to the whole session, except the CPU limit, which would
+    otherwise be shared by every case the session answers.
+    """
+
+    def __init__(
+        self,
+        folder: Path,
+        extra_env: Optional[Dict[str, str]] = None,
+        limits: Optional[ResourceLimits] = None,
+    ) -> None:
+        import queue  # pylint: disable=import-outside-toplevel
+
+        self.folder = folder
+        self.extra_env = extra_env
+        self.limits = limits
+        self._proc: Optional[subprocess.Popen] = None
+        self._frames: "queue.Queue[Union[bytes, LimitExceeded, None]]" = queue.Queue()
+        self._stderr: List[bytes] = []
+
+    def _start(self) -> subprocess.Popen:
+        import queue  # pylint: disable=import-outside-toplevel
+        import subprocess  # pylint: disable=import-outside-toplevel
+        import threading  # pylint: disable=import-outside-toplevel
+
+        env = os.environ.copy()
+        if self.extra_env:
+            env.update(self.extra_env)
+        env[PERSISTENT_ENV] = "1"
+        proc = subprocess.Popen(
+            _run_command(self.limits, None),
+            cwd=str(self.folder),
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            env=env,
+            start_new_session=True,
         )
-    return stdout, elapsed
+        LIVE_PROCESSES.register(proc)
+        self._frames = queue.Queue()
+        self._stderr = []
+        output_cap = self.limits.output_bytes if self.limits else 0
+        threading.Thread(target=self._read_frames, args=(proc, self._frames, output_cap), daemon=True).start()
+        threading.Thread(target=_drain_stderr, args=(proc, self._stderr), daemon=True).start()
+        self._proc = proc
+        return proc
+
+    @staticmethod
+    def _read_frames(
+        proc: subprocess.Popen,
+        frames: "queue.Queue[Union[bytes, LimitExceeded, None]]",
+        output_cap: int,
+    ) -> None:
+        reader = proc.stdout
+        assert reader is not None
+        try:
+            while True:
+                header = reader.readline()
+                if not header:
+                    break
+                size = int(header.strip())
+                if output_cap and size > output_cap:
+                    frames.put(
+                        OutputLimitExceeded(f"persistent run.sh sent a {size}-byte answer, over the {output_cap}-byte limit.")
+                    )
+                    return
+                payload = reader.read(size)
+                if len(payload) != size:
+                    break
+                frames.put(payload)
+        except (OSError, ValueError):
+            pass
+        frames.put(None)
+
+    def solve(self, input_data: str, timeout: float) -> tuple[str, float, ResourceUsage]:
+        """Answer one input; CPU and memory are shared by the session and not reported."""
+        import queue  # pylint: disable=import-outside-toplevel
+        import subprocess  # pylint: disable=import-outside-toplevel
+
+        proc = self._proc if self._proc is not None and self._proc.poll() is None else self._start()
+        payload = input_data.encode()
+        start = time.monotonic()
+        try:
+            assert proc.stdin is not None
+            proc.stdin.write(str(len(payload)).encode() + b"\n" + payload)
+            proc.stdin.flush()
+            frame = self._frames.get(timeout=timeout)
+        except queue.Empty:
+            self._kill()
+            raise subprocess.TimeoutExpired(["bash", "-lc", "./run.sh"], timeout) from None
+        except BrokenPipeError:
+            frame = None
+        elapsed = time.monotonic() - start
+        if isinstance(frame, LimitExceeded):
+            self._kill()
+            raise frame
+        if frame is None:
+            returncode = proc.wait()
+            stderr = b"".join(self._stderr).decode(errors="ignore")
+            self._kill()
+            raise _exit_error("persistent run.sh", self.folder, returncode, stderr, self.limits, None)
+        usage = ResourceUsage(wall=elapsed, bytes_in=len(payload), bytes_out=len(frame))
+        return frame.decode(errors="ignore"), elapsed, usage
+
+    def _kill(self) -> None:
+        proc, self._proc = self._proc, None
+        if proc is None:
+            return
+        _kill_group(proc)
+        if proc.poll() is None:
+            proc.wait()
+        LIVE_PROCESSES.unregister(proc)
+
+    def close(self) -> None:
+        import subprocess  # pylint: disable=import-outside-toplevel
+
+        proc = self._proc
+        if proc is None:
+            return
+        if proc.poll() is None:
+            try:
+                assert proc.stdin is not None
+                proc.stdin.close()
+                proc.wait(timeout=1.0)
+            except (OSError, subprocess.TimeoutExpired):
+                pass
+        self._kill()
+
+
+def problem_cache_key(spec: ProblemSpec, verbose: bool) -> str:
+    """Hash everything that can change the verdict of ``spec``.
+
+    Covers every file in the problem folder (``run.sh`` included), the test
+    cases, the verifier version and the scoring parameters. Specs with
+    ``cache_params`` are keyed by those parameters instead of their generated
+    cases, so computing the key never writes sidecars.
+    """
+    import hashlib  # pylint: disable=import-outside-toplevel
+
+    digest = hashlib.sha256()
+    digest.update(
+        json.dumps(
+            [
+                CACHE_FORMAT,
+                spec.pid,
+                spec.verifier_version,
+                spec.timeout,
+                spec.weight,
+                verbose,
+                _verify_mode,
+                asdict(spec.limits),
+            ]
+        ).encode()
+    )
+    for path in sorted(spec.folder.rglob("*")):
+        if not path.is_file() or "__pycache__" in path.parts:
+            continue
+        digest.update(b"\0file\0" + path.relative_to(spec.folder).as_posix().encode() + b"\0")
+        digest.update(path.read_bytes())
+    if spec.cache_params is not None:
+        digest.update(b"\0params\0" + json.dumps(spec.cache_params(), sort_keys=True).encode())
+        return digest.hexdigest()
+    for test in spec.generator():
+        digest.update(b"\0test\0" + test.name.encode() + b"\0")
+        if test.sidecar is not None:
+            # Sidecars are named after everything that determines their contents.
+            digest.update(test.sidecar.name.encode())
+        else:
+            for chunk in test.iter_input():
+                digest.update(chunk.encode())
+        digest.update(json.dumps(test.metadata, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+class ResultCache:
+    """Size-bounded store of ``ProblemResult`` JSON files keyed by ``problem_cache_key``.
+
+    Entries are touched on every hit and the least recently used ones are
+    evicted once the directory grows past ``max_bytes``.
+    """
+
+    def __init__(self, directory: Path = CACHE_DIR, max_bytes: int = CACHE_MAX_BYTES) -> None:
+        self.directory = directory
+        self.max_bytes = max_bytes
+
+    def _path(self, pid: str, key: str) -> Path:
+        return self.directory / f"{pid}-{key}.json"
+
+    def get(self, pid: str, key: str) -> Optional[ProblemResult]:
+        path = self._path(pid, key)
+        try:
+            data = json.loads(path.read_text())
+            result = ProblemResult(**data)
+        except (OSError, ValueError, TypeError):
+            return None
+        os.utime(path)
+        return result
+
+    def put(self, pid: str, key: str, result: ProblemResult) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        path = self._path(pid, key)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(asdict(result)))
+        tmp.replace(path)
+        self._evict()
+
+    def _evict(self) -> None:
+        entries = []
+        for path in self.directory.glob("*.json"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
 
 
-def list_problems(problems: Dict[str, ProblemSpec]) -> None:
+def list_problems(problems: ProblemRegistry) -> None:
     print("Available problems:")
-    for pid, spec in problems.items():
-        print(f"  {pid}: {spec.name}")
+    for pid in problems.keys():
+        print(f"  {pid}: {problems.name(pid)}")
+
+
+# Installed as sitecustomize.py on the solver's PYTHONPATH. Every Python process
+# run.sh starts imports it, but only scripts under the problem folder profile
+# themselves, since the login shell starts Python helpers of its own; each
+# writes one file per pid on exit. A sitecustomize the hook shadows is still
+# imported, first.
+PROFILE_HOOK = """\
+import atexit
+import os
+import sys
+
+
+def _chain():
+    here = os.path.dirname(os.path.abspath(__file__))
+    hook = sys.modules.pop(__name__)
+    saved = sys.path[:]
+    sys.path[:] = [entry for entry in sys.path if os.path.abspath(entry or ".") != here]
+    try:
+        import sitecustomize  # noqa: F401
+    except ImportError as exc:
+        if exc.name != "sitecustomize":
+            raise
+    finally:
+        sys.path[:] = saved
+        sys.modules[__name__] = hook
+
+
+_chain()
+_out = os.environ.get("VEST_PROFILE_OUT")
+_root = os.environ.get("VEST_PROFILE_ROOT")
+_script = sys.argv[0] if sys.argv and sys.argv[0] not in ("", "-c", "-m") else None
+if _out and _root and _script and os.path.realpath(_script).startswith(_root + os.sep):
+    _path = f"{_out}.{os.getpid()}"
+    if os.environ.get("VEST_PROFILE_MODE") == "cprofile":
+        import cProfile
+
+        _profiler = cProfile.Profile()
+
+        def _dump():
+            _profiler.disable()
+            _profiler.dump_stats(_path + ".prof")
+
+        _profiler.enable()
+        atexit.register(_dump)
+    else:
+        import collections
+        import signal
+
+        _stacks = collections.Counter()
+        _interval = float(os.environ.get("VEST_PROFILE_INTERVAL", "0.001"))
+
+        def _sample(signum, frame):
+            names = []
+            while frame is not None:
+                code = frame.f_code
+                names.append(f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})")
+                frame = frame.f_back
+            _stacks[";".join(reversed(names))] += 1
+
+        def _dump():
+            signal.setitimer(signal.ITIMER_PROF, 0)
+            with open(_path + ".folded", "w") as handle:
+                for stack, count in _stacks.items():
+                    handle.write(f"{stack} {count}\\n")
+
+        signal.signal(signal.SIGPROF, _sample)
+        signal.setitimer(signal.ITIMER_PROF, _interval, _interval)
+        atexit.register(_dump)
+"""
+
+_profile_mode: Optional[str] = None
+
+
+def set_profile_mode(mode: Optional[str]) -> None:
+    """Profile Python solvers with ``sample`` or ``cprofile``, or stop profiling with None."""
+    global _profile_mode
+    if mode is not None and mode not in PROFILE_MODES:
+        raise ValueError(f"Unknown profile mode: {mode}")
+    _profile_mode = mode
+
+
+def _profile_env(spec: ProblemSpec, test: TestCase) -> Optional[Dict[str, str]]:
+    """Environment that makes the solver's Python scripts under ``spec.folder`` profile ``test``."""
+    if _profile_mode is None:
+        return None
+    hook_dir = (PROFILES_DIR / "_hook").resolve()
+    hook_dir.mkdir(parents=True, exist_ok=True)
+    hook = hook_dir / "sitecustomize.py"
+    if not hook.exists() or hook.read_text() != PROFILE_HOOK:
+        hook.write_text(PROFILE_HOOK)
+    out_dir = (PROFILES_DIR / spec.pid).resolve()
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for stale in out_dir.glob(f"{test.name}.*"):
+        stale.unlink()
+    python_path = os.environ.get("PYTHONPATH")
+    return {
+        "PYTHONPATH": f"{hook_dir}{os.pathsep}{python_path}" if python_path else str(hook_dir),
+        "VEST_PROFILE_OUT": str(out_dir / test.name),
+        "VEST_PROFILE_ROOT": os.path.realpath(spec.folder),
+        "VEST_PROFILE_MODE": _profile_mode,
+        "VEST_PROFILE_INTERVAL": str(PROFILE_SAMPLE_INTERVAL),
+    }
+
+
+def hot_functions(
+    pid: str,
+    test_names: Iterable[str],
+    limit: int = PROFILE_TOP_FUNCTIONS,
+) -> List[Tuple[str, float]]:
+    """The functions with the most self time across the profiles of ``test_names``, as shares of the total.
+
+    Reads the ``.folded`` stacks of sampled runs (the leaf frame of each stack
+    gets the samples) and the ``.prof`` dumps of cProfile runs.
+    """
+    totals: Dict[str, float] = {}
+    out_dir = PROFILES_DIR / pid
+    paths = sorted(path for name in test_names for path in out_dir.glob(f"{name}.*"))
+    for path in (path for path in paths if path.suffix == ".folded"):
+        for line in path.read_text().splitlines():
+            stack, _, count = line.rpartition(" ")
+            leaf = stack.rsplit(";", 1)[-1]
+            totals[leaf] = totals.get(leaf, 0.0) + int(count)
+    for path in (path for path in paths if path.suffix == ".prof"):
+        import pstats  # pylint: disable=import-outside-toplevel
+
+        stats = cast(Dict[Tuple[str, int, str], tuple], pstats.Stats(str(path)).stats)  # type: ignore[attr-defined]
+        for (filename, line, name), (_, _, self_time, _, _) in stats.items():
+            label = name if filename == "~" else f"{name} ({os.path.basename(filename)}:{line})"
+            totals[label] = totals.get(label, 0.0) + self_time
+    grand_total = sum(totals.values())
+    if not grand_total:
+        return []
+    ranked = sorted(totals.items(), key=lambda item: item[1], reverse=True)[:limit]
+    return [(label, value / grand_total) for label, value in ranked]
+
+
+def run_test(spec: ProblemSpec, test: TestCase, solver: Optional[PersistentSolver] = None) -> TestOutcome:
+    try:
+        sink = spec.stream_verifier(test) if spec.stream_verifier is not None else None
+        if solver is not None:
+            stdout, elapsed, usage = solver.solve("".join(test.iter_input()), spec.timeout)
+            if sink is not None:
+                sink.feed(stdout)
+        else:
+            stdout, elapsed, usage = run_script(
+                spec.folder,
+                spec.timeout,
+                test.iter_input(),
+                extra_env=_profile_env(spec, test),
+                sink=sink,
+                limits=spec.limits,
+            )
+        if sink is not None:
+            ok, message = sink.finish(elapsed)
+        else:
+            ok, message = spec.verifier(test, stdout, elapsed)
+        verdict = "AC" if ok else "WA"
+    except Exception as exc:  # pylint: disable=broad-except
+        import subprocess  # pylint: disable=import-outside-toplevel
+
+        ok = False
+        message = str(exc)
+        elapsed = 0.0
+        usage = None
+        if isinstance(exc, LimitExceeded):
+            verdict = exc.verdict
+        elif isinstance(exc, subprocess.TimeoutExpired):
+            verdict = "TLE"
+        else:
+            verdict = "RE"
+    return TestOutcome(name=test.name, ok=ok, message=message, elapsed=elapsed, usage=usage, verdict=verdict)
 
 
-def judge_problem(spec: ProblemSpec, verbose: bool) -> ProblemResult:
-    total_tests = 0
+def summarize_problem(
+    spec: ProblemSpec,
+    outcomes: List[TestOutcome],
+    verbose: bool,
+    elapsed_total: float,
+) -> ProblemResult:
     passed_tests = 0
     details: List[str] = []
-    start = time.time()
-    for test in spec.generator():
-        total_tests += 1
-        try:
-            stdout, elapsed = run_script(spec.folder, spec.timeout, test.input_data)
-            ok, message = spec.verifier(test, stdout, elapsed)
-        except Exception as exc:  # pylint: disable=broad-except
-            ok = False
-            message = str(exc)
-            elapsed = 0.0
-        if ok:
+    records: List[Dict[str, object]] = []
+    for outcome in outcomes:
+        record: Dict[str, object] = {"name": outcome.name, "ok": outcome.ok, "verdict": outcome.verdict}
+        record.update(asdict(outcome.usage or ResourceUsage(wall=outcome.elapsed)))
+        records.append(record)
+        if outcome.ok:
             passed_tests += 1
             if verbose:
-                details.append(f"[{test.name}] PASS ({elapsed:.2f}s)")
+                details.append(f"[{outcome.name}] PASS ({outcome.elapsed:.2f}s)")
         else:
-            details.append(f"[{test.name}] FAIL: {message}")
+            details.append(f"[{outcome.name}] FAIL ({outcome.verdict}): {outcome.message}")
             if verbose:
-                details[-1] += f" ({elapsed:.2f}s)"
-    elapsed_total = time.time() - start
+                details[-1] += f" ({outcome.elapsed:.2f}s)"
+    total_tests = len(outcomes)
     score = spec.weight * (passed_tests / total_tests if total_tests else 0.0)
     return ProblemResult(
         score=score,
@@ -119,40 +1021,722 @@ def judge_problem(spec: ProblemSpec, verbose: bool) -> ProblemResult:
         passed=passed_tests,
         total=total_tests,
         elapsed=elapsed_total,
+        tests=records,
     )
 
 
-def submit_scoreboard(
-    url: str,
-    payload: dict,
-    secret: Optional[str] = None,
-    verbose: bool = False,
+def judge_problem(spec: ProblemSpec, verbose: bool, persistent: bool = True) -> ProblemResult:
+    start = time.time()
+    outcomes = [outcome for _, _, outcome in _run_problem_tests(spec, spec.generator(), persistent)]
+    return summarize_problem(spec, outcomes, verbose, time.time() - start)
+
+
+class ProblemBudget:
+    """Decides whether the next test of one problem should still run.
+
+    Tests are skipped once the global deadline ``stop`` is set, or once the
+    problem has ``max_failures`` failed tests (0 means no limit).
+    """
+
+    def __init__(self, stop: Optional[threading.Event] = None, max_failures: int = 0) -> None:
+        import threading  # pylint: disable=import-outside-toplevel
+
+        self.stop = stop or threading.Event()
+        self.max_failures = max_failures
+        self.failures = 0
+        self._lock = threading.Lock()
+
+    def skip_reason(self) -> Optional[str]:
+        if self.stop.is_set():
+            return DEADLINE_MESSAGE
+        if self.max_failures and self.failures >= self.max_failures:
+            return f"Skipped: {self.failures} earlier test(s) failed"
+        return None
+
+    def record(self, outcome: TestOutcome) -> None:
+        if not outcome.ok and outcome.verdict != "SKIP":
+            with self._lock:
+                self.failures += 1
+
+
+def _timed_run_test(
+    spec: ProblemSpec,
+    test: TestCase,
+    solver: Optional[PersistentSolver] = None,
+    budget: Optional[ProblemBudget] = None,
+) -> Tuple[float, float, TestOutcome]:
+    start = time.monotonic()
+    reason = budget.skip_reason() if budget is not None else None
+    if reason is not None:
+        return start, start, TestOutcome(name=test.name, ok=False, message=reason, elapsed=0.0, verdict="SKIP")
+    outcome = run_test(spec, test, solver)
+    if budget is not None:
+        if budget.stop.is_set() and not outcome.ok:
+            # The solver was most likely killed by the deadline rather than failing on its own.
+            outcome = replace(outcome, message=DEADLINE_MESSAGE, verdict="SKIP")
+        budget.record(outcome)
+    return start, time.monotonic(), outcome
+
+
+def _run_problem_tests(
+    spec: ProblemSpec,
+    tests: Iterable[TestCase],
+    persistent: bool,
+    budget: Optional[ProblemBudget] = None,
+    on_outcome: Optional[Callable[[ProblemSpec, TestOutcome], None]] = None,
+) -> List[Tuple[float, float, TestOutcome]]:
+    """Run ``tests`` one after another, through one warm session when the solver allows it."""
+    solver = None
+    if persistent and supports_persistent(spec.folder):
+        solver = PersistentSolver(spec.folder, limits=spec.limits)
+    timed: List[Tuple[float, float, TestOutcome]] = []
+    try:
+        for test in tests:
+            timed.append(_timed_run_test(spec, test, solver, budget))
+            if on_outcome is not None:
+                on_outcome(spec, timed[-1][2])
+    finally:
+        if solver is not None:
+            solver.close()
+    return timed
+
+
+def _busy_time(intervals: List[Tuple[float, float]]) -> float:
+    """Time covered by at least one of ``intervals``.
+
+    Tests of other problems share the slots, so the span from a problem's first
+    start to its last end would count their runtime too; the union counts only
+    the time this problem's own tests were running.
+    """
+    total = 0.0
+    covered = -math.inf
+    for start, end in sorted(intervals):
+        if end > covered:
+            total += end - max(start, covered)
+            covered = end
+    return total
+
+
+def load_history(path: Path = HISTORY_PATH) -> Dict[str, Dict[str, Dict[str, object]]]:
+    """Per problem and test, whether the last judged run passed and how long it took."""
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def update_history(
+    history: Dict[str, Dict[str, Dict[str, object]]],
+    pid: str,
+    tests: List[Dict[str, object]],
 ) -> None:
-    headers = {"Content-Type": "application/json"}
-    if secret:
-        headers["Authorization"] = f"Bearer {secret}"
-    req = request.Request(url, data=json.dumps(payload).encode(), headers=headers)
-    context: Optional[ssl.SSLContext] = None
-    for attempt in range(2):
+    """Fold the records of a fresh run into ``history``; skipped tests keep their old entry."""
+    entries = history.setdefault(pid, {})
+    for record in tests:
+        if record.get("verdict") == "SKIP":
+            continue
+        entries[str(record["name"])] = {"ok": record["ok"], "wall": record["wall"]}
+
+
+def save_history(history: Dict[str, Dict[str, Dict[str, object]]], path: Path = HISTORY_PATH) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(history, indent=2, sort_keys=True))
+
+
+def _test_priority(entries: Dict[str, Dict[str, object]], name: str) -> Tuple[int, float]:
+    """Sort key: previously failed tests first, then unseen ones, then the slowest passes."""
+    entry = entries.get(name)
+    if entry is None:
+        return 1, 0.0
+    return (2 if entry.get("ok") else 0), -float(cast(float, entry.get("wall") or 0.0))
+
+
+class ProgressReporter:
+    """Live one-line progress on stderr, shown only when stderr is a terminal."""
+
+    def __init__(self, stream=None) -> None:
+        import threading  # pylint: disable=import-outside-toplevel
+
+        self.stream = stream or sys.stderr
+        self.enabled = self.stream.isatty()
+        self.done = 0
+        self.failed = 0
+        self._lock = threading.Lock()
+
+    def update(self, spec: ProblemSpec, outcome: TestOutcome) -> None:
+        with self._lock:
+            self.done += 1
+            self.failed += not outcome.ok and outcome.verdict != "SKIP"
+            if self.enabled:
+                self.stream.write(
+                    f"\r\033[K[{self.done} done · {self.failed} failed] "
+                    f"{outcome.name} {outcome.verdict} ({outcome.elapsed:.2f}s)"
+                )
+                self.stream.flush()
+
+    def finish(self) -> None:
+        if self.enabled and self.done:
+            self.stream.write("\r\033[K")
+            self.stream.flush()
+
+
+def schedule_problems(
+    specs: List[ProblemSpec],
+    verbose: bool,
+    jobs: int,
+    persistent: bool = True,
+    per_problem: Optional[int] = None,
+    deadline: Optional[float] = None,
+    max_failures: int = 0,
+    history: Optional[Dict[str, Dict[str, Dict[str, object]]]] = None,
+    on_outcome: Optional[Callable[[ProblemSpec, TestOutcome], None]] = None,
+) -> Dict[str, Callable[[], ProblemResult]]:
+    """Schedule every test of ``specs`` and return a result getter per problem.
+
+    An asyncio loop on a background thread admits at most ``jobs`` tests at once
+    and at most ``per_problem`` (or ``spec.max_parallel``, if lower) tests of the
+    same problem, so one problem with many slow cases cannot starve the others.
+    Tests still run in worker threads, which keeps ``os.wait4`` resource usage per
+    test. A problem whose solver is persistent takes a single slot and streams all
+    of its cases through one session.
+
+    With ``history`` (see ``load_history``), tests that failed last time run
+    first, then unseen tests, then the slowest passing ones, and problems with
+    earlier failures are started first. Once a problem has ``max_failures``
+    failures its remaining tests are skipped. ``on_outcome`` is called from
+    worker threads as each test finishes.
+
+    Each getter blocks until its own problem is done. Outcomes are assembled in
+    generator order, so the ``ProblemResult`` does not depend on completion or
+    execution order. Once ``deadline`` seconds have passed, every live solver
+    process tree is killed and the remaining tests are reported as skipped.
+    """
+    if not specs:
+        return {}
+    import asyncio  # pylint: disable=import-outside-toplevel
+    import threading  # pylint: disable=import-outside-toplevel
+    from concurrent.futures import Future, ThreadPoolExecutor  # pylint: disable=import-outside-toplevel
+
+    jobs = max(1, jobs)
+    per_problem = max(1, per_problem or (jobs + 1) // 2)
+    history = history or {}
+    stop = threading.Event()
+    results: Dict[str, Future] = {spec.pid: Future() for spec in specs}
+    LIVE_PROCESSES.reset()
+
+    def problem_priority(spec: ProblemSpec) -> int:
+        return -sum(not entry.get("ok") for entry in history.get(spec.pid, {}).values())
+
+    def expire() -> None:
+        stop.set()
+        LIVE_PROCESSES.kill_all()
+
+    async def judge(spec: ProblemSpec, slots: asyncio.Semaphore, pool: ThreadPoolExecutor) -> ProblemResult:
+        loop = asyncio.get_running_loop()
+        limit = asyncio.Semaphore(min(per_problem, spec.max_parallel or per_problem))
+        tests = await loop.run_in_executor(pool, lambda: list(spec.generator()))
+        entries = history.get(spec.pid, {})
+        order = sorted(range(len(tests)), key=lambda index: _test_priority(entries, tests[index].name))
+        budget = ProblemBudget(stop, max_failures)
+        if persistent and supports_persistent(spec.folder):
+            ordered = [tests[index] for index in order]
+            units = [lambda: _run_problem_tests(spec, ordered, True, budget, on_outcome)]
+        else:
+            units = [
+                lambda test=tests[index]: _run_problem_tests(spec, [test], False, budget, on_outcome)
+                for index in order
+            ]
+
+        async def run_unit(unit: Callable[[], List[Tuple[float, float, TestOutcome]]]):
+            async with limit, slots:
+                return await loop.run_in_executor(pool, unit)
+
+        chunks = await asyncio.gather(*(run_unit(unit) for unit in units))
+        executed = [entry for chunk in chunks for entry in chunk]
+        by_index = dict(zip(order, executed))
+        timed = [by_index[index] for index in range(len(tests))]
+        outcomes = [outcome for _, _, outcome in timed]
+        return summarize_problem(spec, outcomes, verbose, _busy_time([(start, end) for start, end, _ in timed]))
+
+    async def deliver(spec: ProblemSpec, slots: asyncio.Semaphore, pool: ThreadPoolExecutor) -> None:
         try:
-            if context is None:
-                resp = request.urlopen(req, timeout=5)
+            results[spec.pid].set_result(await judge(spec, slots, pool))
+        except Exception as exc:  # pylint: disable=broad-except
+            results[spec.pid].set_exception(exc)
+
+    async def run_all() -> None:
+        timer = None
+        if deadline is not None:
+            timer = asyncio.get_running_loop().call_later(deadline, expire)
+        slots = asyncio.Semaphore(jobs)
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="judge") as pool:
+            await asyncio.gather(*(deliver(spec, slots, pool) for spec in sorted(specs, key=problem_priority)))
+        if timer is not None:
+            timer.cancel()
+
+    threading.Thread(target=asyncio.run, args=(run_all(),), name="scheduler", daemon=True).start()
+    return {spec.pid: (lambda pid=spec.pid: results[pid].result()) for spec in specs}
+
+
+def timing_stats(samples: List[float]) -> Dict[str, float]:
+    import statistics  # pylint: disable=import-outside-toplevel
+
+    ordered = sorted(samples)
+    rank = max(0, math.ceil(0.95 * len(ordered)) - 1)
+    return {
+        "min": ordered[0],
+        "median": statistics.median(ordered),
+        "p95": ordered[rank],
+        "mean": statistics.fmean(ordered),
+        "stdev": statistics.stdev(ordered) if len(ordered) > 1 else 0.0,
+    }
+
+
+def benchmark_problem(
+    spec: ProblemSpec,
+    repeat: int,
+    warmup: int,
+    persistent: bool = True,
+) -> Dict[str, object]:
+    """Time every test of ``spec`` ``repeat`` times after ``warmup`` discarded runs.
+
+    Returns per-test samples and stats, plus stats over the per-repetition total
+    of all tests as the problem-level figure.
+    """
+    solver = PersistentSolver(spec.folder, limits=spec.limits) if persistent and supports_persistent(spec.folder) else None
+    tests: Dict[str, Dict[str, object]] = {}
+    try:
+        for test in spec.generator():
+            for _ in range(warmup):
+                run_test(spec, test, solver)
+            samples: List[float] = []
+            failures = 0
+            for _ in range(repeat):
+                outcome = run_test(spec, test, solver)
+                failures += not outcome.ok
+                if outcome.usage is not None:
+                    samples.append(outcome.usage.wall)
+            entry: Dict[str, object] = {"samples": samples, "failures": failures}
+            if samples:
+                entry.update(timing_stats(samples))
+            tests[test.name] = entry
+    finally:
+        if solver is not None:
+            solver.close()
+    complete = [
+        cast(List[float], entry["samples"])
+        for entry in tests.values()
+        if len(cast(List[float], entry["samples"])) == repeat
+    ]
+    totals = [sum(samples[i] for samples in complete) for i in range(repeat)] if complete else []
+    return {
+        "tests": tests,
+        "total": {"samples": totals, **timing_stats(totals)} if totals else {},
+        "timeout": spec.timeout,
+    }
+
+
+# One-sided 95% critical values of Student's t, indexed by degrees of freedom.
+_T_CRITICAL_95 = [
+    (1, 6.314), (2, 2.920), (3, 2.353), (4, 2.132), (5, 2.015), (6, 1.943), (7, 1.895),
+    (8, 1.860), (9, 1.833), (10, 1.812), (15, 1.753), (20, 1.725), (30, 1.697), (60, 1.671),
+]
+
+
+def _t_critical(df: float) -> float:
+    """Critical value for the largest tabulated df not above ``df`` (conservative)."""
+    value = _T_CRITICAL_95[0][1]
+    for limit, critical in _T_CRITICAL_95:
+        if df >= limit:
+            value = critical
+    return value
+
+
+def is_significant_slowdown(baseline: List[float], current: List[float]) -> bool:
+    """Welch's one-sided t-test at 95%.
+
+    Median slowdowns below ``BENCHMARK_MIN_SLOWDOWN`` (relative) or
+    ``BENCHMARK_MIN_DELTA`` seconds are never reported, however consistent.
+    """
+    if len(baseline) < 2 or len(current) < 2:
+        return False
+    import statistics  # pylint: disable=import-outside-toplevel
+
+    base_mean, cur_mean = statistics.fmean(baseline), statistics.fmean(current)
+    base_median = statistics.median(baseline)
+    threshold = max(base_median * BENCHMARK_MIN_SLOWDOWN, BENCHMARK_MIN_DELTA)
+    if statistics.median(current) - base_median <= threshold:
+        return False
+    base_var = statistics.variance(baseline) / len(baseline)
+    cur_var = statistics.variance(current) / len(current)
+    spread = base_var + cur_var
+    if spread == 0:
+        return cur_mean > base_mean
+    t_stat = (cur_mean - base_mean) / math.sqrt(spread)
+    df = spread**2 / (
+        (base_var**2 / (len(baseline) - 1) if base_var else 0.0)
+        + (cur_var**2 / (len(current) - 1) if cur_var else 0.0)
+    )
+    return t_stat > _t_critical(df)
+
+
+def find_regressions(baseline: Dict[str, object], current: Dict[str, object]) -> List[str]:
+    """Names (``pid/test``) of tests that got significantly slower than ``baseline``."""
+    regressions: List[str] = []
+    for pid, problem in cast(Dict[str, Dict[str, object]], current).items():
+        base_problem = cast(Dict[str, Dict[str, object]], baseline).get(pid)
+        if not base_problem:
+            continue
+        base_tests = cast(Dict[str, Dict[str, object]], base_problem["tests"])
+        for name, entry in cast(Dict[str, Dict[str, object]], problem["tests"]).items():
+            base_entry = base_tests.get(name)
+            if base_entry and is_significant_slowdown(
+                cast(List[float], base_entry["samples"]),
+                cast(List[float], entry["samples"]),
+            ):
+                regressions.append(f"{pid}/{name}")
+    return regressions
+
+
+def _format_stats(stats: Dict[str, object]) -> str:
+    return (
+        f"min {stats['min']:.3f}s · median {stats['median']:.3f}s · "
+        f"p95 {stats['p95']:.3f}s · stdev {stats['stdev']:.3f}s"
+    )
+
+
+def run_benchmark(
+    specs: List[ProblemSpec],
+    repeat: int,
+    warmup: int,
+    persistent: bool,
+    save_baseline: bool,
+) -> int:
+    """Benchmark ``specs``, compare against the stored baseline and report."""
+    results: Dict[str, object] = {}
+    for spec in specs:
+        print(f"Benchmarking {spec.pid} – {spec.name} ({warmup} warmup, {repeat} timed runs per test)")
+        problem = benchmark_problem(spec, repeat, warmup, persistent)
+        results[spec.pid] = problem
+        tests = cast(Dict[str, Dict[str, object]], problem["tests"])
+        for name, entry in tests.items():
+            failed = f" · {entry['failures']} failed" if entry["failures"] else ""
+            timing = _format_stats(entry) if entry["samples"] else "no completed runs"
+            print(f"    [{name}] {timing}{failed}")
+        timed = [entry for entry in tests.values() if entry["samples"]]
+        if problem["total"]:
+            print(f"  total: {_format_stats(cast(Dict[str, object], problem['total']))}")
+        if timed:
+            worst_p95 = max(cast(float, entry["p95"]) for entry in timed)
+            print(
+                f"  timeout {spec.timeout:.1f}s · slowest p95 {worst_p95:.3f}s · "
+                f"suggested {worst_p95 * TIMEOUT_SAFETY_FACTOR:.2f}s"
+            )
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    payload = {"timestamp": time.time(), "repeat": repeat, "warmup": warmup, "problems": results}
+    BENCHMARK_LATEST_PATH.write_text(json.dumps(payload, indent=2))
+
+    baseline: Optional[Dict[str, object]] = None
+    if BENCHMARK_BASELINE_PATH.exists():
+        baseline = json.loads(BENCHMARK_BASELINE_PATH.read_text())
+    regressions: List[str] = []
+    if baseline is not None:
+        regressions = find_regressions(cast(Dict[str, object], baseline["problems"]), results)
+        if regressions:
+            print("Significant slowdowns against baseline:")
+            for name in regressions:
+                print(f"  {name}")
+        else:
+            print("No significant slowdowns against baseline.")
+    if baseline is None or save_baseline:
+        if baseline is not None:
+            merged = dict(cast(Dict[str, object], baseline["problems"]))
+            merged.update(results)
+            payload = {**payload, "problems": merged}
+        BENCHMARK_BASELINE_PATH.write_text(json.dumps(payload, indent=2))
+        print(f"Saved benchmark baseline to {BENCHMARK_BASELINE_PATH}")
+    return 1 if regressions else 0
+
+
+class ScoreboardError(RuntimeError):
+    def __init__(self, message: str, retryable: bool = True) -> None:
+        super().__init__(message)
+        self.retryable = retryable
+
+
+class ScoreboardClient:
+    """POSTs JSON to the scoreboard over one kept-alive HTTP(S) connection.
+
+    If certificate verification fails, the connection is re-established once
+    without verification, as before.
+    """
+
+    def __init__(self, url: str, secret: Optional[str] = None, timeout: float = SUBMIT_TIMEOUT) -> None:
+        from urllib.parse import urlsplit  # pylint: disable=import-outside-toplevel
+
+        parts = urlsplit(url)
+        self.scheme = parts.scheme
+        self.host = parts.netloc
+        self.path = (parts.path or "/") + (f"?{parts.query}" if parts.query else "")
+        self.secret = secret
+        self.timeout = timeout
+        self.verify = True
+        self._conn: Optional[http.client.HTTPConnection] = None
+
+    def _connection(self) -> http.client.HTTPConnection:
+        import http.client  # pylint: disable=import-outside-toplevel
+        import ssl  # pylint: disable=import-outside-toplevel
+
+        if self._conn is None:
+            if self.scheme == "https":
+                context = None if self.verify else ssl._create_unverified_context()  # type: ignore[attr-defined]
+                self._conn = http.client.HTTPSConnection(self.host, timeout=self.timeout, context=context)
             else:
-                resp = request.urlopen(req, timeout=5, context=context)
-            with resp:
-                body = resp.read().decode()
-            if verbose:
-                print(f"Scoreboard response: {body}")
-            return
-        except error.URLError as exc:
-            ssl_error = isinstance(exc.reason, ssl.SSLError)
-            if ssl_error and context is None:
+                self._conn = http.client.HTTPConnection(self.host, timeout=self.timeout)
+        return self._conn
+
+    def close(self) -> None:
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    def post(self, body: object, verbose: bool = False) -> str:
+        headers = {"Content-Type": "application/json"}
+        if self.secret:
+            headers["Authorization"] = f"Bearer {self.secret}"
+        import http.client  # pylint: disable=import-outside-toplevel
+        import ssl  # pylint: disable=import-outside-toplevel
+
+        data = json.dumps(body).encode()
+        while True:
+            try:
+                conn = self._connection()
+                conn.request("POST", self.path, body=data, headers=headers)
+                resp = conn.getresponse()
+                text = resp.read().decode(errors="ignore")
+            except ssl.SSLCertVerificationError:
+                self.close()
+                if not self.verify:
+                    raise
                 if verbose:
                     print("Warning: certificate verification failed; retrying without verification.")
-                context = ssl._create_unverified_context()  # type: ignore[attr-defined]
+                self.verify = False
+                continue
+            except (OSError, http.client.HTTPException) as exc:
+                self.close()
+                raise ScoreboardError(str(exc)) from exc
+            if resp.will_close:
+                self.close()
+            if 200 <= resp.status < 300:
+                return text
+            retryable = resp.status >= 500 or resp.status in (408, 429)
+            raise ScoreboardError(f"HTTP {resp.status}: {text.strip()}", retryable=retryable)
+
+
+class ScoreboardSubmitter:
+    """Background scoreboard submission backed by a durable outbox.
+
+    Every payload is written to ``outbox`` before it is sent and removed only
+    once the scoreboard accepts it. A worker thread sends whatever is due—left
+    over from earlier runs or queued by ``submit``. Several due payloads are
+    coalesced into one ``{"batch": [...]}`` POST until the scoreboard shows it
+    does not acknowledge batches; from then on each payload is its own request
+    and is removed only when that request succeeds. Retryable failures are
+    retried with exponential backoff, first within the run and then on later
+    runs; payloads the scoreboard refuses are renamed to ``*.rejected`` and
+    outbox files that cannot be parsed to ``*.corrupt``. Entries are always
+    rewritten through a temporary file, so an abandoned worker never leaves
+    one truncated.
+    """
+
+    def __init__(
+        self,
+        url: str,
+        secret: Optional[str] = None,
+        verbose: bool = False,
+        outbox: Path = OUTBOX_DIR,
+    ) -> None:
+        import threading  # pylint: disable=import-outside-toplevel
+
+        self.client = ScoreboardClient(url, secret)
+        self.verbose = verbose
+        self.outbox = outbox
+        self._wake = threading.Event()
+        self._closing = False
+        self._close_deadline = math.inf
+        self._closed = threading.Event()
+        # None until a batch POST shows whether the scoreboard acknowledges batches.
+        self._batching: Optional[bool] = None
+        self._thread = threading.Thread(target=self._run, name="scoreboard", daemon=True)
+
+    def start(self) -> None:
+        self._wake.set()
+        self._thread.start()
+
+    def submit(self, payload: dict) -> None:
+        self.outbox.mkdir(parents=True, exist_ok=True)
+        self._write_entry(self.outbox / f"{time.time_ns()}.json", {"payload": payload, "attempts": 0, "next_attempt": 0.0})
+        self._wake.set()
+
+    def close(self, timeout: float = SUBMIT_JOIN_TIMEOUT) -> bool:
+        """Finish pending work; return False if it was still running after ``timeout``.
+
+        In-run retries stop once their backoff would pass ``timeout``; whatever
+        is left stays in the outbox for the next run.
+        """
+        self._close_deadline = time.monotonic() + timeout
+        self._closing = True
+        self._closed.set()
+        self._wake.set()
+        self._thread.join(timeout)
+        self.client.close()
+        return not self._thread.is_alive()
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait()
+            self._wake.clear()
+            closing = self._closing
+            self._flush()
+            if closing:
+                return
+
+    @staticmethod
+    def _write_entry(path: Path, entry: Dict[str, object]) -> None:
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry))
+        tmp.replace(path)
+
+    def _due_entries(self) -> List[Tuple[Path, Dict[str, object]]]:
+        now = time.time()
+        entries = []
+        for path in sorted(self.outbox.glob("*.json")):
+            try:
+                entry = json.loads(path.read_text())
+            except OSError:
+                continue  # sent and removed by an earlier flush
+            except ValueError:
+                entry = None
+            if not isinstance(entry, dict) or "payload" not in entry:
+                # Never silently skipped: it would be skipped again on every later run.
+                corrupt = path.with_suffix(".corrupt")
+                path.replace(corrupt)
+                print(f"Warning: unreadable scoreboard outbox entry kept as {corrupt}")
+                continue
+            if cast(float, entry.get("next_attempt", 0.0)) <= now:
+                entries.append((path, entry))
+        return entries
+
+    def _send_batch(self, entries: List[Tuple[Path, Dict[str, object]]]) -> bool:
+        """Try one ``{"batch": [...]}`` POST; True once the scoreboard acknowledged every payload.
+
+        A 2xx alone proves nothing—a server without batch support may answer
+        any JSON body with 200—so the batch only counts as delivered when the
+        response is a JSON object whose ``batch`` list has one entry per
+        payload. Anything else, or a non-retryable rejection, disables
+        batching for this submitter and returns False so the payloads go out
+        one by one. Retryable failures propagate.
+        """
+        try:
+            body = self.client.post({"batch": [entry["payload"] for _, entry in entries]}, self.verbose)
+        except ScoreboardError as exc:
+            if exc.retryable:
+                raise
+            self._batching = False
+            return False
+        try:
+            reply = json.loads(body)
+        except ValueError:
+            reply = None
+        acknowledged = isinstance(reply, dict) and isinstance(reply.get("batch"), list)
+        acknowledged = acknowledged and len(reply["batch"]) == len(entries)
+        self._batching = acknowledged
+        if not acknowledged:
+            return False
+        if self.verbose:
+            print(f"Scoreboard response: {body}")
+        for path, _ in entries:
+            path.unlink(missing_ok=True)
+        return True
+
+    def _send(self, entries: List[Tuple[Path, Dict[str, object]]]) -> List[Tuple[Path, Dict[str, object], ScoreboardError]]:
+        """Send ``entries``, unlink the accepted ones and return the rest with their errors."""
+        if len(entries) > 1 and self._batching is not False:
+            try:
+                if self._send_batch(entries):
+                    return []
+            except ScoreboardError as exc:
+                return [(path, entry, exc) for path, entry in entries]
+        failed: List[Tuple[Path, Dict[str, object], ScoreboardError]] = []
+        for index, (path, entry) in enumerate(entries):
+            try:
+                body = self.client.post(entry["payload"], self.verbose)
+            except ScoreboardError as exc:
+                if exc.retryable:
+                    # The scoreboard is unreachable or overloaded; the rest would fail the same way.
+                    return failed + [(later, later_entry, exc) for later, later_entry in entries[index:]]
+                failed.append((path, entry, exc))
                 continue
-            print(f"Warning: scoreboard submission failed: {exc}")
+            if self.verbose:
+                print(f"Scoreboard response: {body}")
+            path.unlink(missing_ok=True)
+        return failed
+
+    def _backoff(self, delay: float) -> bool:
+        """Wait ``delay`` before an in-run retry; False when ``close`` leaves no time for it."""
+        resume = time.monotonic() + delay
+        if resume > self._close_deadline:
+            return False
+        if self._closed.wait(delay):
+            # close() was called during the wait and may have set a deadline before ``resume``.
+            if resume > self._close_deadline:
+                return False
+            time.sleep(max(0.0, resume - time.monotonic()))
+        return True
+
+    def _flush(self) -> None:
+        if not self.outbox.is_dir():
+            return
+        entries = self._due_entries()
+        if not entries:
             return
+        failure: Optional[ScoreboardError] = None
+        for attempt in range(SUBMIT_ATTEMPTS):
+            retry: List[Tuple[Path, Dict[str, object]]] = []
+            for path, entry, exc in self._send(entries):
+                if exc.retryable:
+                    failure = exc
+                    retry.append((path, entry))
+                    continue
+                # Keep what the scoreboard refused for inspection, out of the retry queue.
+                rejected = path.with_suffix(".rejected")
+                path.replace(rejected)
+                print(f"Warning: scoreboard rejected submission: {exc}; kept as {rejected}")
+            entries = retry
+            if not entries:
+                return
+            if attempt + 1 == SUBMIT_ATTEMPTS or not self._backoff(SUBMIT_BACKOFF * 2**attempt):
+                break
+        print(f"Warning: scoreboard submission failed: {failure}; kept in {self.outbox} for the next run")
+        for path, entry in entries:
+            attempts = cast(int, entry.get("attempts", 0)) + 1
+            entry["attempts"] = attempts
+            entry["next_attempt"] = time.time() + min(SUBMIT_BACKOFF * 2 ** (attempts + SUBMIT_ATTEMPTS), SUBMIT_RETRY_CAP)
+            self._write_entry(path, entry)
+
+
+def submit_scoreboard(
+    url: str,
+    payload: dict,
+    secret: Optional[str] = None,
+    verbose: bool = False,
+) -> None:
+    """Submit ``payload`` (plus anything left in the outbox) and wait for the result."""
+    submitter = ScoreboardSubmitter(url, secret=secret, verbose=verbose)
+    submitter.submit(payload)
+    submitter.start()
+    submitter.close()
 
 
 # -------------------- Problem Generators & Verifiers --------------------
@@ -182,6 +1766,8 @@ def verifier_01(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str
     except ValueError:
         return False, "First line must be an integer count"
 
+    statements = cast(List[int], test.metadata["statements"])
+    n = len(statements)
     indices: List[int] = []
     if truthful_count > 0:
         if len(lines) < 2:
@@ -196,28 +1782,96 @@ def verifier_01(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str
             return False, "Indices must be in increasing order"
         if len(set(indices)) != len(indices):
             return False, "Duplicate indices detected"
-        if any(i < 0 or i >= 10 for i in indices):
+        if any(i < 0 or i >= n for i in indices):
             return False, "Index out of range"
     else:
         indices = []
 
-    statements = cast(List[int], test.metadata["statements"])
-    valid_assignments = []
-    for t in range(11):
-        truth = [i for i, val in enumerate(statements) if val == t]
-        if len(truth) == t:
-            valid_assignments.append((t, truth))
-    if not valid_assignments:
+    # T is consistent exactly when T islanders claim T; one histogram finds them all.
+    histogram = [0] * (n + 1)
+    for claim in statements:
+        if 0 <= claim <= n:
+            histogram[claim] += 1
+    if not any(count == t for t, count in enumerate(histogram)):
         return truthful_count == 0 and not indices, "No valid assignments exist"
-    for t_val, truth in valid_assignments:
-        if truthful_count == t_val and indices == truth:
+    if 0 <= truthful_count <= n and histogram[truthful_count] == truthful_count:
+        if indices == [i for i, val in enumerate(statements) if val == truthful_count]:
             return True, ""
     return False, "Output does not match any valid assignment"
 
 
-def generate_matrix(size: int, seed: int) -> List[List[int]]:
+def generate_matrix(size: int, seed: int, bound: int = 9) -> List[List[int]]:
+    import random  # pylint: disable=import-outside-toplevel
+
     rng = random.Random(seed)
-    return [[rng.randint(-9, 9) for _ in range(size)] for _ in range(size)]
+    return [[rng.randint(-bound, bound) for _ in range(size)] for _ in range(size)]
+
+
+def _matrix_input_stream(header: str, a: List[List[int]], b: List[List[int]]) -> Callable[[], Iterator[str]]:
+    def stream() -> Iterator[str]:
+        yield header + "\n"
+        for matrix in (a, b):
+            for row in matrix:
+                yield " ".join(str(x) for x in row) + "\n"
+
+    return stream
+
+
+class MatrixStreamVerifier(StreamVerifier):
+    """Parses an N x N matrix line by line and checks it is ``a x b``.
+
+    Malformed rows stop the solver as soon as they arrive; the product itself is
+    checked once the whole matrix has been read, with ``check_product``.
+    """
+
+    def __init__(self, a: List[List[int]], b: List[List[int]], line_label: str) -> None:
+        self.a = a
+        self.b = b
+        self.n = len(a)
+        self.line_label = line_label
+        self.rows: List[List[int]] = []
+        self.extra_lines = 0
+        self.partial = ""
+        self.error = ""
+
+    def _take_line(self, line: str) -> None:
+        line = line.strip()
+        if not line:
+            return
+        if len(self.rows) >= self.n:
+            self.extra_lines += 1
+            return
+        try:
+            row = [int(x) for x in line.split()]
+        except ValueError:
+            self.error = "Output must contain integers"
+            return
+        if len(row) != self.n:
+            self.error = "Row length mismatch"
+            return
+        self.rows.append(row)
+
+    def feed(self, chunk: str) -> bool:
+        lines = (self.partial + chunk).split("\n")
+        self.partial = lines.pop()
+        for line in lines:
+            if self.error:
+                break
+            self._take_line(line)
+        return not self.error
+
+    def finish(self, elapsed: float) -> tuple[bool, str]:
+        if self.partial and not self.error:
+            self._take_line(self.partial)
+            self.partial = ""
+        if self.error:
+            return False, self.error
+        count = len(self.rows) + self.extra_lines
+        if count != self.n:
+            return False, f"Expected {self.n} {self.line_label}, got {count}"
+        if not check_product(self.a, self.b, self.rows):
+            return False, "Matrix product mismatch"
+        return True, ""
 
 
 def generate_02_cases() -> Iterable[TestCase]:
@@ -236,26 +1890,30 @@ def generate_02_cases() -> Iterable[TestCase]:
         )
 
 
-def verifier_02(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str]:
-    d = cast(int, test.metadata["d"])
-    n = 2 ** d
-    lines = [line.strip() for line in stdout.strip().splitlines() if line.strip()]
-    if len(lines) != n:
-        return False, f"Expected {n} output lines, got {len(lines)}"
-    try:
-        matrix = [[int(x) for x in line.split()] for line in lines]
-    except ValueError:
-        return False, "Output must contain integers"
-    for row in matrix:
-        if len(row) != n:
-            return False, "Row length mismatch"
-    expected = multiply_naive(
+def generate_02_stress_cases() -> Iterable[TestCase]:
+    configs: List[Tuple[int, int]] = [(4, 1101), (5, 1202), (6, 1303)]
+    for idx, (d, seed) in enumerate(configs, start=1):
+        n = 2 ** d
+        a = generate_matrix(n, seed, bound=10_000)
+        b = generate_matrix(n, seed + 1, bound=10_000)
+        yield TestCase(
+            name=f"02_stress_{idx}",
+            input_data="",
+            metadata={"d": d, "A": a, "B": b},
+            stream=_matrix_input_stream(str(d), a, b),
+        )
+
+
+def stream_verifier_02(test: TestCase) -> StreamVerifier:
+    return MatrixStreamVerifier(
         cast(List[List[int]], test.metadata["A"]),
         cast(List[List[int]], test.metadata["B"]),
+        "output lines",
     )
-    if matrix != expected:
-        return False, "Matrix product mismatch"
-    return True, ""
+
+
+def verifier_02(test: TestCase, stdout: str, elapsed: float) -> tuple[bool, str]:
+    return stream_verifier_02(test).verify(stdout, elapsed)
 
 
 def multiply_naive(a: List[List[int]], b: List[List[int]]) -> List[List[int]]:
@@ -269,15 +1927,119 @@ def multiply_naive(a: List[List[int]], b: List[List[int]]) -> List[List[int]]:
     return res
 
 
+_numpy_module: object = None
+
+
+def _numpy():
+    """Import NumPy on first use; return None when it is not installed."""
+    global _numpy_module
+    if _numpy_module is None:
+        try:
+            import numpy  # pylint: disable=import-outside-toplevel
+        except ImportError:
+            numpy = False
+        _numpy_module = numpy
+    return _numpy_module or None
+
+
+def multiply_numpy(a: List[List[int]], b: List[List[int]]) -> List[List[int]]:
+    """Exact product via NumPy: int64 when no entry can overflow, Python ints otherwise."""
+    np = _numpy()
+    n = len(b)
+    max_a = max((abs(x) for row in a for x in row), default=0)
+    max_b = max((abs(x) for row in b for x in row), default=0)
+    dtype = np.int64 if max(max_a, max_b, n * max_a * max_b) <= INT64_LIMIT else object
+    return (np.array(a, dtype=dtype) @ np.array(b, dtype=dtype)).tolist()
+
+
+def _matvec(m: List[List[int]], v: List[int]) -> List[int]:
+    return [sum(x * y for x, y in zip(row, v)) for row in m]
+
+
+def freivalds_check(
+    a: List[List[int]],
+    b: List[List[int]],
+    c: List[List[int]],
+    error_bound: float = FREIVALDS_ERROR_BOUND,
+) -> bool:
+    """Randomized check that ``a @ b == c`` in O(n^2) per trial.
+
+    A wrong ``c`` survives a trial with a random 0/1 vector with probability at
+    most 1/2, so ``ceil(log2(1 / error_bound))`` trials bound the chance of
+    accepting a wrong product by ``error_bound``. A correct product is never
+    rejected.
+    """
+    import random  # pylint: disable=import-outside-toplevel
+
+    rng = random.Random()
+    trials = max(1, math.ceil(math.log2(1 / error_bound)))
+    width = len(c[0]) if c else 0
+    for _ in range(trials):
+        vector = [rng.randint(0, 1) for _ in range(width)]
+        if _matvec(a, _matvec(b, vector)) != _matvec(c, vector):
+            return False
+    return True
+
+
+PRODUCT_BACKENDS: Dict[str, Callable[[List[List[int]], List[List[int]], List[List[int]]], bool]] = {
+    "naive": lambda a, b, c: multiply_naive(a, b) == c,
+    "numpy": lambda a, b, c: multiply_numpy(a, b) == c,
+    "freivalds": freivalds_check,
+}
+
+_verify_mode = "auto"
+
+
+def set_verify_mode(mode: str) -> None:
+    """Select how matrix products are verified: ``auto``, ``exact`` or ``probabilistic``."""
+    global _verify_mode
+    if mode not in VERIFY_MODES:
+        raise ValueError(f"Unknown verify mode: {mode}")
+    _verify_mode = mode
+
+
+def choose_product_backend(n: int, mode: Optional[str] = None) -> str:
+    """Pick a ``PRODUCT_BACKENDS`` key for an ``n x n`` product.
+
+    ``probabilistic`` always uses Freivalds and ``exact`` never does. In ``auto``
+    mode small products use the naive loop, larger ones NumPy when available, and
+    products of ``FREIVALDS_MIN_SIZE`` or more fall back to Freivalds otherwise.
+    """
+    mode = mode or _verify_mode
+    if mode == "probabilistic":
+        return "freivalds"
+    if n >= NUMPY_PRODUCT_MIN_SIZE and _numpy() is not None:
+        return "numpy"
+    if mode == "auto" and n >= FREIVALDS_MIN_SIZE:
+        return "freivalds"
+    return "naive"
+
+
+def check_product(a: List[List[int]], b: List[List[int]], c: List[List[int]]) -> bool:
+    return PRODUCT_BACKENDS[choose_product_backend(len(a))](a, b, c)
+
+
+def _two_sum_pair_count(values: Iterable[int], target: int) -> int:
+    """Number of index pairs ``i < j`` with ``values[i] + values[j] == target``, in one pass."""
+    seen: Dict[int, int] = {}
+    pairs = 0
+    for value in values:
+        pairs += seen.get(target - value, 0)
+        seen[value] = seen.get(value, 0) + 1
+    return pairs
+
+
 def generate_00_cases() -> Iterable[TestCase]:
     cases: List[Tuple[List[int], int, Tuple[int, int]]] = [
         ([2, 7, 11, 15], 9, (0, 1)),
         ([3, 2, 4, 8, 5], 6, (1, 2)),
         ([-3, 4, 3, 90], 0, (0, 2)),
         ([1, 5, 1, 5], 10, (1, 3)),
-        ([6, -2, 5, -1, 4], 3, (1, 4)),
+        ([6, -2, 5, -1, 4], 2, (1, 4)),
     ]
     for idx, (arr, target, pair) in enumerate(cases, start=1):
+        if _two_sum_pair_count(arr, target) != 1:
+            raise ValueError(f"00_case_{idx} does not have exactly one answer")
         n = len(arr)
         lines = [str(n), " ".join(str(x) for x in arr), str(target)]
         yield TestCase(
@@ -287,10 +2049,132 @@ def generate_00_cases() -> Iterable[TestCase]:
         )
 
 
+def _splitmix64(state: int) -> int:
+    state = ((state ^ (state >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    state = ((state ^ (state >> 27)) * 0x94D049BB133111EB) & MASK64
+    return state ^ (state >> 31)
+
+
+def _two_sum_fillers(seed: int, start: int, stop: int, span: int) -> Iterable[int]:
+    """Filler values ``start .. stop - 1`` of a stress instance, all multiples of 4.
+
+    Returns an int64 array with NumPy and a list without it. Value ``k`` depends
+    only on ``(seed, k)``, so both paths write byte-identical sidecars and any
+    chunk can be produced on its own.
+    """
+    np = _numpy()
+    modulus = 2 * span + 1
+    if np is not None:
+        states = (np.arange(start, stop, dtype=np.uint64) + np.uint64(1)) * np.uint64(GOLDEN64) + np.uint64(seed)
+        states = (states ^ (states >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+        states = (states ^ (states >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+        states ^= states >> np.uint64(31)
+        return ((states % np.uint64(modulus)).astype(np.int64) - span) * 4
+    return [
+        ((_splitmix64(((k + 1) * GOLDEN64 + seed) & MASK64) % modulus) - span) * 4
+        for k in range(start, stop)
+    ]
+
+
+def two_sum_sidecar_path(n: int, seed: int, bound: int) -> Path:
+    """Sidecar file of a stress instance, named after everything that determines its contents."""
+    return INSTANCES_DIR / f"00_n{n}_s{seed}_b{bound}_v{SIDECAR_FORMAT}.bin"
+
+
+def write_two_sum_sidecar(n: int, seed: int, bound: int) -> Tuple[Path, int, Tuple[int, int]]:
+    """Write (or reuse) the binary sidecar of a unique-answer two-sum instance.
+
+    Fillers are multiples of 4 and the two answer values are ``1 mod 4``, so the
+    target is ``2 mod 4``: two fillers sum to ``0 mod 4`` and a filler plus an
+    answer value to ``1 mod 4``, which leaves the planted pair as the only answer.
+    The layout is a little-endian int64 header ``(n, target)`` followed by the
+    ``n`` values. Returns the path, the target and the planted pair.
+    """
+    import random  # pylint: disable=import-outside-toplevel
+    import struct  # pylint: disable=import-outside-toplevel
+
+    rng = random.Random(seed)
+    span = bound // 4
+    i, j = sorted(rng.sample(range(n), 2))
+    planted = {i: 4 * rng.randint(-span, span - 1) + 1, j: 4 * rng.randint(-span, span - 1) + 1}
+    target = planted[i] + planted[j]
+    path = two_sum_sidecar_path(n, seed, bound)
+    if path.exists() and path.stat().st_size == TWO_SUM_HEADER_SIZE + n * 8:
+        return path, target, (i, j)
+
+    INSTANCES_DIR.mkdir(parents=True, exist_ok=True)
+    partial = path.with_suffix(f".{os.getpid()}.tmp")
+    np = _numpy()
+    odd = 0
+    with partial.open("wb") as handle:
+        handle.write(struct.pack(TWO_SUM_HEADER, n, target))
+        for chunk_start in range(0, n, SIDECAR_CHUNK_VALUES):
+            chunk_stop = min(n, chunk_start + SIDECAR_CHUNK_VALUES)
+            values = _two_sum_fillers(seed, chunk_start, chunk_stop, span)
+            for index in (i, j):
+                if chunk_start <= index < chunk_stop:
+                    values[index - chunk_start] = planted[index]  # type: ignore[index]
+            # The O(n) uniqueness check: exactly two values may leave the 0 mod 4 class.
+            if np is not None:
+                odd += int(np.count_nonzero(values % 4))
+                handle.write(values.astype("<i8").tobytes())  # type: ignore[union-attr]
+            else:
+                odd += sum(1 for value in values if value % 4)
+                packed = array("q", values)
+                if sys.byteorder != "little":
+                    packed.byteswap()
+                handle.write(packed.tobytes())
+    if odd != 2 or target % 4 != 2:
+        partial.unlink()
+        raise ValueError(f"Two-sum instance n={n} seed={seed} is not unique")
+    os.replace(partial, path)
+    return path, target, (i, j)
+
+
+def _sidecar_values(mapped: mmap.mmap, start: int, stop: int) -> List[int]:
+    """Values ``start .. stop - 1`` of a memory-mapped two-sum sidecar."""
+    values = array("q")
+    values.frombytes(mapped[TWO_SUM_HEADER_SIZE + start * 8 : TWO_SUM_HEADER_SIZE + stop * 8])
+    if sys.byteorder != "little":
+        values.byteswap()
+    return values.tolist()
+
+
+def _sidecar_input_stream(path: Path, n: int, target: int) -> Iterator[str]:
+    import mmap  # pylint: disable=import-outside-toplevel
+
+    with path.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        yield f"{n}\n"
+        for start in range(0, n, SIDECAR_CHUNK_VALUES):
+            stop = min(n, start + SIDECAR_CHUNK_VALUES)
+            yield " ".join(map(str, _sidecar_values(mapped, start, stop))) + (" " if stop < n else "\n")
+        yield f"{target}\n"
+
+
+def generate_00_stress_cases() -> Iterable[TestCase]:
+    for idx, (n, seed) in enumerate(TWO_SUM_STRESS_CONFIGS, start=1):
+        path, target, pair = write_two_sum_sidecar(n, seed, TWO_SUM_STRESS_BOUND)
+        yield TestCase(
+            name=f"00_stress_{idx}",
+            input_data="",
+            metadata={"n": n, "seed": seed, "target": target, "pair": pair},
+            stream=lambda path=path, n=n, target=target: _sidecar_input_stream(path, n, target),
+            sidecar=path,
+        )
+
+
+def two_sum_stress_params() -> List[Tuple[str, str]]:
+    """Cache parameters of the stress tier: case names and sidecar names, with nothing written."""
+    return [
+        (f"00_stress_{idx}", two_sum_sidecar_path(n, seed, TWO_SUM_STRESS_BOUND).name)
+        for idx, (n, seed) in enumerate(TWO_SUM_STRESS_CONFIGS, start=1)
+    ]
+
+
 def verifier_00(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str]:
-    arr = cast(List[int], test.metadata["array"])
+    import mmap  # pylint: disable=import-outside-toplevel
+
     target = cast(int, test.metadata["target"])
-    expected = cast(Tuple[int, int], test.metadata["pair"])
     tokens = stdout.strip().split()
     if len(tokens) < 2:
         return False, "Expected two indices"
@@ -298,34 +2182,52 @@ def verifier_00(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str
         i, j = int(tokens[0]), int(tokens[1])
     except ValueError:
         return False, "Indices must be integers"
-    n = len(arr)
+    n = cast(int, test.metadata["n"]) if test.sidecar is not None else len(cast(List[int], test.metadata["array"]))
     if not (0 <= i < n and 0 <= j < n):
         return False, "Index out of range"
     if i == j:
         return False, "Indices must be distinct"
-    if arr[i] + arr[j] != target:
+    # Every instance has exactly one answer (checked when it is generated), so a
+    # pair that hits the target is that answer; only the two values are read.
+    if test.sidecar is not None:
+        with test.sidecar.open("rb") as handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            (a_i,), (a_j,) = _sidecar_values(mapped, i, i + 1), _sidecar_values(mapped, j, j + 1)
+    else:
+        arr = cast(List[int], test.metadata["array"])
+        a_i, a_j = arr[i], arr[j]
+    if a_i + a_j != target:
         return False, "Indices do not sum to target"
-    if {i, j} != set(expected):
-        return False, "Incorrect index pair"
     return True, ""
 
 
-
-
-
-def _find_divisible_subarray(arr: List[int]) -> bool:
+def _find_divisible_subarray(arr: List[int]) -> Optional[Tuple[int, int]]:
+    """First 1-based ``(l, r)`` with ``sum(arr[l-1:r])`` divisible by ``len(arr)``, if any."""
     n = len(arr)
+    if not n:
+        return None
+    first = [-1] * n
+    first[0] = 0
     prefix = 0
-    seen = {0}
-    for value in arr:
+    for index, value in enumerate(arr, start=1):
         prefix = (prefix + value) % n
-        if prefix in seen:
-            return True
-        seen.add(prefix)
-    return False
+        if first[prefix] >= 0:
+            return first[prefix] + 1, index
+        first[prefix] = index
+    return None
+
+
+def _check_03_witness(values: Iterable[int], n: int, left: int, right: int) -> bool:
+    """Whether ``a_left + … + a_right`` is divisible by ``n``, in one pass over ``values``."""
+    total = 0
+    for index, value in enumerate(itertools.islice(values, right), start=1):
+        if index >= left:
+            total += value
+    return total % n == 0
 
 
 def generate_03_cases() -> Iterable[TestCase]:
+    import random  # pylint: disable=import-outside-toplevel
+
     rng = random.Random(606)
     cases = [
         [3, 1, 4, 2, 2],
@@ -349,19 +2251,85 @@ def generate_03_cases() -> Iterable[TestCase]:
 
 
 
+def _iter_stress_array(n: int, seed: Optional[int], bound: int) -> Iterator[int]:
+    """Values of a stress array; ``seed=None`` gives all ones (witness is the whole array)."""
+    import random  # pylint: disable=import-outside-toplevel
+
+    if seed is None:
+        for _ in range(n):
+            yield 1
+        return
+    rng = random.Random(seed)
+    for _ in range(n):
+        yield rng.randint(-bound, bound)
+
+
+def _array_input_stream(n: int, values: Iterable[int], batch: int = 4096) -> Iterator[str]:
+    yield f"{n}\n"
+    pending: List[str] = []
+    for value in values:
+        pending.append(str(value))
+        if len(pending) == batch:
+            yield " ".join(pending) + " "
+            pending = []
+    yield " ".join(pending) + "\n"
+
+
+def generate_03_stress_cases() -> Iterable[TestCase]:
+    configs: List[Tuple[int, Optional[int], int]] = [
+        (200_000, 6060, 10**9),
+        (200_000, None, 1),
+        (199_999, 6061, 10**9),
+    ]
+    for idx, (n, seed, bound) in enumerate(configs, start=1):
+        yield TestCase(
+            name=f"03_stress_{idx}",
+            input_data="",
+            metadata={"n": n, "seed": seed, "bound": bound, "has_solution": True},
+            stream=lambda n=n, seed=seed, bound=bound: _array_input_stream(
+                n, _iter_stress_array(n, seed, bound)
+            ),
+        )
+
+
 def verifier_03(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str]:
-    arr = cast(List[int], test.metadata.get("array", []))
-    has_solution = _find_divisible_subarray(arr)
+    if "has_solution" in test.metadata:
+        has_solution = bool(test.metadata["has_solution"])
+    else:
+        has_solution = _find_divisible_subarray(cast(List[int], test.metadata.get("array", []))) is not None
     tokens = stdout.strip().split()
     if not tokens:
         return False, "No output produced"
     answer = tokens[0].upper()
-    if has_solution:
-        return (answer == "YES", "" if answer == "YES" else "Should output YES")
-    return (answer == "NO", "" if answer == "NO" else "Should output NO")
+    if not has_solution:
+        return (answer == "NO", "" if answer == "NO" else "Should output NO")
+    if answer != "YES":
+        return False, "Should output YES"
+    # An optional witness "l r" follows YES; if given, it has to be complete and right.
+    if len(tokens) == 1:
+        return True, ""
+    if len(tokens) != 3:
+        return False, f"Malformed witness: {' '.join(tokens[1:])}"
+    if "array" in test.metadata:
+        values: Iterable[int] = cast(List[int], test.metadata["array"])
+        n = len(cast(List[int], test.metadata["array"]))
+    else:
+        n = cast(int, test.metadata["n"])
+        values = _iter_stress_array(n, cast(Optional[int], test.metadata["seed"]), cast(int, test.metadata["bound"]))
+    try:
+        left, right = int(tokens[1]), int(tokens[2])
+    except ValueError:
+        return False, f"Malformed witness: {tokens[1]} {tokens[2]}"
+    if not 1 <= left <= right <= n:
+        return False, f"Witness {left} {right} is out of range for N = {n}"
+    if not _check_03_witness(values, n, left, right):
+        return False, f"Witness {left} {right} does not sum to a multiple of N"
+    return True, ""
 
 
 def generate_04_cases() -> Iterable[TestCase]:
+    import random  # pylint: disable=import-outside-toplevel
+
     rng = random.Random(505)
     configs: List[int] = [2, 3, 4]
     for idx, n in enumerate(configs, start=1):
@@ -377,25 +2345,32 @@ def generate_04_cases() -> Iterable[TestCase]:
         )
 
 
-def verifier_04(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str]:
-    matrix_output = [line.strip() for line in stdout.strip().splitlines() if line.strip()]
-    a_matrix = cast(List[List[int]], test.metadata["A"])
-    b_matrix = cast(List[List[int]], test.metadata["B"])
-    n = len(a_matrix)
-    if len(matrix_output) != n:
-        return False, f"Expected {n} rows, got {len(matrix_output)}"
-    try:
-        matrix = [[int(x) for x in row.split()] for row in matrix_output]
-    except ValueError:
-        return False, "Output must contain integers"
-    if any(len(row) != n for row in matrix):
-        return False, "Row length mismatch"
-    expected = multiply_naive(a_matrix, b_matrix)
-    if matrix != expected:
-        return False, "Matrix product mismatch"
-    return True, ""
+def generate_04_stress_cases() -> Iterable[TestCase]:
+    import random  # pylint: disable=import-outside-toplevel
+
+    rng = random.Random(5050)
+    configs: List[int] = [32, 64, 128]
+    for idx, n in enumerate(configs, start=1):
+        a = generate_matrix(n, rng.randint(0, 10_000), bound=10_000)
+        b = generate_matrix(n, rng.randint(0, 10_000), bound=10_000)
+        yield TestCase(
+            name=f"04_stress_{idx}",
+            input_data="",
+            metadata={"A": a, "B": b},
+            stream=_matrix_input_stream(str(n), a, b),
+        )
+
+
+def stream_verifier_04(test: TestCase) -> StreamVerifier:
+    return MatrixStreamVerifier(
+        cast(List[List[int]], test.metadata["A"]),
+        cast(List[List[int]], test.metadata["B"]),
+        "rows",
+    )
 
 
+def verifier_04(test: TestCase, stdout: str, elapsed: float) -> tuple[bool, str]:
+    return stream_verifier_04(test).verify(stdout, elapsed)
 
 
 def generate_05_cases() -> Iterable[TestCase]:
@@ -404,6 +2379,10 @@ def generate_05_cases() -> Iterable[TestCase]:
         'melodies travel along diagonals',
         'hidden phrase leaps across measures',
     ]
+    variant = os.environ.get(VARIANT_ANSWERS_ENV)
+    if variant:
+        # answers.json written by 05/variants.py for a freshly generated puzzle set.
+        answers = list(json.loads(Path(variant).read_text())['answers'])
     for idx, answer in enumerate(answers, start=1):
         yield TestCase(
             name=f"05_puzzle_{idx}",
@@ -432,62 +2411,93 @@ def verifier_05(test: TestCase, stdout: str, _elapsed: float) -> tuple[bool, str
 
 
 
-PROBLEMS: Dict[str, ProblemSpec] = {
-    "00": ProblemSpec(
-        pid="00",
-        name="Two-Sum Warmup",
-        folder=Path("00"),
+PROBLEMS = ProblemRegistry()
+
+
+@PROBLEMS.register("00", "Two-Sum Warmup")
+def _problem_00(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_00_cases,
         verifier=verifier_00,
         timeout=3.0,
         weight=10.0,
-    ),
-    "01": ProblemSpec(
-        pid="01",
-        name="Sneaky Islanders",
-        folder=Path("01"),
+        stress_generator=generate_00_stress_cases,
+        stress_timeout=60.0,
+        stress_cache_params=two_sum_stress_params,
+    )
+
+
+@PROBLEMS.register("01", "Sneaky Islanders")
+def _problem_01(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_01_cases,
         verifier=verifier_01,
         timeout=5.0,
         weight=20.0,
-    ),
-    "02": ProblemSpec(
-        pid="02",
-        name="Tiled Matrix Multiplication",
-        folder=Path("02"),
+    )
+
+
+@PROBLEMS.register("02", "Tiled Matrix Multiplication")
+def _problem_02(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_02_cases,
         verifier=verifier_02,
         timeout=8.0,
         weight=25.0,
-    ),
-    "03": ProblemSpec(
-        pid="03",
-        name="Divisible Subarray",
-        folder=Path("03"),
+        stress_generator=generate_02_stress_cases,
+        stream_verifier=stream_verifier_02,
+    )
+
+
+@PROBLEMS.register("03", "Divisible Subarray")
+def _problem_03(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_03_cases,
         verifier=verifier_03,
         timeout=5.0,
         weight=20.0,
-    ),
-    "04": ProblemSpec(
-        pid="04",
-        name="The Dancing Grid",
-        folder=Path("04"),
+        stress_generator=generate_03_stress_cases,
+    )
+
+
+@PROBLEMS.register("04", "The Dancing Grid")
+def _problem_04(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_04_cases,
         verifier=verifier_04,
         timeout=20.0,
         weight=20.0,
-    ),
-    "05": ProblemSpec(
-        pid="05",
-        name="Ungarbling",
-        folder=Path("05"),
+        stress_generator=generate_04_stress_cases,
+        stream_verifier=stream_verifier_04,
+    )
+
+
+@PROBLEMS.register("05", "Ungarbling")
+def _problem_05(pid: str, name: str) -> ProblemSpec:
+    return ProblemSpec(
+        pid=pid,
+        name=name,
+        folder=Path(pid),
         generator=generate_05_cases,
         verifier=verifier_05,
         timeout=300.0,
         weight=5.0,
-    ),
-}
+    )
 
 
 def parse_args() -> argparse.Namespace:
@@ -501,6 +2511,78 @@ def parse_args() -> argparse.Namespace:
     parser.add_argument("--list", action="store_true", help="List available problems")
     parser.add_argument("--no-submit", action="store_true", help="Skip scoreboard submission")
     parser.add_argument("--verbose", action="store_true", help="Show per-test details")
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=1,
+        help="Run up to N test cases in parallel across all problems (0 = one per CPU)",
+    )
+    parser.add_argument(
+        "--per-problem",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Run at most N tests of the same problem at once (default: half of --jobs)",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=None,
+        metavar="SECONDS",
+        help="Kill all solvers and skip remaining tests once this much wall time has passed",
+    )
+    parser.add_argument(
+        "--profile",
+        nargs="?",
+        const="sample",
+        choices=PROFILE_MODES,
+        help="Profile Python solvers per test (default: sampling) and list the hottest functions",
+    )
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop judging a problem after its first failed test",
+    )
+    parser.add_argument(
+        "--max-failures",
+        type=int,
+        default=0,
+        metavar="K",
+        help="Skip a problem's remaining tests once K of them have failed (0 = never)",
+    )
+    parser.add_argument(
+        "--no-persistent",
+        action="store_true",
+        help="Spawn run.sh once per test even if it opts into persistent mode",
+    )
+    parser.add_argument(
+        "--tier",
+        choices=TIERS,
+        default="standard",
+        help="Test tier: the regular cases or large cases at the statement limits",
+    )
+    parser.add_argument(
+        "--verify-mode",
+        choices=VERIFY_MODES[1:],
+        help="Force exact or probabilistic (Freivalds) checking of matrix products",
+    )
+    parser.add_argument(
+        "--benchmark",
+        action="store_true",
+        help="Time each test repeatedly and compare against results/benchmark_baseline.json",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per test in --benchmark mode")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed warmup runs per test in --benchmark mode")
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Overwrite the benchmark baseline with this run",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Re-judge every problem instead of reusing cached results",
+    )
     return parser.parse_args()
 
 
@@ -511,18 +2593,80 @@ def main() -> int:
         list_problems(PROBLEMS)
         return 0
 
-    selected = set(args.problem) if args.problem else set(PROBLEMS.keys())
+    selected = sorted(set(args.problem)) if args.problem else list(PROBLEMS.keys())
+    jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+    if args.verify_mode:
+        set_verify_mode(args.verify_mode)
+    if args.profile:
+        # Profiles are written per spawned process, so every test needs a fresh, uncached run.
+        set_profile_mode(args.profile)
+        args.no_persistent = True
+        args.no_cache = True
+
+    specs: List[ProblemSpec] = []
+    for pid in selected:
+        tiered = PROBLEMS[pid].for_tier(args.tier)
+        if tiered is None:
+            print(f"Skipping {pid} – no {args.tier} tests")
+        else:
+            specs.append(tiered)
+
+    if args.benchmark:
+        return run_benchmark(
+            specs,
+            repeat=max(1, args.repeat),
+            warmup=max(0, args.warmup),
+            persistent=not args.no_persistent,
+            save_baseline=args.save_baseline,
+        )
 
     team_name = ensure_team_profile()
 
+    scoreboard_url = os.environ.get("SCOREBOARD_URL") or DEFAULT_SCOREBOARD_URL
+    submitter: Optional[ScoreboardSubmitter] = None
+    if not args.no_submit:
+        submitter = ScoreboardSubmitter(scoreboard_url, verbose=args.verbose)
+        submitter.start()
+
     summary: Dict[str, ProblemResult] = {}
     total_score = 0.0
     total_max = 0.0
 
-    for pid in selected:
-        spec = PROBLEMS[pid]
-        print(f"Running {pid} – {spec.name}")
-        result = judge_problem(spec, verbose=args.verbose)
+    cache = None if args.no_cache else ResultCache()
+    cache_keys: Dict[str, str] = {}
+    cached: Dict[str, ProblemResult] = {}
+    if cache is not None:
+        for spec in specs:
+            cache_keys[spec.pid] = problem_cache_key(spec, args.verbose)
+            hit = cache.get(spec.pid, cache_keys[spec.pid])
+            if hit is not None:
+                cached[spec.pid] = hit
+    history = load_history()
+    progress = ProgressReporter()
+    pending = schedule_problems(
+        [spec for spec in specs if spec.pid not in cached],
+        verbose=args.verbose,
+        jobs=jobs,
+        persistent=not args.no_persistent,
+        per_problem=args.per_problem,
+        deadline=args.deadline,
+        max_failures=1 if args.fail_fast else max(0, args.max_failures),
+        history=history,
+        on_outcome=progress.update,
+    )
+
+    for spec in specs:
+        pid = spec.pid
+        if pid in cached:
+            print(f"Running {pid} – {spec.name} (cached)")
+            result = cached[pid]
+        else:
+            print(f"Running {pid} – {spec.name}")
+            result = pending[pid]()
+            progress.finish()
+            update_history(history, pid, result.tests)
+            if cache is not None and not any(test["verdict"] == "SKIP" for test in result.tests):
+                cache.put(pid, cache_keys[pid], result)
         summary[pid] = result
         total_score += result.score
         total_max += spec.weight
@@ -534,9 +2678,19 @@ def main() -> int:
             for line in result.details:
                 print("    "+line)
         elif result.details and result.passed != result.total:
-            print("    " + result.details[0])
+            print("    " + next((line for line in result.details if "(SKIP)" not in line), result.details[0]))
+        if args.profile:
+            hot = hot_functions(pid, (str(test["name"]) for test in result.tests))
+            if hot:
+                print(f"  hot functions (profiles in {PROFILES_DIR / pid}):")
+                for label, share in hot:
+                    print(f"    {share:6.1%}  {label}")
+            else:
+                print("  no Python profile data (run.sh did not start Python)")
 
     print(f"Total score: {total_score:.1f}/{total_max:.1f}")
+    if len(cached) < len(specs):
+        save_history(history)
 
     results_payload = {
         "team": team_name,
@@ -555,15 +2709,18 @@ def main() -> int:
             for pid, res in summary.items()
         },
     }
-    LATEST_RESULTS_PATH.write_text(json.dumps(results_payload, indent=2))
-
-    scoreboard_url = os.environ.get("SCOREBOARD_URL")
-    if not scoreboard_url:
-        scoreboard_url = "https://vest-puzzles-scoreboard.vercel.app/api/submit"
-    if scoreboard_url and not args.no_submit:
-        submit_scoreboard(scoreboard_url, results_payload, verbose=args.verbose)
-    elif not scoreboard_url:
-        print("No SCOREBOARD_URL configured; skipping submission.")
+    latest_payload = dict(results_payload)
+    latest_payload["problems"] = {
+        pid: {**entry, "tests": summary[pid].tests}
+        for pid, entry in cast(Dict[str, Dict[str, object]], results_payload["problems"]).items()
+    }
+    RESULTS_DIR.mkdir(exist_ok=True)
+    LATEST_RESULTS_PATH.write_text(json.dumps(latest_payload, indent=2))
+
+    if submitter is not None:
+        submitter.submit(results_payload)
+        if not submitter.close():
+            print(f"Scoreboard submission still pending; it will be retried from {OUTBOX_DIR}.")
 
     return 0
 
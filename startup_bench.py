@@ -0,0 +1,129 @@
+"""Track evaluator startup with ``python -X importtime``.
+
+On ``--list`` and on cached single-problem runs, interpreter start and imports
+take nearly all of the evaluator's time. For each of those command paths this
+runs ``python -X importtime evaluate.py ARGS`` ``--repeat`` times and records
+the wall time, the summed self import time and the heaviest top-level imports
+of the last run. Results go to ``results/startup_latest.json``. They are
+compared with ``results/startup_baseline.json`` using the same significance
+test as ``evaluate.py --benchmark``.
+
+The problem path needs ``.profile`` (written by the first regular run). One
+untimed warmup run fills the result cache, so the timed runs measure the
+cached path.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import subprocess
+import sys
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, cast
+
+from evaluate import RESULTS_DIR, _format_stats, is_significant_slowdown, timing_stats
+
+HERE = Path(__file__).resolve().parent
+STARTUP_LATEST_PATH = RESULTS_DIR / "startup_latest.json"
+STARTUP_BASELINE_PATH = RESULTS_DIR / "startup_baseline.json"
+TOP_IMPORTS = 8
+METRICS = ("wall", "imports")
+
+
+def parse_importtime(stderr: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """Total self import time and the top-level imports by cumulative time, in seconds."""
+    total = 0.0
+    top_level: List[Tuple[str, float]] = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:") :].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the column header
+        self_us, cumulative_us, name = int(fields[0]), int(fields[1]), fields[2]
+        total += self_us / 1e6
+        # Nested imports are indented two spaces per level after the single separator space.
+        if not name[1:].startswith(" "):
+            top_level.append((name.strip(), cumulative_us / 1e6))
+    return total, sorted(top_level, key=lambda item: item[1], reverse=True)
+
+
+def measure(args: List[str], repeat: int, warmup: int) -> Dict[str, object]:
+    """Run ``evaluate.py args`` under ``-X importtime`` and collect the samples."""
+    command = [sys.executable, "-X", "importtime", str(HERE / "evaluate.py"), *args]
+    samples: Dict[str, List[float]] = {metric: [] for metric in METRICS}
+    heaviest: List[Tuple[str, float]] = []
+    for run in range(warmup + repeat):
+        start = time.perf_counter()
+        proc = subprocess.run(command, cwd=HERE, stdin=subprocess.DEVNULL, capture_output=True, text=True)
+        wall = time.perf_counter() - start
+        if proc.returncode not in (0, 1):
+            tail = proc.stderr.strip().splitlines()[-1:] or ["no output"]
+            raise RuntimeError(f"evaluate.py {' '.join(args)} exited with {proc.returncode}: {tail[0]}")
+        imports, heaviest = parse_importtime(proc.stderr)
+        if run >= warmup:
+            samples["wall"].append(wall)
+            samples["imports"].append(imports)
+    entry: Dict[str, object] = {"args": args}
+    for metric in METRICS:
+        entry[metric] = {"samples": samples[metric], **timing_stats(samples[metric])}
+    entry["top_imports"] = [{"module": name, "cumulative": seconds} for name, seconds in heaviest[:TOP_IMPORTS]]
+    return entry
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark evaluate.py startup with -X importtime")
+    parser.add_argument("--problem", default="05", help="Problem ID for the single-problem path")
+    parser.add_argument("--repeat", type=int, default=10, help="Timed runs per path")
+    parser.add_argument("--warmup", type=int, default=1, help="Untimed runs per path")
+    parser.add_argument("--save-baseline", action="store_true", help="Overwrite the startup baseline with this run")
+    args = parser.parse_args(argv)
+
+    paths = {
+        "list": ["--list"],
+        f"problem {args.problem}": ["--problem", args.problem, "--no-submit"],
+    }
+    results: Dict[str, object] = {}
+    for label, path_args in paths.items():
+        print(f"Timing evaluate.py {' '.join(path_args)} ({args.warmup} warmup, {args.repeat} timed runs)")
+        entry = measure(path_args, max(1, args.repeat), max(0, args.warmup))
+        results[label] = entry
+        for metric in METRICS:
+            print(f"    {metric:<8} {_format_stats(cast(Dict[str, object], entry[metric]))}")
+        heaviest = cast(List[Dict[str, object]], entry["top_imports"])
+        print("    heaviest: " + ", ".join(f"{item['module']} {cast(float, item['cumulative']) * 1000:.1f}ms" for item in heaviest))
+
+    RESULTS_DIR.mkdir(exist_ok=True)
+    payload = {"timestamp": time.time(), "python": sys.version.split()[0], "paths": results}
+    STARTUP_LATEST_PATH.write_text(json.dumps(payload, indent=2))
+
+    baseline: Optional[Dict[str, object]] = None
+    if STARTUP_BASELINE_PATH.exists():
+        baseline = json.loads(STARTUP_BASELINE_PATH.read_text())
+    regressions: List[str] = []
+    if baseline is not None:
+        for label, entry in results.items():
+            before = cast(Dict[str, Dict[str, object]], baseline["paths"]).get(label)
+            if before is None:
+                continue
+            for metric in METRICS:
+                old = cast(List[float], cast(Dict[str, object], before[metric])["samples"])
+                new = cast(List[float], cast(Dict[str, Dict[str, object]], entry)[metric]["samples"])
+                if is_significant_slowdown(old, new):
+                    regressions.append(f"{label} ({metric})")
+        if regressions:
+            print("Significant startup slowdowns against baseline:")
+            for name in regressions:
+                print(f"  {name}")
+        else:
+            print("No significant startup slowdowns against baseline.")
+    if baseline is None or args.save_baseline:
+        STARTUP_BASELINE_PATH.write_text(json.dumps(payload, indent=2))
+        print(f"Saved startup baseline to {STARTUP_BASELINE_PATH}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
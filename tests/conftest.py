@@ -0,0 +1,40 @@
+"""Shared helpers for the test suite.
+
+Every puzzle folder has its own ``main.py`` and imports its siblings by bare
+name, so puzzle modules are loaded from their files under a unique name with
+their folder on ``sys.path``.
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+
+def load_puzzle_module(folder: str, name: str) -> ModuleType:
+    """Import ``<folder>/<name>.py`` as ``puzzle<folder>_<name>``."""
+    directory = ROOT / folder
+    if str(directory) not in sys.path:
+        sys.path.insert(0, str(directory))
+    module_name = f"puzzle{folder}_{name}"
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+    spec = importlib.util.spec_from_file_location(module_name, directory / f"{name}.py")
+    assert spec is not None and spec.loader is not None
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def numpy():
+    return pytest.importorskip("numpy")
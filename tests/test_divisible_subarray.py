@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+
+import evaluate
+from conftest import load_puzzle_module
+
+divisible = load_puzzle_module("03", "main")
+divisible._load_numpy()
+
+
+def _arrays(seed=3):
+    rng = random.Random(seed)
+    yield from ([1], [5, 5], [0, 0, 0], [7, 1, 1, 1], [2] * 9)
+    for _ in range(500):
+        n = rng.randint(1, 30)
+        bound = rng.choice((1, 3, 10**9))
+        yield [rng.randint(-bound, bound) for _ in range(n)]
+
+
+def test_vectorized_witness_matches_the_loop(numpy):
+    for values in _arrays():
+        n = len(values)
+        expected = divisible.find_witness(values, n)
+        assert divisible.find_witness_vectorized(numpy.array(values, dtype=numpy.int64), n) == expected, values
+
+
+def test_witnesses_pass_the_verifier(numpy):
+    for test in evaluate.generate_03_cases():
+        values = test.metadata["array"]
+        for l, r in (
+            divisible.find_witness(values, len(values)),
+            divisible.find_witness_vectorized(numpy.array(values, dtype=numpy.int64), len(values)),
+        ):
+            ok, message = evaluate.verifier_03(test, f"YES\n{l} {r}\n", 0.0)
+            assert ok, (test.name, message)
+
+
+def test_witness_must_be_complete():
+    test = next(test for test in evaluate.generate_03_cases() if test.metadata.get("has_solution", True))
+    values = test.metadata["array"]
+    l, r = divisible.find_witness(values, len(values))
+    assert evaluate.verifier_03(test, "YES\n", 0.0) == (True, "")
+    assert evaluate.verifier_03(test, f"YES {l} {r}\n", 0.0) == (True, "")
+    for stdout in (f"YES {l}\n", f"YES {l} {r} {r}\n"):
+        ok, message = evaluate.verifier_03(test, stdout, 0.0)
+        assert not ok and message.startswith("Malformed witness"), stdout
@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from conftest import load_puzzle_module
+
+grid_api = load_puzzle_module("04", "grid_api")
+
+
+def _feed(n, rng, bound=50):
+    return [[rng.randint(-bound, bound) if rng.random() < 0.7 else None for _ in range(n)] for _ in range(n)]
+
+
+def _cases(seed=4):
+    rng = random.Random(seed)
+    for n in (1, 2, 3, 5, 8):
+        for _ in range(4):
+            yield _feed(n, rng), _feed(n, rng)
+
+
+@pytest.mark.parametrize("engine", ["run_dancing_grid_rings", "run_dancing_grid_vectorized"])
+def test_engines_match_the_reference_loop(engine):
+    for left, top in _cases():
+        assert getattr(grid_api, engine)(left, top) == grid_api.run_dancing_grid(left, top)
+
+
+def test_stream_matches_the_reference_loop():
+    for left, top in _cases(5):
+        n = len(left)
+        left_ticks = ([row[tick] for row in left] for tick in range(n))
+        top_ticks = ([col[tick] for col in top] for tick in range(n))
+        assert grid_api.run_dancing_grid_stream(n, left_ticks, top_ticks) == grid_api.run_dancing_grid(left, top)
+
+
+def test_batch_and_planes_match_the_reference_loop(numpy):
+    pairs = [pair for pair in _cases(6) if len(pair[0]) == 5]
+    expected = [grid_api.run_dancing_grid(left, top) for left, top in pairs]
+    assert grid_api.run_dancing_grid_batch(pairs) == expected
+    planes = [numpy.array([[[value or 0 for value in row] for row in feed] for feed in side]) for side in zip(*pairs)]
+    assert grid_api.run_dancing_grid_planes(*planes).tolist() == expected
+
+
+def test_vectorized_engine_keeps_exact_integers_past_int64():
+    left, top = [[2**40, None], [None, 3]], [[2**40, 1], [None, None]]
+    assert grid_api.run_dancing_grid_vectorized(left, top) == grid_api.run_dancing_grid(left, top)
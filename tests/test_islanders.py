@@ -0,0 +1,55 @@
+from __future__ import annotations
+
+import io
+import random
+
+from conftest import load_puzzle_module
+
+islanders = load_puzzle_module("01", "main")
+
+
+def _brute_force(statements):
+    """Smallest T whose claimants number exactly T, by the definition."""
+    for t in range(len(statements) + 1):
+        truth = [i for i, value in enumerate(statements) if value == t]
+        if len(truth) == t:
+            return truth
+    return []
+
+
+def _vectors(count, seed=1):
+    rng = random.Random(seed)
+    vectors = [[-1, 0], [-1], [-1, -1, 5], [0] * 10, [10] * 10, [1] + [5] * 9]
+    for _ in range(count):
+        n = rng.randint(1, 12)
+        vectors.append([rng.randint(-2, n + 2) for _ in range(n)])
+    return vectors
+
+
+def test_solve_matches_definition():
+    for statements in _vectors(2000):
+        assert islanders.solve(statements) == _brute_force(statements), statements
+
+
+def test_batch_matches_list_path_including_no_consistent_count(numpy):
+    vectors = [vector for vector in _vectors(2000) if len(vector) == 3]
+    vectors.append([-1, -1, -1])
+    chosen, mask = islanders.solve_batch(numpy.array(vectors, dtype=numpy.int64))
+    for statements, count, row in zip(vectors, chosen.tolist(), mask.tolist()):
+        truthful = islanders.solve(statements)
+        assert [index for index, flag in enumerate(row) if flag] == truthful, statements
+        if not truthful:
+            assert count == -1 or count == 0
+
+
+def test_streamed_answers_agree_between_numpy_and_list_paths(numpy, monkeypatch):
+    vectors = _vectors(3000)
+    text = "".join(" ".join(map(str, vector)) + "\n" for vector in vectors).encode()
+    expected = "".join(
+        islanders._format(len(truthful), truthful) for truthful in map(islanders.solve, vectors)
+    )
+    monkeypatch.setattr(islanders, "NUMPY_MIN_LINES", 1)
+    assert "".join(islanders.answer_lines(io.BytesIO(text))) == expected
+    monkeypatch.setattr(islanders, "NUMPY_MIN_LINES", 10**9)
+    assert "".join(islanders.answer_lines(io.BytesIO(text))) == expected
+    assert "".join(islanders.answer_lines(io.BytesIO(b"-1 0\n"))) == "0\n\n"
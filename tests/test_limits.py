@@ -0,0 +1,27 @@
+from __future__ import annotations
+
+import stat
+
+import pytest
+
+import evaluate
+
+
+def _script(folder, body):
+    run = folder / "run.sh"
+    run.write_text("#!/bin/bash\n" + body)
+    run.chmod(run.stat().st_mode | stat.S_IXUSR)
+
+
+def test_limits_reach_run_sh(tmp_path):
+    _script(tmp_path, "ulimit -n; ulimit -St; ulimit -Ht; ulimit -v; ulimit -f\n")
+    limits = evaluate.ResourceLimits(address_space_mb=512, cpu_seconds=2.5, open_files=32, output_bytes=1 << 20)
+    stdout, _, _ = evaluate.run_script(tmp_path, 10.0, "", limits=limits)
+    assert stdout.split() == ["32", "3", "4", str(512 * 1024), "1024"]
+
+
+def test_output_limit_is_reported(tmp_path):
+    _script(tmp_path, "head -c 100000 /dev/zero\n")
+    limits = evaluate.ResourceLimits(output_bytes=10_000)
+    with pytest.raises(evaluate.OutputLimitExceeded):
+        evaluate.run_script(tmp_path, 10.0, "", limits=limits)
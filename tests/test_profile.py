@@ -0,0 +1,52 @@
+from __future__ import annotations
+
+import stat
+
+import pytest
+
+import evaluate
+
+RUN_SH = """#!/bin/bash
+python3 -c "pass"
+python3 solve.py
+"""
+
+SOLVE_PY = """
+import builtins
+
+def busy():
+    return sum(i * i for i in range(200000))
+
+busy()
+print(getattr(builtins, "USER_SITE", "missing"))
+"""
+
+
+@pytest.fixture
+def profiled(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate, "PROFILES_DIR", tmp_path / "profiles")
+    evaluate.set_profile_mode("cprofile")
+    yield
+    evaluate.set_profile_mode(None)
+
+
+def test_only_the_solver_script_is_profiled_and_site_hooks_chain(tmp_path, monkeypatch, profiled):
+    folder = tmp_path / "99"
+    folder.mkdir()
+    (folder / "run.sh").write_text(RUN_SH)
+    (folder / "run.sh").chmod(0o755 | stat.S_IXUSR)
+    (folder / "solve.py").write_text(SOLVE_PY)
+    user_site = tmp_path / "user_site"
+    user_site.mkdir()
+    (user_site / "sitecustomize.py").write_text('import builtins\nbuiltins.USER_SITE = "chained"\n')
+    monkeypatch.setenv("PYTHONPATH", str(user_site))
+
+    spec = evaluate.ProblemSpec(
+        pid="99", name="Busy", folder=folder, generator=list, verifier=None, timeout=10.0, weight=1.0
+    )
+    test = evaluate.TestCase(name="busy_1", input_data="")
+    stdout, _, _ = evaluate.run_script(folder, 10.0, "", extra_env=evaluate._profile_env(spec, test))
+    assert stdout.strip() == "chained"
+    dumps = list((tmp_path / "profiles" / "99").glob("busy_1.*"))
+    assert len(dumps) == 1
+    assert any("solve.py" in label for label, _ in evaluate.hot_functions("99", ["busy_1"]))
@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+import random
+
+from conftest import load_puzzle_module
+
+quadrant = load_puzzle_module("02", "quadrant")
+
+
+def _naive(a, b):
+    n = len(a)
+    return [[sum(a[i][k] * b[k][j] for k in range(n)) for j in range(n)] for i in range(n)]
+
+
+def _matrix(n, bound, rng):
+    return [[rng.randint(-bound, bound) for _ in range(n)] for _ in range(n)]
+
+
+def test_multiply_matches_naive_product():
+    rng = random.Random(2)
+    for d in range(5):
+        a, b = _matrix(2**d, 10**4, rng), _matrix(2**d, 10**4, rng)
+        assert quadrant.multiply(a, b, cutoff=2) == _naive(a, b)
+
+
+def test_products_beyond_int64_fall_back_to_python_integers():
+    rng = random.Random(3)
+    a, b = _matrix(4, 2**40, rng), _matrix(4, 2**40, rng)
+    a[0][0] = b[0][0] = 2**62
+    assert not quadrant.fits_int64(a, b)
+    assert quadrant.multiply(a, b, cutoff=1) == _naive(a, b)
+    assert quadrant.multiply([[2**70]], [[3]]) == [[3 * 2**70]]
+
+
+def test_int64_bound_is_checked_against_the_dimension():
+    assert quadrant.fits_int64([[2**31, 0], [0, 0]], [[2**30, 0], [0, 0]])
+    assert not quadrant.fits_int64([[2**32, 0], [0, 0]], [[2**31, 0], [0, 0]])
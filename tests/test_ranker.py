@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import pytest
+
+import evaluate
+from conftest import ROOT, load_puzzle_module
+
+ranker = load_puzzle_module("05", "ranker")
+ungarble = load_puzzle_module("05", "ungarble")
+
+ANSWERS = [test.metadata["answer"] for test in evaluate.generate_05_cases()]
+
+
+@pytest.fixture(scope="module")
+def model():
+    return ranker.default_model()
+
+
+def test_puzzle1_answer_ranks_first(model):
+    candidates = ungarble.decode_offsets(ungarble.load_garble(ROOT / "05" / "puzzle1.py"))
+    results, stats = ranker.top_sentences(candidates, model, 5)
+    assert results[0][0] == ANSWERS[0]
+    assert stats.emitted == 5
+    # States stand in for full contexts without changing any score.
+    for text, score in results:
+        assert score == pytest.approx(model.score(text))
+    assert [score for _, score in results] == sorted((score for _, score in results), reverse=True)
+
+
+def test_states_back_off_like_their_contexts(model):
+    for context in ("the", "zqx", "   ", "g k", "xe "):
+        state = model.state(context)
+        assert context.endswith(state)
+        for ch in "aet q":
+            assert model.logprob(state, ch) == pytest.approx(model.logprob(context, ch))
+
+
+def test_trained_model_is_reused_from_disk(tmp_path, monkeypatch):
+    monkeypatch.setattr(ranker, "MODEL_CACHE_DIR", tmp_path)
+    words = tmp_path / "words.txt"
+    words.write_text("time keeps the grid dancing\n")
+    trained = ranker.default_model.__wrapped__(3, words)
+    (cached,) = tmp_path.glob("ranker-model-*.pickle")
+    monkeypatch.setattr(ranker.CharNGramModel, "train", None)
+    loaded = ranker.default_model.__wrapped__(3, words)
+    assert (loaded.counts, loaded.totals, loaded.vocabulary) == (trained.counts, trained.totals, trained.vocabulary)
+    assert loaded.score("the grid") == trained.score("the grid")
+
+
+def test_puzzle2_answer_ranks_first(model):
+    candidates = ungarble.decode_streams(ungarble.load_garble(ROOT / "05" / "puzzle2.py"))
+    results, _ = ranker.top_sentences(candidates, model, 1)
+    assert results[0][0] == ANSWERS[1]
+
+
+def test_fallback_vocabulary_leaves_out_the_answers():
+    content = {word for answer in ANSWERS for word in answer.split() if len(word) > 3}
+    stems = {word[:4] for word in content}
+    assert not [word for word in ranker.FALLBACK_WORDS if word[:4] in stems and len(word) > 3]
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import stat
+
+import pytest
+
+import evaluate
+
+ECHO_SCRIPT = """#!/bin/bash
+read -r value
+sleep "0.0$(( (value * 7) % 5 ))"
+echo "$value"
+"""
+
+
+def _echo_spec(folder, count=12):
+    run = folder / "run.sh"
+    run.write_text(ECHO_SCRIPT)
+    run.chmod(run.stat().st_mode | stat.S_IXUSR)
+
+    def generator():
+        for index in range(count):
+            yield evaluate.TestCase(name=f"echo_{index}", input_data=f"{index}\n", metadata={"value": index})
+
+    def verifier(test, stdout, _elapsed):
+        ok = stdout.strip() == str(test.metadata["value"]) and test.metadata["value"] % 5 != 3
+        return ok, "" if ok else "mismatch"
+
+    return evaluate.ProblemSpec(
+        pid="99", name="Echo", folder=folder, generator=generator, verifier=verifier, timeout=10.0, weight=1.0
+    )
+
+
+def test_parallel_results_match_the_serial_run(tmp_path):
+    spec = _echo_spec(tmp_path)
+    serial = evaluate.judge_problem(spec, verbose=False, persistent=False)
+    parallel = evaluate.schedule_problems([spec], verbose=False, jobs=4, persistent=False)["99"]()
+    assert [test["name"] for test in parallel.tests] == [f"echo_{index}" for index in range(12)]
+    assert [test["ok"] for test in parallel.tests] == [test["ok"] for test in serial.tests]
+    assert (parallel.passed, parallel.total, parallel.details) == (serial.passed, serial.total, serial.details)
+    assert parallel.passed == 10
+
+
+def test_timeouts_are_enforced_per_test(tmp_path):
+    spec = _echo_spec(tmp_path, count=2)
+    (tmp_path / "run.sh").write_text("#!/bin/bash\nsleep 5\n")
+    spec = evaluate.replace(spec, timeout=0.3)
+    result = evaluate.schedule_problems([spec], verbose=False, jobs=2, persistent=False)["99"]()
+    assert [test["verdict"] for test in result.tests] == ["TLE", "TLE"]
+
+
+def test_busy_time_counts_overlaps_once():
+    assert evaluate._busy_time([]) == 0.0
+    assert evaluate._busy_time([(4.0, 5.0), (0.0, 2.0), (1.0, 3.0), (3.0, 3.0)]) == 4.0
+
+
+def test_elapsed_excludes_other_problems_on_a_shared_slot(tmp_path):
+    (tmp_path / "fast").mkdir()
+    (tmp_path / "slow").mkdir()
+    fast = _echo_spec(tmp_path / "fast", count=3)
+    slow = evaluate.replace(_echo_spec(tmp_path / "slow", count=2), pid="98")
+    (tmp_path / "slow" / "run.sh").write_text("#!/bin/bash\nsleep 0.6\ncat\n")
+    getters = evaluate.schedule_problems([fast, slow], verbose=False, jobs=1, persistent=False)
+    fast_result, slow_result = getters["99"](), getters["98"]()
+    assert slow_result.elapsed >= 1.2
+    assert fast_result.elapsed < 0.6
+
+
+def test_stream_verifier_without_finish_fails_when_built():
+    class Incomplete(evaluate.StreamVerifier):
+        def feed(self, chunk):
+            return True
+
+    with pytest.raises(TypeError):
+        Incomplete()
@@ -0,0 +1,121 @@
+from __future__ import annotations
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import evaluate
+
+
+class StubScoreboard:
+    """A local scoreboard that records every POST body and answers via ``respond``."""
+
+    def __init__(self, respond):
+        self.bodies = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):  # noqa: N802
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                stub.bodies.append(body)
+                status, reply = respond(body)
+                data = json.dumps(reply).encode()
+                self.send_response(status)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/submit"
+        self.thread = threading.Thread(target=self.server.serve_forever, daemon=True)
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _submit_all(url, outbox, payloads):
+    submitter = evaluate.ScoreboardSubmitter(url, outbox=outbox)
+    for payload in payloads:
+        submitter.submit(payload)
+    submitter.start()
+    assert submitter.close()
+    return submitter
+
+
+def test_round_trip_delivers_and_clears_the_outbox(tmp_path):
+    with StubScoreboard(lambda body: (200, {"ok": True})) as stub:
+        _submit_all(stub.url, tmp_path, [{"team": "t", "score": 1.5}])
+    assert stub.bodies == [{"team": "t", "score": 1.5}]
+    assert not list(tmp_path.iterdir())
+
+
+def test_unacknowledged_batch_falls_back_to_single_posts(tmp_path):
+    payloads = [{"run": index} for index in range(3)]
+    with StubScoreboard(lambda body: (200, {"ok": True})) as stub:
+        submitter = _submit_all(stub.url, tmp_path, payloads)
+    assert stub.bodies[0] == {"batch": payloads}
+    assert stub.bodies[1:] == payloads
+    assert submitter._batching is False
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_acknowledged_batch_is_one_post(tmp_path):
+    payloads = [{"run": index} for index in range(3)]
+    respond = lambda body: (200, {"batch": [{"ok": True}] * len(body.get("batch", [body]))})  # noqa: E731
+    with StubScoreboard(respond) as stub:
+        _submit_all(stub.url, tmp_path, payloads)
+    assert stub.bodies == [{"batch": payloads}]
+    assert not list(tmp_path.glob("*.json"))
+
+
+def test_rejected_payload_does_not_drop_the_others(tmp_path):
+    def respond(body):
+        if "batch" in body:
+            return 400, {"error": "batches are not supported"}
+        return (422, {"error": "bad run"}) if body["run"] == 0 else (200, {"ok": True})
+
+    payloads = [{"run": index} for index in range(3)]
+    with StubScoreboard(respond) as stub:
+        _submit_all(stub.url, tmp_path, payloads)
+    assert stub.bodies[1:] == payloads
+    assert not list(tmp_path.glob("*.json"))
+    (rejected,) = tmp_path.glob("*.rejected")
+    assert json.loads(rejected.read_text())["payload"] == {"run": 0}
+
+
+def test_unreachable_scoreboard_keeps_every_payload(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate.time, "sleep", lambda seconds: None)
+    with StubScoreboard(lambda body: (503, {"error": "busy"})) as stub:
+        _submit_all(stub.url, tmp_path, [{"run": 0}, {"run": 1}])
+    kept = sorted(json.loads(path.read_text())["payload"]["run"] for path in tmp_path.glob("*.json"))
+    assert kept == [0, 1]
+    assert len(stub.bodies) == evaluate.SUBMIT_ATTEMPTS
+
+
+def test_unreadable_entry_is_set_aside(tmp_path):
+    (tmp_path / "1.json").write_text('{"payload": {"run"')
+    with StubScoreboard(lambda body: (200, {"ok": True})) as stub:
+        _submit_all(stub.url, tmp_path, [{"run": 2}])
+    assert stub.bodies == [{"run": 2}]
+    assert [path.name for path in tmp_path.iterdir()] == ["1.corrupt"]
+
+
+def test_offline_scoreboard_does_not_hold_up_close(tmp_path):
+    with StubScoreboard(lambda body: (503, {"error": "busy"})) as stub:
+        submitter = evaluate.ScoreboardSubmitter(stub.url, outbox=tmp_path)
+        submitter.submit({"run": 0})
+        submitter.start()
+        start = evaluate.time.monotonic()
+        assert submitter.close(timeout=0.2)
+        assert evaluate.time.monotonic() - start < 1.0
+    (kept,) = tmp_path.glob("*.json")
+    assert json.loads(kept.read_text())["attempts"] == 1
+    assert not list(tmp_path.glob("*.tmp"))
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+
+import pytest
+
+from conftest import load_puzzle_module
+
+grid_api = load_puzzle_module("04", "grid_api")
+tiling = load_puzzle_module("04", "tiling")
+dancing = load_puzzle_module("04", "main")
+
+
+def _naive(a, b):
+    return [[sum(a[i][k] * b[k][j] for k in range(len(b))) for j in range(len(b[0]))] for i in range(len(a))]
+
+
+def _matrix(rows, cols, rng, bound=20):
+    return [[rng.randint(-bound, bound) for _ in range(cols)] for _ in range(rows)]
+
+
+@pytest.mark.parametrize("grid", [1, 2, 3, 5])
+@pytest.mark.parametrize("shape", [(1, 1, 1), (3, 4, 2), (5, 5, 5), (7, 2, 6)])
+def test_tiled_multiply_matches_naive_product(grid, shape):
+    rng = random.Random(sum(shape) * 10 + grid)
+    m, k_dim, p = shape
+    a, b = _matrix(m, k_dim, rng), _matrix(k_dim, p, rng)
+    result = tiling.tiled_multiply(a, b, grid)
+    assert result.product == _naive(a, b)
+    assert result.passes == tiling.feed_plan(m, k_dim, p, grid).passes
+
+
+def test_tiled_multiply_on_the_reference_grid():
+    rng = random.Random(7)
+    a, b = _matrix(4, 3, rng), _matrix(3, 5, rng)
+    engine = lambda feeds: [grid_api.run_dancing_grid(left, top) for left, top in feeds]  # noqa: E731
+    assert tiling.tiled_multiply(a, b, 3, engine=engine).product == _naive(a, b)
+
+
+def test_multiply_batch_matches_naive_products():
+    rng = random.Random(8)
+    pairs = [(_matrix(4, 4, rng), _matrix(4, 4, rng)) for _ in range(5)]
+    pairs.append(([[2**62, 0], [0, 0]], [[4, 0], [0, 0]]))
+    for grid in (2, 4):
+        same_shape = [pair for pair in pairs if len(pair[0]) == 4]
+        assert tiling.multiply_batch(same_shape, grid) == [_naive(a, b) for a, b in same_shape]
+    assert tiling.multiply_batch([pairs[-1]], 2) == [[[2**64, 0], [0, 0]]]
+
+
+def test_depth_tiles_sum_past_int64():
+    # Every pass fits int64, but the eight depth tiles of the single output do not.
+    a, b = [[3 * 10**9] * 8], [[3 * 10**9]] * 8
+    assert not tiling.fits_int64(a, b)
+    assert tiling.tiled_multiply(a, b, grid=2).product == [[72 * 10**18]]
+    assert tiling.multiply_batch([(a, b), ([[1] * 8], [[1]] * 8)], 2) == [[[72 * 10**18]], [[8]]]
+
+
+def test_solver_answers_back_to_back_inputs():
+    rng = random.Random(9)
+    pairs = [(_matrix(n, n, rng), _matrix(n, n, rng)) for n in (3, 1, 3, 2)]
+    text = "".join(
+        f"{len(a)}\n" + "".join(" ".join(map(str, row)) + "\n" for row in a + b) for a, b in pairs
+    )
+    expected = "".join(" ".join(map(str, row)) + "\n" for a, b in pairs for row in _naive(a, b))
+    assert dancing.solve(text) == expected
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import pytest
+
+import evaluate
+from conftest import load_puzzle_module
+
+two_sum = load_puzzle_module("00", "main")
+
+
+@pytest.mark.parametrize("method", sorted(two_sum.ENGINES))
+def test_engines_pass_the_verifier(method):
+    for test in evaluate.generate_00_cases():
+        i, j = two_sum.ENGINES[method](test.metadata["array"], test.metadata["target"])
+        assert evaluate.verifier_00(test, f"{i} {j}\n", 0.0) == (True, ""), test.name
+
+
+def test_sidecar_instance_round_trip(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate, "INSTANCES_DIR", tmp_path)
+    path, target, pair = evaluate.write_two_sum_sidecar(5000, 11, bound=10**9)
+    test = evaluate.TestCase(
+        name="00_sidecar", input_data="", metadata={"n": 5000, "target": target, "pair": pair}, sidecar=path
+    )
+    values, read_target = two_sum.read_sidecar(str(path))
+    assert read_target == target
+    for engine in two_sum.ENGINES.values():
+        i, j = engine(values, target)
+        assert (i, j) == pair
+        assert evaluate.verifier_00(test, f"{i} {j}\n", 0.0) == (True, "")
+    other = next(index for index in range(5000) if index not in pair)
+    assert evaluate.verifier_00(test, f"{pair[0]} {other}\n", 0.0)[0] is False
+
+
+def test_stress_cache_key_writes_no_sidecars(tmp_path, monkeypatch):
+    monkeypatch.setattr(evaluate, "INSTANCES_DIR", tmp_path / "instances")
+    spec = evaluate.PROBLEMS["00"].for_tier("stress")
+    key = evaluate.problem_cache_key(spec, verbose=False)
+    assert not (tmp_path / "instances").exists()
+    assert evaluate.problem_cache_key(spec, verbose=False) == key
+    monkeypatch.setattr(evaluate, "SIDECAR_FORMAT", evaluate.SIDECAR_FORMAT + 1)
+    assert evaluate.problem_cache_key(spec, verbose=False) != key
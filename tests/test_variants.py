@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import json
+
+import evaluate
+from conftest import load_puzzle_module
+
+variants = load_puzzle_module("05", "variants")
+
+
+def test_count_decodings_counts_every_known_word_sentence():
+    vocabulary = variants.Vocabulary(["a", "an", "ant", "at", "tan", "i"])
+    assert variants.count_decodings(["a", "n", "t"], vocabulary) == 1
+    assert variants.count_decodings(["at", "an", "nt"], vocabulary) == 2  # "ant" and "tan"
+    assert variants.count_decodings(["ai", " ", "ai"], vocabulary, limit=10) == 4
+    assert variants.count_decodings(["ai", " ", "ai"], vocabulary) == variants.COUNT_LIMIT
+    assert variants.count_decodings(["a", " ", " ", "i"], vocabulary) == 0
+    assert variants.count_decodings(["a", "n", "t", " "], vocabulary) == 0
+    assert variants.count_decodings(["x", "y"], vocabulary) == 0
+
+
+def test_extension_adds_words_without_copying_the_parent():
+    parent = variants.Vocabulary(["grid"])
+    child = variants.Vocabulary(["keeps"], parent)
+    assert child.is_word("grid") and child.is_word("keeps") and child.is_prefix("kee")
+    assert not parent.is_word("keeps")
+
+
+def test_shipped_answers_decode_uniquely():
+    answers = [test.metadata["answer"] for test in evaluate.generate_05_cases()]
+    for index, verdict in enumerate(variants.check_chunk(answers)):
+        assert verdict.decodings[index] == 1, verdict
+
+
+def test_generated_variants_round_trip(tmp_path):
+    assert variants.main(["--synthetic", "400", "--out", str(tmp_path), "--count", "2"]) == 0
+    for folder in sorted(tmp_path.iterdir()):
+        metadata = json.loads((folder / "answers.json").read_text())
+        assert metadata["decodings"] == [1, 1, 1]
+        assert len(set(metadata["answers"])) == 3
+        for name, answer in zip(variants.PUZZLES, metadata["answers"]):
+            namespace: dict = {}
+            exec((folder / f"{name}.py").read_text(), namespace)  # noqa: S102
+            assert namespace["GARBLE"] == namespace["garble"](answer)